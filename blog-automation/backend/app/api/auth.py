@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.database import get_db
-from app.core.security import verify_password, create_access_token, decode_token
+from app.core.security import verify_password_async, create_access_token, decode_token
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, TokenResponse
 
@@ -64,11 +64,11 @@ async def register(
         )
     
     # Create new user
-    from app.core.security import get_password_hash
+    from app.core.security import get_password_hash_async
     user = User(
         email=user_data.email,
         full_name=user_data.full_name,
-        password_hash=get_password_hash(user_data.password)
+        password_hash=await get_password_hash_async(user_data.password)
     )
     db.add(user)
     await db.commit()
@@ -92,7 +92,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == form_data.username))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
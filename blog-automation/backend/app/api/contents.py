@@ -10,9 +10,10 @@ from app.models.user import User
 from app.models.content import Content, ContentStatus
 from app.schemas.content import (
     ContentCreate, ContentUpdate, ContentResponse, 
-    ContentWithPublications, ContentGenerate
+    ContentWithPublications, ContentGenerate, SEOScoreRequest, SEOScoreResponse
 )
 from app.services.content_generator import ContentGeneratorService
+from app.services.incremental_seo import score_content_update
 from app.tasks.content_tasks import generate_content_task
 
 router = APIRouter()
@@ -146,12 +147,46 @@ async def update_content(
     for field, value in update_data.items():
         setattr(content, field, value)
     
+    # 본문이나 키워드가 바뀌면 바뀐 단락만 다시 분석해서 점수 갱신
+    if "content" in update_data or "keywords" in update_data:
+        analysis = score_content_update(
+            str(content.id), content.content or "", content.keywords or []
+        )
+        content.seo_score = analysis["seo_score"]
+        content.readability_score = analysis["readability_score"]
+    
     await db.commit()
     await db.refresh(content)
     
     return content
 
 
+@router.post("/{content_id}/seo-score", response_model=SEOScoreResponse)
+async def score_content_draft(
+    content_id: UUID,
+    score_request: SEOScoreRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """편집 중인 본문을 저장하지 않고 증분 채점합니다 (키 입력마다 호출 가능)."""
+    result = await db.execute(
+        select(Content).where(
+            and_(Content.id == content_id, Content.user_id == current_user.id)
+        )
+    )
+    content = result.scalar_one_or_none()
+    
+    if not content:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content not found"
+        )
+    
+    keywords = score_request.keywords if score_request.keywords is not None else (content.keywords or [])
+    
+    return score_content_update(str(content.id), score_request.content, keywords)
+
+
 @router.delete("/{content_id}")
 async def delete_content(
     content_id: UUID,
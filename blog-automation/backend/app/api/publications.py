@@ -12,7 +12,7 @@ from app.models.publication import Publication
 from app.models.content import Content
 from app.models.blog_account import BlogAccount
 from app.schemas.publication import PublicationResponse, PublishRequest
-from app.tasks.publishing_tasks import publish_content_task
+from app.tasks.publishing_tasks import publish_content_task, publish_fanout_task
 
 router = APIRouter()
 
@@ -66,11 +66,15 @@ async def publish_content(
     
     await db.commit()
     
-    # Trigger async publishing tasks
+    for publication in publications:
+        await db.refresh(publication)
+    
+    # Publish to all accounts concurrently in a single fan-out job
     if publish_request.publish_immediately:
-        for publication in publications:
-            await db.refresh(publication)
-            publish_content_task.delay(str(publication.id))
+        publish_fanout_task.delay(
+            str(publish_request.content_id),
+            [str(account_id) for account_id in publish_request.blog_account_ids]
+        )
     
     return publications
 
@@ -27,8 +27,8 @@ async def update_current_user(
         current_user.full_name = user_update.full_name
     
     if user_update.password is not None:
-        from app.core.security import get_password_hash
-        current_user.password_hash = get_password_hash(user_update.password)
+        from app.core.security import get_password_hash_async
+        current_user.password_hash = await get_password_hash_async(user_update.password)
     
     if user_update.subscription_plan is not None:
         current_user.subscription_plan = user_update.subscription_plan
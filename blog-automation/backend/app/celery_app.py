@@ -1,14 +1,16 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown
 
 from app.core.config import settings
+from app.core.worker_loop import close_worker_loop
 
 # Create Celery app
 celery_app = Celery(
     "blog_automation",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
-    include=["app.tasks.content_tasks", "app.tasks.publishing_tasks", "app.tasks.analytics_tasks"]
+    include=["app.tasks.content_tasks", "app.tasks.publishing_tasks", "app.tasks.analytics_tasks", "app.tasks.seo_tasks"]
 )
 
 # Configure Celery
@@ -25,6 +27,12 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
 )
 
+# 워커 프로세스 종료 시 상주 이벤트 루프의 브라우저/HTTP 세션 정리
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs):
+    close_worker_loop()
+
+
 # Configure periodic tasks
 celery_app.conf.beat_schedule = {
     # 매일 오전 9시 스케줄된 콘텐츠 발행
@@ -42,4 +50,9 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.analytics_tasks.generate_daily_report",
         "schedule": crontab(hour=0, minute=0),
     },
+    # 매일 새벽 3시 전체 포스트 SEO 점수 재계산
+    "rescore-all-posts": {
+        "task": "app.tasks.seo_tasks.rescore_all_posts",
+        "schedule": crontab(hour=3, minute=0),
+    },
 }
\ No newline at end of file
@@ -52,6 +52,79 @@ class Settings(BaseSettings):
     # Rate limiting
     rate_limit_per_minute: int = 100
     
+    # SEO scoring (app.services.seo_optimizer)
+    # 키워드가 어절/조사 경계에 맞을 때만 카운트 (켜면 기존 키워드 밀도 점수가 달라짐)
+    seo_korean_keyword_boundaries: bool = False
+    
+    # CPU offload pool (app.core.executor)
+    offload_thread_workers: int = 8
+    offload_process_workers: Optional[int] = None  # None이면 CPU 코어 수
+    offload_max_queue: int = 64
+    
+    # Outbound HTTP client pool (app.core.http_client)
+    http_pool_limit: int = 100
+    http_pool_limit_per_host: int = 20
+    http_keepalive_seconds: float = 30.0
+    http_dns_ttl_seconds: int = 300
+    http_timeout_seconds: float = 30.0
+    http_connect_timeout_seconds: float = 10.0
+    
+    # Image search
+    image_search_concurrency: int = 4
+    image_cache_backend: str = "redis"  # redis, disk, memory
+    image_cache_dir: str = ".cache/image_search"
+    image_cache_ttl_seconds: int = 86400
+    image_cache_stale_seconds: int = 7 * 86400
+    image_cache_memory_size: int = 512
+    unsplash_quota_reserve: int = 10  # 남은 호출 수가 이 이하이면 대표 이미지 검색만 허용
+    unsplash_quota_window_seconds: int = 3600
+    featured_image_hedge_delay_seconds: float = 0.8  # 1순위 검색이 이 시간 안에 안 끝나면 대체 검색 동시 실행
+    featured_image_deadline_seconds: float = 5.0
+    image_provider_failure_threshold: int = 3  # 연속 실패가 이만큼이면 공급자 차단
+    image_provider_recovery_seconds: float = 30.0  # 차단 후 이 시간이 지나면 시험 호출 한 건 허용
+    content_image_spacing_chars: int = 500  # 본문 이미지 사이 최소 글자 수
+    content_image_max_count: Optional[int] = None  # None이면 후보 이미지 수까지
+    content_image_output: str = "markdown"  # markdown, html
+    
+    # WordPress publishing (app.services.publishers)
+    wordpress_term_cache_backend: str = "redis"  # redis, disk, memory (미디어 색인도 같은 저장소 사용)
+    wordpress_term_cache_dir: str = ".cache/wordpress_terms"
+    wordpress_term_cache_ttl_seconds: int = 86400
+    wordpress_request_concurrency: int = 8  # 사이트당 동시 요청 수
+    wordpress_batch_size: int = 25  # /batch/v1 요청당 최대 항목 수 (WordPress 기본 한도)
+    wordpress_media_upload: bool = True  # 이미지를 미디어 라이브러리에 올리고 본문 URL/대표 이미지 지정
+    wordpress_media_cache_dir: str = ".cache/wordpress_media"
+    wordpress_media_upload_concurrency: int = 4
+    
+    # Fan-out publishing (app.services.publish_fanout)
+    publish_fanout_wordpress_concurrency: int = 8
+    publish_fanout_tistory_concurrency: int = 4
+    publish_fanout_naver_concurrency: int = 2  # 브라우저 발행은 browser_pool_max_sessions 이하로
+    
+    # Browser automation (app.services.browser_pool)
+    browser_pool_max_uses: int = 50  # 이 횟수만큼 세션을 연 브라우저는 새로 띄움
+    browser_pool_max_sessions: int = 4  # 워커당 동시 브라우저 컨텍스트 수
+    browser_state_dir: str = ".cache/browser_state"  # 계정별 로그인 상태 (암호화 저장)
+    naver_transport: str = "browser"  # browser, http (계정 인증 정보의 transport가 우선)
+    naver_blog_base_url: str = "https://blog.naver.com"
+    naver_editor_input_mode: str = "paste"  # paste(블록 붙여넣기, 실패 시 타이핑), type
+    naver_editor_paste_timeout_ms: int = 2000  # 붙여넣기가 본문에 반영되기를 기다리는 시간
+    browser_wait_timeout_ms: int = 10000  # 페이지 이동/요소 변화 대기 최대 시간 (app.services.browser_automation)
+    naver_login_timeout_ms: int = 10000  # 로그인 페이지를 벗어나거나 오류가 뜨기를 기다리는 최대 시간
+    browser_block_resources: bool = True  # 용도별로 이미지/폰트/외부 광고·트래커 요청 차단
+    
+    # Local resized image store (app.services.image_store)
+    # 켜더라도 image_public_base_url이 외부에서 접근 가능한(localhost가 아닌) 주소여야 사용됨
+    image_store_enabled: bool = False
+    image_store_dir: str = "media/images"
+    image_public_base_url: Optional[str] = None  # /images 라우트를 외부에서 접근하는 주소 (예: https://api.example.com)
+    image_store_download_concurrency: int = 4
+    
+    # Perceptual-hash image dedupe (app.services.image_dedupe)
+    image_dedupe_index_path: str = "media/phash_index.json"
+    image_dedupe_max_distance: int = 6  # 64비트 dHash 해밍 거리
+    image_dedupe_recent_days: int = 30
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
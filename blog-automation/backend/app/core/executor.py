@@ -0,0 +1,176 @@
+"""
+API 프로세스용 CPU 작업 오프로드 풀
+
+BeautifulSoup 파싱, bcrypt 해싱, 이미지 삽입 같은 CPU 작업을 uvicorn 이벤트 루프 밖에서
+실행합니다. 스레드 풀(GIL을 푸는 C 확장: bcrypt 등)과 프로세스 풀(순수 파이썬 CPU 작업)을
+공유하며, 대기열 크기를 제한해서 과부하 시에는 호출자가 기다리도록 합니다.
+
+    result = await offload(fn, *args)                     # 스레드 풀
+    result = await offload(fn, *args, kind="process")     # 프로세스 풀
+
+프로세스 풀은 API 프로세스의 lifespan이 enable_process_offload()를 호출한 뒤에만 씁니다.
+Celery prefork 워커 같은 데몬 프로세스는 자식 프로세스를 만들 수 없으므로, 그 밖에서는
+kind="process" 요청도 스레드 풀에서 실행합니다.
+"""
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+
+class OffloadPool:
+    """제한된 크기의 스레드/프로세스 실행기 묶음과 대기열 지표"""
+
+    def __init__(
+        self,
+        thread_workers: int,
+        process_workers: Optional[int],
+        max_queue: int
+    ):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.max_queue = max_queue
+        self.processes_enabled = False
+
+        self._executors: Dict[str, Executor] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, Dict[str, float]] = {
+            kind: {
+                "in_flight": 0,
+                "waiting": 0,
+                "max_in_flight": 0,
+                "completed": 0,
+                "failed": 0,
+                "total_wait_seconds": 0.0,
+                "total_run_seconds": 0.0,
+            }
+            for kind in ("thread", "process")
+        }
+
+    def _executor(self, kind: str) -> Executor:
+        executor = self._executors.get(kind)
+        if executor is None:
+            if kind == "process":
+                executor = ProcessPoolExecutor(max_workers=self.process_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.thread_workers, thread_name_prefix="offload"
+                )
+            self._executors[kind] = executor
+        return executor
+
+    def _slot(self, kind: str) -> asyncio.Semaphore:
+        # 실행 중 + 대기 중인 작업 수 상한 (초과 시 호출자가 대기)
+        slot = self._slots.get(kind)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_queue)
+            self._slots[kind] = slot
+        return slot
+
+    async def run(self, fn: Callable[..., Any], *args, kind: str = "thread", **kwargs) -> Any:
+        if kind not in self._stats:
+            raise ValueError(f"Unknown offload kind: {kind}")
+        if kind == "process" and not self.processes_enabled:
+            kind = "thread"
+
+        stats = self._stats[kind]
+        stats["waiting"] += 1
+        enqueued = time.perf_counter()
+        admitted = False
+
+        try:
+            async with self._slot(kind):
+                stats["waiting"] -= 1
+                admitted = True
+                stats["in_flight"] += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+
+                loop = asyncio.get_running_loop()
+                call = functools.partial(fn, *args, **kwargs)
+                try:
+                    result, started, finished = await loop.run_in_executor(
+                        self._executor(kind), _timed_call, call
+                    )
+                except Exception:
+                    stats["failed"] += 1
+                    raise
+                finally:
+                    stats["in_flight"] -= 1
+
+                stats["completed"] += 1
+                stats["total_wait_seconds"] += max(0.0, started - enqueued)
+                stats["total_run_seconds"] += finished - started
+                return result
+        finally:
+            if not admitted:
+                stats["waiting"] -= 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """대기열 깊이와 처리량 지표를 반환합니다.
+
+        in_flight: 실행기에 제출된 작업 수 (워커 수를 넘는 만큼은 실행기 내부 대기열에 있음)
+        waiting: 대기열 상한에 걸려 제출을 기다리는 작업 수
+        avg_wait_ms: 제출부터 워커에서 실제 실행이 시작될 때까지의 평균 대기 시간
+        """
+        snapshot = {}
+        for kind, stats in self._stats.items():
+            completed = stats["completed"] or 1
+            snapshot[kind] = {
+                "in_flight": stats["in_flight"],
+                "waiting": stats["waiting"],
+                "max_in_flight": stats["max_in_flight"],
+                "completed": stats["completed"],
+                "failed": stats["failed"],
+                "avg_wait_ms": round(stats["total_wait_seconds"] / completed * 1000, 2),
+                "avg_run_ms": round(stats["total_run_seconds"] / completed * 1000, 2),
+            }
+        return snapshot
+
+    def shutdown(self):
+        if self._executors:
+            logger.info("Shutting down offload pool", stats=self.stats())
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+        self._slots.clear()
+
+
+def _timed_call(call: Callable[[], Any]):
+    # 워커 안에서 시작/종료 시각 기록 (리눅스에서 perf_counter는 프로세스 간 공유되는 단조 시계)
+    started = time.perf_counter()
+    result = call()
+    return result, started, time.perf_counter()
+
+
+offload_pool = OffloadPool(
+    thread_workers=settings.offload_thread_workers,
+    process_workers=settings.offload_process_workers,
+    max_queue=settings.offload_max_queue,
+)
+
+
+async def offload(fn: Callable[..., Any], *args, kind: str = "thread", **kwargs) -> Any:
+    """CPU 작업을 공유 실행기에서 실행하고 결과를 기다립니다."""
+    return await offload_pool.run(fn, *args, kind=kind, **kwargs)
+
+
+def get_offload_stats() -> Dict[str, Dict[str, float]]:
+    """오프로드 풀 지표 반환"""
+    return offload_pool.stats()
+
+
+def enable_process_offload():
+    """API 프로세스 시작 시 프로세스 풀 사용을 허용합니다 (lifespan에서 호출)."""
+    offload_pool.processes_enabled = True
+
+
+def shutdown_offload_pool():
+    """앱 종료 시 실행기를 정리합니다."""
+    offload_pool.shutdown()
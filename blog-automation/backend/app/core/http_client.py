@@ -0,0 +1,197 @@
+"""
+외부 연동용 공유 HTTP 클라이언트 레지스트리
+
+요청마다 ClientSession/AsyncClient를 새로 만들면 매번 TCP+TLS 연결을 다시 맺게 되므로,
+이벤트 루프별로 하나의 클라이언트를 공유해서 호스트별 연결 풀과 keep-alive를 재사용합니다.
+
+- aiohttp 세션: 호스트별 연결 수 제한, DNS 캐시, keep-alive, 기본 타임아웃
+- httpx 클라이언트: h2 패키지가 설치되어 있으면 HTTP/2 사용 (Unsplash 등)
+- 호스트별 요청 수 / 새 연결 / 재사용 연결 / DNS 캐시 적중 지표
+
+FastAPI에서는 lifespan 종료 시, Celery 태스크에서는 루프 종료 전에 close_http_clients()를 호출합니다.
+공유 세션이므로 호출하는 쪽에서 `async with session:`으로 닫으면 안 됩니다.
+"""
+import asyncio
+import weakref
+from collections import defaultdict
+from typing import Dict
+
+import aiohttp
+import httpx
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class ConnectionMetrics:
+    """호스트별 연결 재사용 지표"""
+
+    def __init__(self):
+        self._hosts: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "requests": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        })
+
+    def record(self, host: str, event: str):
+        self._hosts[host or "unknown"][event] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for host, counters in self._hosts.items():
+            connections = counters["new_connections"] + counters["reused_connections"]
+            result[host] = {
+                **counters,
+                "reuse_ratio": round(counters["reused_connections"] / connections, 3) if connections else 0.0
+            }
+        return result
+
+
+class HTTPClientRegistry:
+    """이벤트 루프별 공유 aiohttp 세션과 httpx 클라이언트 레지스트리"""
+
+    def __init__(self):
+        self.metrics = ConnectionMetrics()
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+        self._httpx_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        metrics = self.metrics
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            context.host = params.url.host
+            metrics.record(context.host, "requests")
+
+        async def on_connection_create_end(session, context, params):
+            metrics.record(getattr(context, "host", None), "new_connections")
+
+        async def on_connection_reuseconn(session, context, params):
+            metrics.record(getattr(context, "host", None), "reused_connections")
+
+        async def on_dns_cache_hit(session, context, params):
+            metrics.record(params.host, "dns_cache_hits")
+
+        async def on_dns_cache_miss(session, context, params):
+            metrics.record(params.host, "dns_cache_misses")
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프의 공유 aiohttp 세션 반환"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=settings.http_pool_limit,
+                limit_per_host=settings.http_pool_limit_per_host,
+                ttl_dns_cache=settings.http_dns_ttl_seconds,
+                keepalive_timeout=settings.http_keepalive_seconds,
+                enable_cleanup_closed=True,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                # 여러 계정/사이트가 함께 쓰는 세션이므로 응답 쿠키를 저장하지 않음
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(
+                    total=settings.http_timeout_seconds,
+                    connect=settings.http_connect_timeout_seconds
+                ),
+                trace_configs=[self._trace_config()],
+            )
+            self._sessions[loop] = session
+        return session
+
+    def _httpx_trace(self, host: str):
+        metrics = self.metrics
+
+        async def trace(event_name: str, info: dict):
+            # httpcore는 새 연결을 맺을 때만 connect_tcp 이벤트를 보냄
+            if event_name == "connection.connect_tcp.complete":
+                metrics.record(host, "new_connections")
+            elif event_name in ("http11.send_request_headers.started", "http2.send_request_headers.started"):
+                metrics.record(host, "requests")
+
+        return trace
+
+    async def _httpx_request_hook(self, request: httpx.Request):
+        request.extensions["trace"] = self._httpx_trace(request.url.host)
+
+    def httpx_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프의 공유 httpx 클라이언트 반환 (가능하면 HTTP/2)"""
+        loop = asyncio.get_running_loop()
+        client = self._httpx_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=settings.http_pool_limit,
+                    max_keepalive_connections=settings.http_pool_limit_per_host,
+                    keepalive_expiry=settings.http_keepalive_seconds
+                ),
+                timeout=httpx.Timeout(
+                    settings.http_timeout_seconds,
+                    connect=settings.http_connect_timeout_seconds
+                ),
+                event_hooks={"request": [self._httpx_request_hook]},
+            )
+            self._httpx_clients[loop] = client
+        return client
+
+    async def close(self):
+        """현재 이벤트 루프의 클라이언트를 닫습니다."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+        client = self._httpx_clients.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """호스트별 연결 재사용 지표 반환"""
+        snapshot = self.metrics.snapshot()
+        for host, counters in snapshot.items():
+            # httpx 경로는 재사용 이벤트가 없으므로 요청 수에서 새 연결 수를 빼서 계산
+            if counters["reused_connections"] == 0 and counters["requests"] > counters["new_connections"]:
+                counters["reused_connections"] = counters["requests"] - counters["new_connections"]
+                counters["reuse_ratio"] = round(counters["reused_connections"] / counters["requests"], 3)
+        return snapshot
+
+
+http_clients = HTTPClientRegistry()
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """공유 aiohttp 세션 반환"""
+    return http_clients.session()
+
+
+def get_httpx_client() -> httpx.AsyncClient:
+    """공유 httpx 클라이언트 반환"""
+    return http_clients.httpx_client()
+
+
+async def close_http_clients():
+    """현재 이벤트 루프의 공유 클라이언트 정리"""
+    await http_clients.close()
+
+
+def get_http_client_stats() -> Dict[str, Dict[str, float]]:
+    """연결 재사용 지표 반환"""
+    return http_clients.stats()
@@ -5,6 +5,7 @@ from passlib.context import CryptContext
 from cryptography.fernet import Fernet
 
 from app.core.config import settings
+from app.core.executor import offload
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -17,6 +18,16 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """bcrypt 검증을 오프로드 스레드 풀에서 실행합니다 (bcrypt는 GIL을 해제)."""
+    return await offload(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """bcrypt 해싱을 오프로드 스레드 풀에서 실행합니다."""
+    return await offload(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
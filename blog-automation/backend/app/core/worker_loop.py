@@ -0,0 +1,48 @@
+"""
+Celery 워커 프로세스용 상주 이벤트 루프
+
+태스크마다 새 이벤트 루프를 만들면 루프에 묶인 자원(공유 HTTP 세션, Playwright 브라우저)을
+태스크가 끝날 때마다 버려야 합니다. 워커 프로세스마다 루프 하나를 계속 쓰면서
+이런 자원을 다음 태스크에서 재사용하고, 워커 종료 시(worker_process_shutdown) 한 번에 정리합니다.
+"""
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+import structlog
+
+from app.core.http_client import close_http_clients
+
+logger = structlog.get_logger()
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_cleanups: List[Callable[[], Awaitable[None]]] = [close_http_clients]
+
+
+def register_loop_cleanup(cleanup: Callable[[], Awaitable[None]]):
+    """워커 종료 시 상주 루프에서 실행할 정리 함수 등록"""
+    if cleanup not in _cleanups:
+        _cleanups.append(cleanup)
+
+
+def run_in_worker_loop(coro: Awaitable):
+    """워커 프로세스의 상주 이벤트 루프에서 코루틴을 실행합니다."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
+def close_worker_loop():
+    """등록된 정리 함수를 실행하고 상주 루프를 닫습니다."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    # 나중에 등록된 자원(브라우저 등)부터 정리
+    for cleanup in reversed(_cleanups):
+        try:
+            _loop.run_until_complete(cleanup())
+        except Exception as e:
+            logger.warning(f"워커 루프 정리 실패: {str(e)}", cleanup=getattr(cleanup, "__name__", str(cleanup)))
+    _loop.close()
+    _loop = None
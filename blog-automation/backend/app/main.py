@@ -1,9 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 from contextlib import asynccontextmanager
+import asyncio
 import structlog
 
 from app.core.config import settings
+from app.core.executor import offload, enable_process_offload, get_offload_stats, shutdown_offload_pool
+from app.core.http_client import close_http_clients, get_http_client_stats
+from app.services.image_cache import get_image_search_cache
+from app.services.image_dedupe import get_perceptual_index
+from app.services.image_insertion import ImageInsertionPolicy, insert_images
+from app.services.image_providers import get_circuit_breaker_stats
+from app.services.image_store import get_image_store, image_store_active
+from app.services.unsplash_quota import get_unsplash_quota
 # from app.api import auth, users, contents, blog_accounts, publications, analytics
 from app.core.database import supabase_client
 
@@ -33,6 +43,9 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Blog Automation System")
     
+    # CPU 작업용 프로세스 풀은 API 프로세스에서만 사용 (Celery 워커에서는 스레드 풀로 대체됨)
+    enable_process_offload()
+    
     # Test Supabase connection
     try:
         result = supabase_client.table('blog_platforms').select("*").limit(1).execute()
@@ -44,6 +57,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Blog Automation System")
+    shutdown_offload_pool()
+    await close_http_clients()
 
 
 # Create FastAPI app
@@ -87,7 +102,12 @@ async def health_check():
         return {
             "status": "healthy",
             "supabase": "connected",
-            "database": "ready"
+            "database": "ready",
+            "offload": get_offload_stats(),
+            "http_clients": get_http_client_stats(),
+            "image_cache": get_image_search_cache().get_stats(),
+            "unsplash_quota": get_unsplash_quota().get_stats(),
+            "image_providers": get_circuit_breaker_stats()
         }
     except Exception as e:
         return {
@@ -97,6 +117,20 @@ async def health_check():
         }
 
 
+@app.get("/images/{digest}/{variant}.jpg")
+async def serve_cached_image(digest: str, variant: str):
+    """로컬에 저장된 리사이즈 이미지 제공 (해시 주소라 내용이 바뀌지 않으므로 장기 캐시)"""
+    path = get_image_store().variant_path(digest, variant)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    
+    return FileResponse(
+        path,
+        media_type="image/jpeg",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"}
+    )
+
+
 # Dashboard endpoints (temporary mock data)
 @app.get("/dashboard/stats")
 async def get_dashboard_stats():
@@ -300,7 +334,9 @@ async def test_publish(request: dict):
     from datetime import datetime
     import random
     from app.services.claude_service import get_claude_generator
+    from app.services.unsplash_service import get_unsplash_service
     
+    image_prefetch = None
     try:
         # 요청 데이터 파싱
         keywords = request.get('keywords', [])
@@ -317,10 +353,17 @@ async def test_publish(request: dict):
         # 첫 번째 키워드가 주제
         topic = keywords[0] if keywords else "주제"
         
-        # Claude API를 사용한 콘텐츠 생성
+        # 대표 이미지/키워드 기반 이미지 검색은 키워드만 있으면 되므로 콘텐츠 생성과 동시에 미리 시작
+        try:
+            image_prefetch = get_unsplash_service().prefetch_keyword_images(keywords)
+        except Exception as prefetch_error:
+            logger.warning(f"이미지 미리 검색 시작 실패: {prefetch_error}")
+        
+        # Claude API를 사용한 콘텐츠 생성 (동기 SDK 호출이므로 스레드에서 실행해 이벤트 루프를 막지 않음)
         try:
             claude_generator = get_claude_generator()
-            claude_content = claude_generator.generate_content(
+            claude_content = await offload(
+                claude_generator.generate_content,
                 keywords=keywords,
                 content_type=content_type,
                 target_length=target_length,
@@ -440,13 +483,19 @@ async def test_publish(request: dict):
             
         
         # 실제 Unsplash API로 이미지 생성
-        from app.services.unsplash_service import get_unsplash_service
-        
         try:
             unsplash_service = get_unsplash_service()
             
-            # 대표 이미지 가져오기
-            featured_image = await unsplash_service.get_featured_image(keywords)
+            # 콘텐츠 생성 중에 미리 시작한 대표 이미지/키워드 기반 검색 결과와
+            # 제목이 정해진 뒤에만 가능한 제목 기반 검색 결과를 합침
+            if image_prefetch is None:
+                image_prefetch = unsplash_service.prefetch_keyword_images(keywords)
+            title_images, (featured_image, keyword_images) = await asyncio.gather(
+                unsplash_service.get_title_images(claude_content['title']),
+                image_prefetch
+            )
+            content_images = {"title_based": title_images, "keyword_based": keyword_images}
+            
             if not featured_image:
                 # 대체 이미지
                 featured_image = {
@@ -462,67 +511,53 @@ async def test_publish(request: dict):
                     "height": 800
                 }
             
-            # 콘텐츠용 추가 이미지들
-            content_images = await unsplash_service.get_content_images(keywords, claude_content['title'])
-            
             logger.info(f"이미지 검색 결과", 
                        title_based_count=len(content_images['title_based']),
                        keyword_based_count=len(content_images['keyword_based']))
             
-            # 본문에 이미지 첨부하기
-            content_with_images = claude_content['content']
-            
-            # 본문 중간에 이미지 삽입
-            content_lines = content_with_images.split('\n')
-            total_lines = len(content_lines)
-            insert_pos = 0  # 초기값 설정
-            images_inserted = 0
-            
-            # 500자마다 이미지 1개씩 삽입
-            content_length = len(content_with_images)
-            image_count = max(1, content_length // 500)  # 500자마다 1개
-            
-            # 사용 가능한 이미지 모음
-            available_images = []
-            if content_images['title_based']:
-                available_images.extend(content_images['title_based'])
-            if content_images['keyword_based']:
-                available_images.extend(content_images['keyword_based'])
-            
-            # 이미지가 충분하지 않으면 반복 사용
-            if available_images:
-                while len(available_images) < image_count:
-                    available_images.extend(available_images[:min(len(available_images), image_count - len(available_images))])
+            # 최근 포스트에 쓴 이미지와 거의 같은 이미지 제외 (API 호출 없이 썸네일 지각 해시로 비교)
+            # 대표 이미지가 최근 포스트와 겹치면 본문 후보 중 첫 이미지로 교체
+            perceptual_index = get_perceptual_index()
+            replace_featured = await perceptual_index.is_recently_used(featured_image)
+            kept_images = await perceptual_index.filter_images(
+                content_images['title_based'] + content_images['keyword_based'],
+                reference=None if replace_featured else [featured_image]
+            )
+            if replace_featured and kept_images:
+                featured_image = kept_images.pop(0)
+            kept_ids = {id(img) for img in kept_images}
+            content_images = {
+                group: [img for img in images if id(img) in kept_ids]
+                for group, images in content_images.items()
+            }
             
-            # 문자 수 기준으로 이미지 삽입
-            if available_images:
-                # 현재까지의 문자 수 계산
-                char_count = 0
-                inserted_images = 0
-                new_lines = []
-                
-                for line in content_lines:
-                    new_lines.append(line)
-                    char_count += len(line)
-                    
-                    # 500자마다 이미지 삽입 (단락 경계 확인)
-                    if char_count >= (inserted_images + 1) * 500 and inserted_images < min(image_count, len(available_images)):
-                        # 현재 줄이 빈 줄이면 바로 삽입
-                        if line.strip() == '':
-                            img = available_images[inserted_images]
-                            image_markdown = f"\n![{img['alt_text']}]({img['url']})\n*사진: {img['attribution']['photographer']} (Unsplash)*\n"
-                            new_lines.append(image_markdown)
-                            inserted_images += 1
-                            images_inserted += 1
-                            logger.info(f"{inserted_images}번째 이미지 삽입 (500자 간격)", chars=char_count, url=img['url'])
-                
-                content_lines = new_lines
+            # 선택된 이미지를 로컬 리사이즈 캐시 URL로 교체 (원격 호스트 지연에 의존하지 않도록)
+            if image_store_active():
+                image_store = get_image_store()
+                featured_image, title_based, keyword_based = await asyncio.gather(
+                    image_store.localize_image(featured_image, main_variant="featured"),
+                    image_store.localize_images(content_images['title_based']),
+                    image_store.localize_images(content_images['keyword_based'])
+                )
+                content_images = {"title_based": title_based, "keyword_based": keyword_based}
+            
+            # 본문 단락 경계에 이미지 첨부하기 (한 번의 스캔, 50KB 본문도 수 ms라 이벤트 루프에서 바로 실행)
+            insertion = insert_images(
+                claude_content['content'],
+                content_images['title_based'] + content_images['keyword_based'],
+                ImageInsertionPolicy(
+                    spacing=settings.content_image_spacing_chars,
+                    max_images=settings.content_image_max_count,
+                    output=settings.content_image_output
+                ),
+                featured=featured_image
+            )
+            claude_content['content'] = insertion.content
             
-            # 이미지가 첨부된 최종 본문
-            content_with_images = '\n'.join(content_lines)
-            claude_content['content'] = content_with_images
+            logger.info(f"이미지 첨부 완료", total_inserted=insertion.count)
             
-            logger.info(f"이미지 첨부 완료", total_inserted=images_inserted)
+            # 이번 포스트에 실제로 쓴 이미지를 지각 해시 색인에 기록
+            await perceptual_index.record_used([featured_image] + insertion.images)
             
             suggested_images = content_images
             
@@ -549,6 +584,13 @@ async def test_publish(request: dict):
                 "keyword_based": []
             }
         
+        # 마크다운 본문 그대로 SEO 점수 계산 (HTML 변환 없이)
+        from app.services.seo_optimizer import SEOOptimizer
+        
+        seo_analysis = await offload(
+            SEOOptimizer().analyze_markdown, claude_content["content"], keywords, kind="process"
+        )
+        
         # Supabase blog_posts 테이블에 콘텐츠 저장
         try:
             # blog_platform 정보에서 플랫폼 ID 찾기
@@ -575,6 +617,8 @@ async def test_publish(request: dict):
                     "content": claude_content["content"],
                     "meta_description": claude_content["meta_description"],
                     "featured_image_url": featured_image.get("url") if featured_image else None,
+                    "seo_score": seo_analysis["seo_score"],
+                    "readability_score": seo_analysis["readability_score"],
                     "status": "draft",  # 초기 상태는 draft로 설정
                     "views": 0,  # 실제 값으로 시작
                     "likes": 0,  # 실제 값으로 시작
@@ -608,7 +652,10 @@ async def test_publish(request: dict):
             "word_count": claude_content["word_count"],
             "ai_model_used": settings.claude_model,
             "featured_image": featured_image,
-            "suggested_images": suggested_images
+            "suggested_images": suggested_images,
+            "seo_score": seo_analysis["seo_score"],
+            "readability_score": seo_analysis["readability_score"],
+            "seo_suggestions": seo_analysis["suggestions"]
         }
         
         return {
@@ -631,4 +678,8 @@ async def test_publish(request: dict):
         return {
             "success": False,
             "message": f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}"
-        }
\ No newline at end of file
+        }
+    finally:
+        # 오류나 요청 취소로 결과를 쓰지 않게 된 미리 검색은 정리
+        if image_prefetch is not None and not image_prefetch.done():
+            image_prefetch.cancel()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
@@ -38,6 +38,19 @@ class ContentGenerate(BaseModel):
     include_images: bool = True
 
 
+class SEOScoreRequest(BaseModel):
+    content: str
+    keywords: Optional[List[str]] = None
+
+
+class SEOScoreResponse(BaseModel):
+    seo_score: int
+    readability_score: int
+    keyword_density: Dict[str, Dict[str, float]]
+    heading_analysis: Dict
+    suggestions: List[str]
+
+
 class ContentResponse(ContentBase):
     id: UUID
     user_id: UUID
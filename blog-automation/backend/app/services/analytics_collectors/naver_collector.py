@@ -1,7 +1,12 @@
 from typing import Dict, Optional
 from playwright.async_api import async_playwright
 
+from app.core.config import settings
 from app.services.analytics_collectors.base_collector import BaseAnalyticsCollector
+from app.services.browser_automation import login_naver, open_page
+
+# 통계 페이지의 값 요소 (하나라도 나타나면 추출 시작)
+STATS_SELECTOR = ".stats_view_count, .stats_comment_count, .stats_sympathy_count"
 
 
 class NaverAnalyticsCollector(BaseAnalyticsCollector):
@@ -25,7 +30,7 @@ class NaverAnalyticsCollector(BaseAnalyticsCollector):
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
                 context = await browser.new_context()
-                page = await context.new_page()
+                page = await open_page(context, "stats")
                 
                 try:
                     # 로그인
@@ -33,8 +38,12 @@ class NaverAnalyticsCollector(BaseAnalyticsCollector):
                     
                     # 통계 페이지로 이동
                     stats_url = f"https://blog.naver.com/BlogStatsView.naver?blogId={blog_id}&logNo={platform_post_id}"
-                    await page.goto(stats_url)
-                    await page.wait_for_load_state("networkidle")
+                    await page.goto(stats_url, wait_until="domcontentloaded")
+                    try:
+                        await page.wait_for_selector(STATS_SELECTOR, timeout=settings.browser_wait_timeout_ms)
+                    except Exception:
+                        # 통계 요소가 없는 페이지면 추출 결과가 비어 기본값으로 정규화됨
+                        self.logger.warning("Naver stats elements not found", post_id=platform_post_id)
                     
                     # 통계 데이터 추출
                     stats = await self._extract_stats(page)
@@ -55,13 +64,8 @@ class NaverAnalyticsCollector(BaseAnalyticsCollector):
     async def _login(self, page, username: str, password: str):
         """네이버 로그인을 수행합니다."""
         try:
-            await page.goto("https://nid.naver.com/nidlogin.login")
-            
-            await page.fill('input[name="id"]', username)
-            await page.fill('input[name="pw"]', password)
-            await page.click('button[type="submit"]')
-            
-            await page.wait_for_timeout(3000)
+            if not await login_naver(page, username, password):
+                raise ValueError("Naver login was not completed")
             
         except Exception as e:
             self.logger.error("Naver login failed", error=str(e))
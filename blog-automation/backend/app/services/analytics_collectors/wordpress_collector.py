@@ -1,6 +1,6 @@
 from typing import Dict, Optional
-import aiohttp
 
+from app.core.http_client import get_http_session
 from app.services.analytics_collectors.base_collector import BaseAnalyticsCollector
 
 
@@ -55,18 +55,18 @@ class WordPressAnalyticsCollector(BaseAnalyticsCollector):
                 "format": "json"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Jetpack 데이터 파싱
-                        return self._normalize_metrics({
-                            "views": data.get("views", 0),
-                            "unique_visitors": data.get("visitors", 0),
-                            "comments": data.get("comments", 0)
-                        })
-            
+            session = get_http_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    # Jetpack 데이터 파싱
+                    return self._normalize_metrics({
+                        "views": data.get("views", 0),
+                        "unique_visitors": data.get("visitors", 0),
+                        "comments": data.get("comments", 0)
+                    })
+
             return self._normalize_metrics({})
             
         except Exception as e:
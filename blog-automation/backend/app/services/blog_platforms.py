@@ -3,6 +3,9 @@ import aiohttp
 from playwright.async_api import async_playwright
 import structlog
 
+from app.core.http_client import get_http_session
+from app.core.config import settings
+from app.services.browser_automation import login_naver, open_page
 from app.models.blog_account import BlogPlatform
 
 logger = structlog.get_logger()
@@ -35,13 +38,13 @@ async def verify_wordpress_credentials(credentials: Dict[str, Any]) -> bool:
         # WordPress REST API 테스트
         api_url = f"{site_url}/wp-json/wp/v2/users/me"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                api_url,
-                auth=aiohttp.BasicAuth(username, password)
-            ) as response:
-                return response.status == 200
-                
+        session = get_http_session()
+        async with session.get(
+            api_url,
+            auth=aiohttp.BasicAuth(username, password)
+        ) as response:
+            return response.status == 200
+            
     except Exception as e:
         logger.error("WordPress verification failed", error=str(e))
         return False
@@ -59,17 +62,17 @@ async def verify_tistory_credentials(credentials: Dict[str, Any]) -> bool:
         # Tistory API 테스트
         api_url = "https://www.tistory.com/apis/blog/info"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                api_url,
-                params={
-                    "access_token": access_token,
-                    "blogName": blog_name,
-                    "output": "json"
-                }
-            ) as response:
-                return response.status == 200
-                
+        session = get_http_session()
+        async with session.get(
+            api_url,
+            params={
+                "access_token": access_token,
+                "blogName": blog_name,
+                "output": "json"
+            }
+        ) as response:
+            return response.status == 200
+            
     except Exception as e:
         logger.error("Tistory verification failed", error=str(e))
         return False
@@ -87,27 +90,23 @@ async def verify_naver_credentials(credentials: Dict[str, Any]) -> bool:
         # 네이버는 공식 API가 제한적이므로 브라우저 자동화로 확인
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+            context = await browser.new_context()
+            page = await open_page(context, "login")
             
             try:
-                # 네이버 로그인 페이지로 이동
-                await page.goto("https://nid.naver.com/nidlogin.login")
-                
-                # 로그인 시도
-                await page.fill('input[name="id"]', username)
-                await page.fill('input[name="pw"]', password)
-                await page.click('button[type="submit"]')
-                
-                # 로그인 성공 확인
-                await page.wait_for_timeout(3000)
+                # 로그인 시도 (로그인 페이지를 벗어나면 성공, 오류/캡차가 뜨면 바로 실패)
+                if not await login_naver(page, username, password):
+                    return False
                 
                 # 블로그 페이지 접근 가능한지 확인
-                await page.goto("https://blog.naver.com/PostList.naver")
-                
-                # 블로그 관리 페이지가 로드되면 성공
-                is_logged_in = await page.locator('.blog_title').count() > 0
+                await page.goto("https://blog.naver.com/PostList.naver", wait_until="domcontentloaded")
                 
-                return is_logged_in
+                # 블로그 제목 요소가 나타나면 성공
+                try:
+                    await page.wait_for_selector('.blog_title', timeout=settings.browser_wait_timeout_ms)
+                    return True
+                except Exception:
+                    return False
                 
             finally:
                 await browser.close()
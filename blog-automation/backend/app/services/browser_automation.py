@@ -0,0 +1,168 @@
+"""
+브라우저 자동화 공통 대기/시간 측정 도구
+
+고정 시간 대기(wait_for_timeout) 대신 URL 이동, 요소 표시/제거, 입력값 변화처럼 실제 완료 조건을 기다리고,
+단계별 소요 시간을 로그로 남겨 얼마나 줄었는지 확인할 수 있게 합니다.
+
+- wait_for_first: 여러 조건 중 먼저 충족된 것을 반환하고 나머지는 취소
+- login_naver: 로그인 페이지를 벗어나거나 오류 메시지가 뜰 때까지만 대기 (publisher, collector, 인증 확인 공용)
+- StepTimer: 단계별 소요 시간(ms) 기록 후 한 번에 로그
+- open_page: 용도별(PAGE_PROFILES) 리소스 차단 규칙을 적용한 페이지 생성
+  (이미지/폰트/미디어와 외부 광고·트래커 요청을 막아 페이지 로드 시간과 메모리를 줄임)
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Dict, Optional
+from urllib.parse import urlparse
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+NAVER_LOGIN_URL = "https://nid.naver.com/nidlogin.login"
+# 아이디/비밀번호 오류, 캡차 등 로그인 페이지에 머무는 경우 나타나는 요소
+NAVER_LOGIN_ERROR_SELECTOR = "#err_common, .error_message, #captcha, #rcapt"
+
+# 네이버 서비스 도메인 (pstatic.net은 에디터/로그인 스크립트를 내려주는 정적 CDN)
+FIRST_PARTY_DOMAINS = ("naver.com", "naver.net", "pstatic.net")
+# 네이버 도메인이지만 페이지 동작에 필요 없는 광고/로그 수집 호스트
+TRACKER_DOMAINS = ("lcs.naver.com", "tivan.naver.com", "veta.naver.com", "adcr.naver.com")
+
+# 용도별 차단 규칙
+# - block_types: 차단할 Playwright resource_type
+# - first_party_only: FIRST_PARTY_DOMAINS 외의 요청 차단
+# 스타일시트는 어느 용도에서도 막지 않음: login_naver는 오류/캡차 요소가 "보이는지"로 실패를 판단하는데,
+# 스타일시트가 없으면 CSS로 숨겨 둔 오류 영역이 보이는 상태가 되어 로그인 실패로 오판함
+# (로그인은 글쓰기, 통계 수집, 인증 확인 모두에서 같은 컨텍스트로 거침)
+PAGE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # 글쓰기/수정/삭제
+    "editor": {"block_types": {"image", "media", "font"}, "first_party_only": True},
+    # 로그인 확인 (인증 확인, HTTP 전송의 쿠키 갱신)
+    "login": {"block_types": {"image", "media", "font"}, "first_party_only": True},
+    # 통계 수집
+    "stats": {"block_types": {"image", "media", "font"}, "first_party_only": True},
+}
+
+
+class StepTimer:
+    """브라우저 작업의 단계별 소요 시간 기록"""
+
+    def __init__(self, operation: str, **context):
+        self.operation = operation
+        self.context = context
+        self.steps: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = round((time.perf_counter() - started) * 1000)
+
+    @property
+    def total_ms(self) -> int:
+        return round((time.perf_counter() - self._started) * 1000)
+
+    def log(self, **extra):
+        logger.info(
+            "브라우저 작업 단계별 소요 시간",
+            operation=self.operation,
+            total_ms=self.total_ms,
+            steps=self.steps,
+            **self.context,
+            **extra
+        )
+
+
+async def wait_for_first(conditions: Dict[str, Awaitable], timeout_ms: Optional[int] = None) -> Optional[str]:
+    """
+    여러 대기 조건 중 먼저 성공한 조건의 이름을 반환합니다 (모두 실패하거나 시간 초과면 None).
+    남은 조건은 취소합니다.
+    """
+    timeout_ms = timeout_ms or settings.browser_wait_timeout_ms
+    tasks = {asyncio.ensure_future(condition): name for name, condition in conditions.items()}
+    pending = set(tasks)
+    try:
+        deadline = time.monotonic() + timeout_ms / 1000
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return tasks[task]
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+        # 취소된 Playwright 대기의 예외가 로그에 남지 않도록 회수
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def login_naver(page, username: str, password: str, timeout_ms: Optional[int] = None) -> bool:
+    """
+    네이버 로그인을 수행합니다.
+    로그인 페이지를 벗어나면 성공, 오류/캡차 요소가 나타나거나 시간이 지나면 실패로 봅니다.
+    """
+    timeout_ms = timeout_ms or settings.naver_login_timeout_ms
+    await page.goto(NAVER_LOGIN_URL, wait_until="domcontentloaded")
+    await page.fill('input[name="id"]', username)
+    await page.fill('input[name="pw"]', password)
+    await page.click('button[type="submit"]')
+
+    outcome = await wait_for_first({
+        "navigated": page.wait_for_url(lambda url: "nid.naver.com" not in url, timeout=timeout_ms),
+        "error": page.wait_for_selector(NAVER_LOGIN_ERROR_SELECTOR, timeout=timeout_ms),
+    }, timeout_ms)
+    if outcome != "navigated":
+        logger.warning("네이버 로그인 실패", outcome=outcome or "timeout", url=page.url)
+    return outcome == "navigated"
+
+
+def _matches(host: str, domains) -> bool:
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+def should_block(url: str, resource_type: str, profile: str) -> bool:
+    """요청을 차단할지 판단합니다 (http(s)가 아닌 요청은 항상 허용)."""
+    rules = PAGE_PROFILES[profile]
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return False
+    host = (parsed.hostname or "").lower()
+    if _matches(host, TRACKER_DOMAINS):
+        return True
+    if rules["first_party_only"] and not _matches(host, FIRST_PARTY_DOMAINS):
+        return True
+    return resource_type in rules["block_types"]
+
+
+async def block_resources(target, profile: str):
+    """페이지 또는 컨텍스트에 용도별 차단 규칙을 설치합니다."""
+    if profile not in PAGE_PROFILES:
+        raise ValueError(f"알 수 없는 페이지 용도: {profile}")
+
+    async def handle(route):
+        request = route.request
+        if should_block(request.url, request.resource_type, profile):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await target.route("**/*", handle)
+
+
+async def open_page(context, profile: Optional[str] = None):
+    """
+    용도별 리소스 차단 규칙을 적용한 새 페이지를 엽니다.
+    규칙은 컨텍스트에 설치되므로 같은 컨텍스트의 팝업/새 탭에도 적용됩니다.
+    """
+    if profile and settings.browser_block_resources:
+        await block_resources(context, profile)
+    return await context.new_page()
@@ -0,0 +1,299 @@
+"""
+Playwright 브라우저 풀
+
+작업마다 Chromium을 새로 띄우고 로그인부터 다시 하지 않도록, 이벤트 루프(워커 프로세스)마다
+브라우저 프로세스 하나를 계속 쓰고 계정별 로그인 상태(storage_state)를 암호화해 디스크에 보관합니다.
+
+- 세션마다 새 BrowserContext를 만들되 저장된 쿠키/스토리지를 넣어 로그인을 건너뜀
+- 브라우저는 사용 횟수(max_uses)가 차면 새로 띄우고, 이전 브라우저는 진행 중인 세션이 끝나면 종료
+- 연결이 끊긴 브라우저는 다음 세션에서 감지해 다시 띄움 (컨텍스트 생성 실패 시 한 번 재시도)
+- 동시 세션 수 제한 (max_sessions)
+- Celery 워커에서는 상주 이벤트 루프(app.core.worker_loop)와 함께 써야 태스크 사이에 재사용됨
+"""
+import asyncio
+import json
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from hashlib import sha1
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import structlog
+
+from app.core.config import settings
+from app.core.executor import offload
+from app.core.worker_loop import register_loop_cleanup
+from app.services.browser_automation import open_page
+
+logger = structlog.get_logger()
+
+
+class BrowserSession:
+    """풀에서 빌린 브라우저 컨텍스트와 페이지"""
+
+    def __init__(self, pool: "BrowserPool", account_key: str, context, page, restored: bool):
+        self.pool = pool
+        self.account_key = account_key
+        self.context = context
+        self.page = page
+        self.restored = restored  # 저장된 로그인 상태를 불러왔는지 여부
+
+    async def save_state(self):
+        """현재 컨텍스트의 로그인 상태를 저장합니다 (로그인 성공 후 호출)."""
+        await self.pool.save_state(self.account_key, self.context)
+
+    async def clear_state(self):
+        """저장된 로그인 상태를 지웁니다 (세션이 만료된 경우)."""
+        await self.pool.clear_state(self.account_key)
+
+
+class _BrowserHandle:
+    def __init__(self, browser):
+        self.browser = browser
+        self.uses = 0
+        self.active = 0
+        self.launched_at = time.time()
+
+
+class BrowserPool:
+    """이벤트 루프별 상주 브라우저와 계정별 로그인 상태 저장소"""
+
+    def __init__(
+        self,
+        max_uses: int = 50,
+        max_sessions: int = 4,
+        state_dir: Optional[str] = None,
+        cipher=None,
+        headless: bool = True,
+        playwright_factory: Optional[Callable[[], Any]] = None
+    ):
+        self.max_uses = max_uses
+        self.max_sessions = max_sessions
+        self.state_dir = state_dir
+        self.cipher = cipher
+        self.headless = headless
+        self.playwright_factory = playwright_factory
+
+        self._playwright = None
+        self._current: Optional[_BrowserHandle] = None
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_sessions)
+
+        self.stats = {
+            "launches": 0,
+            "recycled": 0,
+            "unhealthy": 0,
+            "sessions": 0,
+            "restored": 0,
+            "state_saves": 0,
+            "state_errors": 0,
+        }
+
+        if self.state_dir:
+            os.makedirs(self.state_dir, exist_ok=True)
+
+    # 브라우저
+
+    async def _launch(self) -> _BrowserHandle:
+        if self._playwright is None:
+            factory = self.playwright_factory
+            if factory is None:
+                from playwright.async_api import async_playwright
+                factory = async_playwright
+            self._playwright = await factory().start()
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        self.stats["launches"] += 1
+        logger.info("브라우저 시작", launches=self.stats["launches"])
+        return _BrowserHandle(browser)
+
+    async def _close_handle(self, handle: _BrowserHandle):
+        try:
+            await handle.browser.close()
+        except Exception as e:
+            logger.warning(f"브라우저 종료 실패: {str(e)}")
+
+    async def _retire(self, handle: _BrowserHandle):
+        """새 세션에는 쓰지 않고, 진행 중인 세션이 없으면 바로 종료"""
+        if self._current is handle:
+            self._current = None
+        if handle.active == 0:
+            await self._close_handle(handle)
+
+    async def _acquire_browser(self) -> _BrowserHandle:
+        async with self._lock:
+            handle = self._current
+            if handle is not None and not handle.browser.is_connected():
+                self.stats["unhealthy"] += 1
+                logger.warning("연결이 끊긴 브라우저 교체", uses=handle.uses)
+                await self._retire(handle)
+            elif handle is not None and handle.uses >= self.max_uses:
+                self.stats["recycled"] += 1
+                await self._retire(handle)
+
+            if self._current is None:
+                self._current = await self._launch()
+            handle = self._current
+            handle.uses += 1
+            handle.active += 1
+            return handle
+
+    async def _release_browser(self, handle: _BrowserHandle):
+        handle.active -= 1
+        if handle is not self._current and handle.active == 0:
+            await self._close_handle(handle)
+
+    # 로그인 상태
+
+    def _state_path(self, account_key: str) -> str:
+        return os.path.join(self.state_dir, sha1(account_key.encode('utf-8')).hexdigest() + '.state')
+
+    @staticmethod
+    def _read_file(path: str) -> Optional[str]:
+        try:
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write_file(path: str, data: str):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    async def load_state(self, account_key: str) -> Optional[Dict[str, Any]]:
+        """저장된 로그인 상태 (없거나 복호화할 수 없으면 None)"""
+        if not self.state_dir or self.cipher is None:
+            return None
+        path = self._state_path(account_key)
+        encrypted = await offload(self._read_file, path)
+        if encrypted is None:
+            return None
+        try:
+            return json.loads(self.cipher.decrypt(encrypted))
+        except Exception as e:
+            # 암호화 키가 바뀌었거나 파일이 손상된 경우 다시 로그인
+            self.stats["state_errors"] += 1
+            logger.warning(f"로그인 상태 복원 실패: {str(e)}")
+            await self.clear_state(account_key)
+            return None
+
+    async def save_state(self, account_key: str, context):
+        """컨텍스트의 쿠키/스토리지를 암호화해 저장합니다."""
+        if not self.state_dir or self.cipher is None:
+            return
+        try:
+            state = await context.storage_state()
+            encrypted = self.cipher.encrypt(json.dumps(state))
+            await offload(self._write_file, self._state_path(account_key), encrypted)
+            self.stats["state_saves"] += 1
+        except Exception as e:
+            self.stats["state_errors"] += 1
+            logger.warning(f"로그인 상태 저장 실패: {str(e)}")
+
+    async def clear_state(self, account_key: str):
+        """저장된 로그인 상태 삭제"""
+        if not self.state_dir:
+            return
+        try:
+            os.remove(self._state_path(account_key))
+        except FileNotFoundError:
+            pass
+
+    # 공개 API
+
+    @asynccontextmanager
+    async def session(self, account_key: str, profile: Optional[str] = None) -> AsyncIterator[BrowserSession]:
+        """
+        계정의 로그인 상태를 넣은 새 컨텍스트와 페이지를 빌립니다.
+
+        Args:
+            account_key: 로그인 상태를 구분할 계정 키 (예: "naver:{username}")
+            profile: 리소스 차단 규칙 (app.services.browser_automation.PAGE_PROFILES, None이면 차단 안 함)
+        """
+        async with self._semaphore:
+            state = await self.load_state(account_key)
+            handle = await self._acquire_browser()
+            context = None
+            try:
+                options = {"storage_state": state} if state else {}
+                try:
+                    context = await handle.browser.new_context(**options)
+                except Exception as e:
+                    # 브라우저가 응답하지 않으면 교체하고 한 번 재시도
+                    self.stats["unhealthy"] += 1
+                    logger.warning(f"브라우저 컨텍스트 생성 실패 - 브라우저 교체: {str(e)}")
+                    async with self._lock:
+                        await self._retire(handle)
+                    await self._release_browser(handle)
+                    # 새 브라우저를 띄우지 못하면 finally에서 다시 반납하지 않도록 비움
+                    handle = None
+                    handle = await self._acquire_browser()
+                    context = await handle.browser.new_context(**options)
+
+                page = await open_page(context, profile)
+                self.stats["sessions"] += 1
+                if state:
+                    self.stats["restored"] += 1
+                yield BrowserSession(self, account_key, context, page, restored=bool(state))
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.warning(f"브라우저 컨텍스트 종료 실패: {str(e)}")
+                if handle is not None:
+                    await self._release_browser(handle)
+
+    async def close(self):
+        """브라우저와 Playwright를 종료합니다."""
+        async with self._lock:
+            if self._current is not None:
+                await self._close_handle(self._current)
+                self._current = None
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception as e:
+                    logger.warning(f"Playwright 종료 실패: {str(e)}")
+                self._playwright = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 지표"""
+        current = self._current
+        return {
+            **self.stats,
+            "browser_uses": current.uses if current else 0,
+            "active_sessions": current.active if current else 0,
+        }
+
+
+# 이벤트 루프별 글로벌 인스턴스 (Playwright 객체는 만든 루프에서만 사용 가능)
+browser_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = weakref.WeakKeyDictionary()
+
+def get_browser_pool() -> BrowserPool:
+    """현재 이벤트 루프의 브라우저 풀 인스턴스 반환"""
+    loop = asyncio.get_running_loop()
+    pool = browser_pools.get(loop)
+    if pool is None:
+        from app.core.security import encryption_service
+        pool = BrowserPool(
+            max_uses=settings.browser_pool_max_uses,
+            max_sessions=settings.browser_pool_max_sessions,
+            state_dir=settings.browser_state_dir,
+            cipher=encryption_service
+        )
+        browser_pools[loop] = pool
+    return pool
+
+
+async def close_browser_pool():
+    """현재 이벤트 루프의 브라우저 풀 정리"""
+    pool = browser_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+register_loop_cleanup(close_browser_pool)
@@ -0,0 +1,259 @@
+"""
+이미지 검색 결과 캐시
+
+같은 키워드("technology", "artificial intelligence" 등)로 포스트마다 Unsplash를 다시 호출하면
+시간당 50회인 데모 한도를 금방 소진하고 호출마다 300~1000ms가 더해집니다.
+정규화된 쿼리 + 개수 + 방향을 키로 검색 결과를 캐시합니다.
+
+- 1차: 프로세스 메모리 LRU
+- 2차: Redis (redis_url) 또는 디스크 JSON 파일 - 재시작 후에도 유지
+- TTL이 지난 결과는 stale 기간 동안 그대로 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+- 같은 키를 동시에 요청하면 API 호출은 한 번만 (single-flight)
+- 빈 결과나 실패는 캐시하지 않음
+"""
+import asyncio
+import json
+import os
+import re
+import time
+import unicodedata
+import uuid
+from collections import OrderedDict
+from hashlib import sha1
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+ImageFetch = Callable[[], Awaitable[Optional[List[Dict[str, Any]]]]]
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_query(query: str) -> str:
+    """대소문자, 공백, 유니코드 조합형 차이를 없앤 쿼리"""
+    query = unicodedata.normalize('NFC', query or '')
+    return WHITESPACE_RE.sub(' ', query).strip().lower()
+
+
+def make_cache_key(namespace: str, query: str, count: int, orientation: str) -> str:
+    """검색 결과 캐시 키 (namespace는 결과 형식이 다른 서비스 구분용)"""
+    return f"{namespace}:{normalize_query(query)}:{count}:{orientation}"
+
+
+class ImageSearchCache:
+    """메모리 + Redis/디스크 2단 이미지 검색 결과 캐시"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 86400,
+        stale_seconds: float = 7 * 86400,
+        memory_size: int = 512,
+        redis_url: Optional[str] = None,
+        disk_dir: Optional[str] = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.memory_size = memory_size
+        self.redis_url = redis_url
+        self.disk_dir = disk_dir
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._redis = None
+        self._redis_loop = None
+
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "errors": 0,
+        }
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    # 2차 저장소
+
+    def _redis_client(self):
+        # redis.asyncio 연결은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+            self._redis_loop = loop
+        return self._redis
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    @staticmethod
+    def _read_file(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write_file(path: str, entry: Dict[str, Any]):
+        # 같은 키를 동시에 저장해도 임시 파일이 겹치지 않도록 이름을 구분
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    async def _load_persistent(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            if self.redis_url:
+                raw = await self._redis_client().get(f"image_search:{key}")
+                return json.loads(raw) if raw else None
+            if self.disk_dir:
+                # 파일 입출력은 이벤트 루프 밖에서 실행
+                # (app.core.executor는 앱 설정을 읽으므로 루프 기본 실행기 사용)
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, self._read_file, self._disk_path(key)
+                )
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"이미지 캐시 조회 실패: {str(e)}", key=key)
+        return None
+
+    async def _store_persistent(self, key: str, entry: Dict[str, Any]):
+        try:
+            if self.redis_url:
+                await self._redis_client().set(
+                    f"image_search:{key}",
+                    json.dumps(entry, ensure_ascii=False),
+                    ex=int(self.ttl_seconds + self.stale_seconds)
+                )
+            elif self.disk_dir:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._write_file, self._disk_path(key), entry
+                )
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"이미지 캐시 저장 실패: {str(e)}", key=key)
+
+    # 메모리
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    async def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return entry
+        entry = await self._load_persistent(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def _store(self, key: str, images: List[Dict[str, Any]]):
+        entry = {"images": images, "stored_at": time.time()}
+        self._remember(key, entry)
+        await self._store_persistent(key, entry)
+
+    # 조회
+
+    async def _fetch_and_store(self, key: str, fetch: ImageFetch) -> Optional[List[Dict[str, Any]]]:
+        images = await fetch()
+        if images:
+            await self._store(key, images)
+        return images
+
+    def _fetch_task(self, key: str, fetch: ImageFetch) -> asyncio.Task:
+        # 같은 키의 동시 요청은 하나의 API 호출을 공유 (호출자가 취소돼도 호출은 끝까지 진행해 캐시를 채움)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._fetch_done(key, done))
+        return task
+
+    def _fetch_done(self, key: str, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"이미지 검색 실패: {str(task.exception())}", key=key)
+
+    async def get_or_fetch(
+        self,
+        namespace: str,
+        query: str,
+        count: int,
+        orientation: str,
+        fetch: ImageFetch
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시된 검색 결과를 반환하고, 없으면 fetch()로 가져와 저장합니다.
+
+        Args:
+            namespace: 결과 형식을 구분하는 이름 (예: "unsplash_service")
+            query, count, orientation: 검색 조건 (캐시 키)
+            fetch: 실제 API를 호출하는 코루틴 함수 (실패 시 None/빈 리스트 반환 또는 예외)
+        """
+        key = make_cache_key(namespace, query, count, orientation)
+        entry = await self._lookup(key)
+
+        if entry is not None:
+            age = time.time() - entry["stored_at"]
+            if age < self.ttl_seconds:
+                self.stats["hits"] += 1
+                return entry["images"]
+            if age < self.ttl_seconds + self.stale_seconds:
+                self.stats["stale_hits"] += 1
+                if key not in self._inflight:
+                    self.stats["refreshes"] += 1
+                    self._fetch_task(key, fetch)
+                return entry["images"]
+
+        self.stats["misses"] += 1
+        return await asyncio.shield(self._fetch_task(key, fetch))
+
+    async def peek(
+        self,
+        namespace: str,
+        query: str,
+        count: int,
+        orientation: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        API를 호출하지 않고 저장된 결과만 반환합니다 (TTL/stale 기간이 지난 결과 포함).
+        검색 API가 장애일 때 마지막으로 성공한 결과를 쓰기 위한 조회입니다.
+        """
+        entry = await self._lookup(make_cache_key(namespace, query, count, orientation))
+        return entry["images"] if entry is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중 지표"""
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "memory_entries": len(self._memory),
+            "hit_ratio": round((self.stats["hits"] + self.stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        }
+
+
+# 글로벌 인스턴스
+image_search_cache = None
+
+def get_image_search_cache() -> ImageSearchCache:
+    """이미지 검색 캐시 인스턴스 반환"""
+    global image_search_cache
+    if image_search_cache is None:
+        # test_server.py처럼 앱 설정 없이 ImageSearchCache만 쓰는 경우를 위해 여기서 import
+        from app.core.config import settings
+        image_search_cache = ImageSearchCache(
+            ttl_seconds=settings.image_cache_ttl_seconds,
+            stale_seconds=settings.image_cache_stale_seconds,
+            memory_size=settings.image_cache_memory_size,
+            redis_url=settings.redis_url if settings.image_cache_backend == "redis" else None,
+            disk_dir=settings.image_cache_dir if settings.image_cache_backend == "disk" else None
+        )
+    return image_search_cache
@@ -0,0 +1,264 @@
+"""
+지각 해시(dHash) 기반 이미지 중복 제거
+
+Unsplash id가 달라도 같은 사진이거나 거의 같은 사진이 여러 포스트에 반복해서 쓰이는 것을 막습니다.
+최근 포스트에 사용한 이미지의 64비트 dHash를 BK-트리에 넣어 두고, 새 후보 이미지와의
+해밍 거리가 기준 이하이면 건너뜁니다.
+
+- 해시는 CDN 썸네일(thumb_url)로 계산하므로 Unsplash API 호출은 늘지 않음
+- 이미지 id별 해시는 메모 + 디스크 색인에 남겨 같은 이미지는 다시 내려받지 않음
+- 사용 기록은 recent_days 동안 유지하고, 오래된 기록은 트리를 다시 만들면서 정리
+"""
+import asyncio
+import io
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.core.executor import offload
+from app.core.http_client import get_http_session
+
+logger = structlog.get_logger()
+
+
+def dhash(data: bytes, hash_size: int = 8) -> int:
+    """이미지 바이트의 차이 해시(dHash) - 가로로 이웃한 픽셀 밝기 비교 64비트"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+        pixels = list(image.getdata())
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 해시의 다른 비트 수"""
+    return bin(a ^ b).count("1")
+
+
+class BKTree:
+    """해밍 거리용 BK-트리 (삼각 부등식으로 탐색 범위를 줄임)"""
+
+    def __init__(self):
+        # 노드: [해시, 값 리스트, {거리: 자식 노드}]
+        self._root: Optional[list] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value_hash: int, item: Any):
+        self._size += 1
+        if self._root is None:
+            self._root = [value_hash, [item], {}]
+            return
+
+        node = self._root
+        while True:
+            distance = hamming_distance(value_hash, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value_hash, [item], {}]
+                return
+            node = child
+
+    def search(self, value_hash: int, max_distance: int) -> Iterator[Tuple[int, Any]]:
+        """max_distance 이내인 (거리, 값) 목록"""
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(value_hash, node[0])
+            if distance <= max_distance:
+                for item in node[1]:
+                    yield distance, item
+            for child_distance, child in node[2].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+
+
+class PerceptualImageIndex:
+    """최근 포스트에 사용한 이미지의 지각 해시 색인"""
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        max_distance: int = 6,
+        recent_days: float = 30,
+        max_entries: int = 5000
+    ):
+        self.index_path = index_path
+        self.max_distance = max_distance
+        self.recent_seconds = recent_days * 86400
+        self.max_entries = max_entries
+
+        self._hashes: Dict[str, int] = {}            # 이미지 id → 해시 (사용 여부와 무관한 메모)
+        self._used: List[Dict[str, Any]] = []        # 사용 기록 {"id", "hash", "used_at", "post_id"}
+        self._tree = BKTree()
+        self._lock: Optional[asyncio.Lock] = None
+
+        self._load()
+
+    # 저장
+
+    def _load(self):
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._hashes = {image_id: int(value, 16) for image_id, value in data.get("hashes", {}).items()}
+            self._used = [{**entry, "hash": int(entry["hash"], 16)} for entry in data.get("used", [])]
+        except Exception as e:
+            logger.warning(f"지각 해시 색인 로드 실패: {str(e)}")
+        self._rebuild()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            "hashes": {image_id: format(value, "016x") for image_id, value in self._hashes.items()},
+            "used": [{**entry, "hash": format(entry["hash"], "016x")} for entry in self._used]
+        }
+
+    def _write(self, data: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _rebuild(self):
+        # 기간이 지났거나 개수를 넘은 사용 기록을 정리하고 트리를 다시 만듦
+        cutoff = time.time() - self.recent_seconds
+        self._used = [entry for entry in self._used if entry["used_at"] >= cutoff][-self.max_entries:]
+        used_ids = {entry["id"] for entry in self._used}
+        if len(self._hashes) > self.max_entries * 2:
+            self._hashes = {image_id: value for image_id, value in self._hashes.items() if image_id in used_ids}
+
+        self._tree = BKTree()
+        for entry in self._used:
+            self._tree.add(entry["hash"], entry)
+
+    # 해시 계산
+
+    async def _download_thumb(self, url: str) -> bytes:
+        session = get_http_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise ValueError(f"HTTP {response.status}")
+            return await response.read()
+
+    async def image_hash(self, image: Dict[str, Any]) -> Optional[int]:
+        """이미지의 dHash (계산할 수 없으면 None)"""
+        image_id = image.get("id")
+        if image_id in self._hashes:
+            return self._hashes[image_id]
+
+        url = image.get("thumb_url") or image.get("url")
+        if not url:
+            return None
+        try:
+            data = await self._download_thumb(url)
+            value = await offload(dhash, data)
+        except Exception as e:
+            logger.warning(f"지각 해시 계산 실패: {str(e)}", image_id=image_id)
+            return None
+
+        if image_id:
+            self._hashes[image_id] = value
+        return value
+
+    # 조회 / 기록
+
+    def find_similar(self, value_hash: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """최근 사용한 이미지 중 기준 거리 이내인 것 (거리순)"""
+        return sorted(self._tree.search(value_hash, self.max_distance), key=lambda match: match[0])
+
+    async def is_recently_used(self, image: Dict[str, Any]) -> bool:
+        """최근 포스트에 쓴 이미지와 거의 같은지 여부"""
+        value = await self.image_hash(image)
+        return value is not None and bool(self.find_similar(value))
+
+    async def filter_images(
+        self,
+        images: List[Dict[str, Any]],
+        reference: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        최근 포스트에 쓴 이미지, 목록 안의 앞선 이미지, reference(예: 대표 이미지)와
+        거의 같은 이미지를 뺀 목록을 반환합니다. 해시를 계산하지 못한 이미지는 그대로 둡니다.
+        """
+        reference = reference or []
+        hashes = await asyncio.gather(*[self.image_hash(image) for image in reference + images])
+
+        batch_tree = BKTree()
+        for image, value in zip(reference, hashes[:len(reference)]):
+            if value is not None:
+                batch_tree.add(value, image.get("id"))
+
+        selected = []
+        for image, value in zip(images, hashes[len(reference):]):
+            if value is not None:
+                similar = self.find_similar(value)
+                if similar:
+                    logger.info(
+                        "최근 사용 이미지와 유사 - 건너뜀",
+                        image_id=image.get("id"),
+                        similar_to=similar[0][1]["id"],
+                        distance=similar[0][0]
+                    )
+                    continue
+                if any(True for _ in batch_tree.search(value, self.max_distance)):
+                    continue
+                batch_tree.add(value, image.get("id"))
+            selected.append(image)
+        return selected
+
+    async def record_used(self, images: List[Dict[str, Any]], post_id: Optional[str] = None):
+        """포스트에 사용한 이미지를 색인에 기록합니다."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        hashes = await asyncio.gather(*[self.image_hash(image) for image in images])
+        async with self._lock:
+            now = time.time()
+            for image, value in zip(images, hashes):
+                if value is None:
+                    continue
+                entry = {"id": image.get("id"), "hash": value, "used_at": now, "post_id": post_id}
+                self._used.append(entry)
+                self._tree.add(value, entry)
+
+            if len(self._used) > self.max_entries or (self._used and self._used[0]["used_at"] < now - self.recent_seconds):
+                self._rebuild()
+            if self.index_path:
+                # 스냅샷은 이벤트 루프에서 만들고 파일 쓰기만 스레드로
+                await offload(self._write, self._snapshot())
+
+
+# 글로벌 인스턴스
+perceptual_index = None
+
+def get_perceptual_index() -> PerceptualImageIndex:
+    """지각 해시 색인 인스턴스 반환"""
+    global perceptual_index
+    if perceptual_index is None:
+        perceptual_index = PerceptualImageIndex(
+            index_path=settings.image_dedupe_index_path,
+            max_distance=settings.image_dedupe_max_distance,
+            recent_days=settings.image_dedupe_recent_days
+        )
+    return perceptual_index
@@ -0,0 +1,133 @@
+"""
+이미지 검색 병렬 실행 헬퍼
+
+- fan_out_searches: 여러 검색 쿼리를 동시에 보내고(동시 실행 수 제한), 결과가 도착하는 순서대로
+  중복을 제거하며, 고유 이미지가 충분히 모이면 남은 검색을 취소합니다.
+  이미지 단계의 지연 시간이 호출 시간의 합이 아니라 가장 느린 호출 하나로 줄어듭니다.
+- hedged_search: 1순위 검색이 잠깐 안에 끝나지 않으면 대체 검색을 함께 보내고,
+  가장 먼저 결과를 돌려준 검색을 사용합니다. 전체 대기 시간은 deadline으로 제한됩니다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+ImageSearch = Callable[[], Awaitable[List[Dict[str, Any]]]]
+
+
+async def fan_out_searches(
+    searches: Sequence[ImageSearch],
+    limit: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    key: str = "id"
+) -> List[List[Dict[str, Any]]]:
+    """
+    이미지 검색들을 병렬로 실행합니다.
+
+    Args:
+        searches: 인자 없이 호출하면 이미지 리스트를 돌려주는 코루틴 함수 목록
+        limit: 고유 이미지가 이 개수만큼 모이면 남은 검색을 취소 (None이면 모두 실행)
+        concurrency: 동시 실행 검색 수 상한
+        key: 중복 판별에 쓸 이미지 필드
+
+    Returns:
+        검색별 결과 리스트 (입력 순서 유지, 앞서 도착한 결과와 겹치는 이미지는 제외)
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.image_search_concurrency)
+    results: List[List[Dict[str, Any]]] = [[] for _ in searches]
+    seen_ids = set()
+
+    async def run(index: int):
+        async with semaphore:
+            return index, await searches[index]()
+
+    tasks = [asyncio.create_task(run(index)) for index in range(len(searches))]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            try:
+                index, images = await finished
+            except Exception as e:
+                logger.warning(f"이미지 검색 실패: {str(e)}")
+                continue
+
+            for image in images or []:
+                image_id = image.get(key)
+                if image_id in seen_ids:
+                    continue
+                seen_ids.add(image_id)
+                results[index].append(image)
+
+            if limit is not None and len(seen_ids) >= limit:
+                break
+    finally:
+        cancelled = 0
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+                cancelled += 1
+        if cancelled:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.debug("이미지 검색 조기 종료", cancelled=cancelled, collected=len(seen_ids))
+
+    return results
+
+
+async def hedged_search(
+    primary: ImageSearch,
+    fallbacks: Sequence[ImageSearch],
+    hedge_delay: float,
+    deadline: float
+) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    1순위 검색과 대체 검색을 헤지 방식으로 실행합니다.
+
+    1순위 검색을 먼저 보내고, hedge_delay 안에 결과가 없거나 빈 결과가 오면 대체 검색을 모두 보냅니다.
+    이미지를 돌려준 첫 검색이 이기고 나머지는 취소됩니다.
+
+    Returns:
+        (검색 인덱스, 이미지 리스트) - 인덱스 0은 1순위, 1부터는 대체 검색. deadline까지 결과가 없으면 None
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    hedge_at = started + hedge_delay
+    deadline_at = started + deadline
+
+    task_index: Dict[asyncio.Task, int] = {asyncio.create_task(primary()): 0}
+    pending = set(task_index)
+    hedged = not fallbacks
+
+    try:
+        while True:
+            if not hedged and (loop.time() >= hedge_at or not pending):
+                for index, search in enumerate(fallbacks, start=1):
+                    task = asyncio.create_task(search())
+                    task_index[task] = index
+                    pending.add(task)
+                hedged = True
+                logger.debug("대체 이미지 검색 시작", elapsed=round(loop.time() - started, 3))
+
+            remaining = deadline_at - loop.time()
+            if not pending or remaining <= 0:
+                return None
+
+            timeout = remaining if hedged else min(remaining, max(0.0, hedge_at - loop.time()))
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            # 같은 순간에 끝난 검색이 여럿이면 우선순위가 높은(인덱스가 작은) 쪽 사용
+            for task in sorted(done, key=task_index.get):
+                try:
+                    images = task.result()
+                except Exception as e:
+                    logger.warning(f"이미지 검색 실패: {str(e)}")
+                    continue
+                if images:
+                    return task_index[task], images
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
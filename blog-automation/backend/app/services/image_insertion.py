@@ -0,0 +1,215 @@
+"""
+마크다운 본문 이미지 삽입 엔진
+
+본문을 한 번 스캔해 이미지를 넣을 수 있는 단락 경계와 경계까지의 누적 글자 수(prefix sum)를 구하고,
+누적 글자 수 배열에서 이분 탐색으로 이미지 위치를 고릅니다.
+
+- 빈 줄뿐 아니라 헤딩/코드 블록 앞도 경계로 인정 (빈 줄이 없는 본문에서도 계획한 만큼 삽입)
+- 리스트 항목 사이, 코드 블록 내부, 기존 이미지 바로 앞, 헤딩 바로 뒤, 본문 맨 끝에는 넣지 않음
+- 간격(spacing), 최대 개수(max_images), 대표 이미지 제외(skip_featured) 정책
+- 이미지 블록은 마크다운 또는 HTML(<figure>)로 출력
+"""
+import html
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.markdown_analyzer import FENCE_RE, HEADING_RE, IMAGE_RE, LIST_ITEM_RE
+
+LIST_MARKERS = frozenset('-*+0123456789')
+FENCE_MARKERS = frozenset('`~')
+
+OUTPUT_MARKDOWN = "markdown"
+OUTPUT_HTML = "html"
+
+
+@dataclass
+class ImageInsertionPolicy:
+    """이미지 삽입 정책"""
+    spacing: int = 500                 # 이미지 사이(및 본문 시작부터 첫 이미지까지) 최소 글자 수
+    max_images: Optional[int] = None   # 최대 삽입 수 (None이면 후보 이미지 수까지)
+    skip_featured: bool = True         # 대표 이미지와 같은 이미지는 본문에 넣지 않음
+    output: str = OUTPUT_MARKDOWN      # markdown, html
+
+
+@dataclass
+class ImageInsertionResult:
+    """이미지 삽입 결과"""
+    content: str
+    images: List[Dict[str, Any]] = field(default_factory=list)  # 실제로 삽입한 이미지 (본문 순서)
+
+    @property
+    def count(self) -> int:
+        return len(self.images)
+
+
+def find_boundaries(lines: List[str]) -> Tuple[List[int], List[int]]:
+    """
+    이미지를 넣을 수 있는 단락 경계를 찾습니다.
+
+    Returns:
+        (경계 직전 줄 인덱스 리스트, 경계까지의 누적 글자 수 리스트) - 누적 글자 수는 오름차순
+    """
+    positions: List[int] = []
+    offsets: List[int] = []
+    fence: Optional[str] = None
+    total = 0
+    # 다음 블록을 보고 확정하는 경계 후보 (줄 인덱스, 누적 글자 수, 리스트 항목 여부)
+    pending: Optional[Tuple[int, int, bool]] = None
+    last = len(lines) - 1
+
+    for index, line in enumerate(lines):
+        total += len(line)
+        stripped = line.strip()
+
+        # 코드 블록 내부 (닫는 줄 뒤는 경계 후보)
+        if fence is not None:
+            if stripped.startswith(fence):
+                fence = None
+                pending = (index, total, False)
+            continue
+        if not stripped:
+            continue
+
+        # 대부분의 줄은 일반 단락이므로 첫 글자로 정규식 검사 대상을 거름
+        first = stripped[0]
+        is_list_item = first in LIST_MARKERS and LIST_ITEM_RE.match(line) is not None
+        is_image = first == '!' and IMAGE_RE.match(stripped) is not None
+        if pending is not None:
+            # 리스트 중간이나 기존 이미지 바로 앞에는 넣지 않음
+            if not (pending[2] and is_list_item) and not is_image:
+                positions.append(pending[0])
+                offsets.append(pending[1])
+            pending = None
+
+        if first in FENCE_MARKERS:
+            fence_match = FENCE_RE.match(line)
+            if fence_match:
+                fence = fence_match.group(1)
+                continue
+        if is_image or (first == '#' and HEADING_RE.match(line)):
+            continue
+
+        # 다음 줄이 빈 줄/헤딩/코드 블록이면 블록의 끝 (맨 끝 줄은 다음 블록이 없으므로 후보 아님)
+        if index < last:
+            next_line = lines[index + 1].lstrip()
+            if (
+                not next_line
+                or (next_line[0] == '#' and HEADING_RE.match(lines[index + 1]))
+                or (next_line[0] in FENCE_MARKERS and FENCE_RE.match(lines[index + 1]))
+            ):
+                pending = (index, total, is_list_item)
+
+    return positions, offsets
+
+
+def plan_slots(offsets: List[int], total: int, count: int, spacing: int) -> List[int]:
+    """
+    누적 글자 수 배열에서 count개 이미지의 경계 인덱스를 고릅니다.
+    본문 길이에 고르게 목표 위치를 두고, 목표 이후 첫 경계를 이분 탐색으로 찾습니다.
+    """
+    if count <= 0 or not offsets:
+        return []
+
+    step = max(spacing, total / (count + 1))
+    slots: List[int] = []
+    last_offset = 0
+    lo = 0
+    for k in range(1, count + 1):
+        target = max(k * step, last_offset + spacing)
+        index = bisect_left(offsets, target, lo)
+        if index == len(offsets):
+            break
+        slots.append(index)
+        last_offset = offsets[index]
+        lo = index + 1
+    return slots
+
+
+def render_image(image: Dict[str, Any], output: str = OUTPUT_MARKDOWN) -> str:
+    """이미지 블록 (사진 출처 캡션 포함)"""
+    attribution = image.get("attribution") or {}
+    caption = f"사진: {attribution.get('photographer', '')} ({attribution.get('source', 'Unsplash')})"
+    alt_text = image.get("alt_text") or ""
+
+    if output == OUTPUT_HTML:
+        size = ""
+        if image.get("width") and image.get("height"):
+            size = f' width="{int(image["width"])}" height="{int(image["height"])}"'
+        return (
+            f'<figure><img src="{html.escape(image["url"])}" alt="{html.escape(alt_text)}"{size} loading="lazy">'
+            f'<figcaption>{html.escape(caption)}</figcaption></figure>'
+        )
+
+    alt_text = alt_text.replace('[', '').replace(']', '')
+    return f"![{alt_text}]({image['url']})\n*{caption}*"
+
+
+def _image_keys(image: Dict[str, Any]) -> List[str]:
+    return [image[key] for key in ("id", "url", "source_url") if image.get(key)]
+
+
+def select_images(
+    images: List[Dict[str, Any]],
+    featured: Optional[Dict[str, Any]] = None,
+    skip_featured: bool = True
+) -> List[Dict[str, Any]]:
+    """삽입 후보 이미지 (URL 없는 이미지, 중복, 대표 이미지 제외)"""
+    seen = set(_image_keys(featured)) if skip_featured and featured else set()
+    selected = []
+    for image in images:
+        keys = _image_keys(image)
+        if not image.get("url") or seen.intersection(keys):
+            continue
+        seen.update(keys)
+        selected.append(image)
+    return selected
+
+
+def insert_images(
+    content: str,
+    images: List[Dict[str, Any]],
+    policy: Optional[ImageInsertionPolicy] = None,
+    featured: Optional[Dict[str, Any]] = None
+) -> ImageInsertionResult:
+    """
+    본문 단락 경계에 이미지를 삽입합니다.
+
+    Args:
+        content: 마크다운 본문
+        images: 후보 이미지 (앞에서부터 사용)
+        policy: 삽입 정책 (기본: 500자 간격, 마크다운)
+        featured: 대표 이미지 (skip_featured면 본문 후보에서 제외)
+    """
+    policy = policy or ImageInsertionPolicy()
+    candidates = select_images(images, featured, policy.skip_featured)
+    if policy.max_images is not None:
+        candidates = candidates[:policy.max_images]
+    if not candidates or not content:
+        return ImageInsertionResult(content)
+
+    spacing = max(1, policy.spacing)
+    lines = content.split('\n')
+    positions, offsets = find_boundaries(lines)
+    total = len(content) - len(lines) + 1  # 줄바꿈을 뺀 글자 수 (누적 글자 수와 같은 기준)
+    count = min(len(candidates), max(1, total // spacing))
+    slots = plan_slots(offsets, total, count, spacing)
+    if not slots:
+        return ImageInsertionResult(content)
+
+    # 경계 사이 줄 묶음과 이미지 블록을 번갈아 이어 붙임
+    parts: List[str] = []
+    start = 0
+    used: List[Dict[str, Any]] = []
+    for image, slot in zip(candidates, slots):
+        end = positions[slot] + 1
+        parts.append('\n'.join(lines[start:end]))
+        parts.append(render_image(image, policy.output))
+        used.append(image)
+        start = end
+        # 다음 줄이 빈 줄이면 그 빈 줄이 이미지 뒤 구분 역할을 함
+        if start < len(lines) and not lines[start].strip():
+            start += 1
+    parts.append('\n'.join(lines[start:]))
+
+    return ImageInsertionResult('\n\n'.join(parts), used)
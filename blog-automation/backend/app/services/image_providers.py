@@ -0,0 +1,437 @@
+"""
+이미지 검색 공급자 (Unsplash, 로컬 캐시, Lorem Picsum)
+
+ImageService, UnsplashImageService, test_server가 각자 Unsplash 호출/재시도/대체 이미지를 구현하던 것을
+하나의 공급자 체인으로 합칩니다. 체인은 공급자를 순서대로 시도하고, 이미지를 돌려준 첫 공급자의 결과를 씁니다.
+
+- 공급자별 서킷 브레이커: 연속 실패가 기준을 넘으면 공급자를 차단하고, 차단 중에는 네트워크 호출 없이
+  바로 다음 공급자로 넘어감 (타임아웃을 여러 번 기다리지 않음)
+- recovery_timeout이 지나면 반개방(half-open) 상태에서 시험 호출 한 건만 보내 성공하면 다시 연결
+- 호출 한도 임박(QuotaExhaustedError)이나 취소는 공급자 장애로 세지 않음
+- Unsplash 결과만 검색 캐시에 저장하고, 로컬 캐시 공급자는 기간이 지난 결과라도 마지막 성공 결과를 반환
+"""
+import asyncio
+import time
+from hashlib import sha1
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import structlog
+
+from app.services.image_cache import ImageSearchCache
+from app.services.query_translator import translate_query
+from app.services.unsplash_quota import PRIORITY_EXTRA, QuotaExhaustedError, UnsplashQuotaLedger
+
+logger = structlog.get_logger()
+
+# 공급자 간에 공유하는 검색 캐시 namespace (공급자 결과 형식이 같으므로 서비스 구분 없음)
+CACHE_NAMESPACE = "unsplash"
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class ImageProviderError(Exception):
+    """공급자가 이미지 검색에 실패한 경우 (HTTP 오류 등)"""
+
+
+class CircuitOpenError(ImageProviderError):
+    """차단된 공급자를 호출하려 한 경우"""
+
+
+class CircuitBreaker:
+    """공급자별 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+        self.stats = {
+            "successes": 0,
+            "failures": 0,
+            "short_circuits": 0,
+            "opened": 0,
+        }
+
+    def is_open(self) -> bool:
+        """차단 중이고 아직 시험 호출 시각이 아닌지 여부 (상태를 바꾸지 않음)"""
+        if self.state == STATE_CLOSED:
+            return False
+        if self.state == STATE_HALF_OPEN:
+            return self._probing
+        return self._clock() - self.opened_at < self.recovery_timeout
+
+    def allow(self) -> bool:
+        """호출을 보내도 되는지 확인합니다. 반개방 상태에서는 시험 호출 한 건만 허용합니다."""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN and self._clock() - self.opened_at >= self.recovery_timeout:
+            self.state = STATE_HALF_OPEN
+            self._probing = False
+            logger.info("이미지 공급자 시험 호출", provider=self.name)
+        if self.state == STATE_HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.stats["short_circuits"] += 1
+        return False
+
+    def record_success(self):
+        self.stats["successes"] += 1
+        if self.state != STATE_CLOSED:
+            logger.info("이미지 공급자 복구", provider=self.name)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.stats["failures"] += 1
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                self.stats["opened"] += 1
+                logger.warning("이미지 공급자 차단", provider=self.name, failures=self.failures)
+            self.state = STATE_OPEN
+            self.opened_at = self._clock()
+        self._probing = False
+
+    def release(self):
+        """결과를 판정하지 않은 호출(한도 임박, 취소)의 시험 호출 자리를 돌려줍니다."""
+        self._probing = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "state": self.state, "consecutive_failures": self.failures}
+
+
+# 공급자 이름별 브레이커 (여러 체인이 같은 공급자 상태를 공유)
+circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+def get_circuit_breaker(name: str, failure_threshold: int = 3, recovery_timeout: float = 30.0) -> CircuitBreaker:
+    """공급자 이름에 해당하는 서킷 브레이커 반환"""
+    breaker = circuit_breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name, failure_threshold, recovery_timeout)
+        circuit_breakers[name] = breaker
+    return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """공급자별 브레이커 상태"""
+    return {name: breaker.get_stats() for name, breaker in circuit_breakers.items()}
+
+
+class ImageProvider:
+    """이미지 검색 공급자 인터페이스"""
+
+    name = "base"
+    # 결과를 검색 캐시에 저장할지 여부 (외부 API 결과만 저장)
+    cacheable = False
+    # 검색어와 상관없는 자리 채움 이미지인지 여부
+    placeholder = False
+
+    async def search(
+        self,
+        query: str,
+        count: int,
+        orientation: str = "landscape",
+        priority: str = PRIORITY_EXTRA
+    ) -> List[Dict[str, Any]]:
+        """
+        이미지를 검색합니다.
+
+        Returns:
+            표준 형식 이미지 리스트 (결과가 없으면 빈 리스트)
+
+        Raises:
+            ImageProviderError 등: 공급자 장애 (브레이커 실패로 기록)
+            QuotaExhaustedError: 호출 한도 임박 (장애로 기록하지 않음)
+        """
+        raise NotImplementedError
+
+
+class UnsplashProvider(ImageProvider):
+    """Unsplash 검색 API 공급자"""
+
+    name = "unsplash"
+    cacheable = True
+
+    def __init__(
+        self,
+        access_key: str,
+        quota: Optional[UnsplashQuotaLedger] = None,
+        client_factory: Optional[Callable[[], Any]] = None,
+        timeout: Any = 10.0,  # 초 또는 httpx.Timeout
+        base_url: str = "https://api.unsplash.com"
+    ):
+        self.access_key = access_key
+        self.quota = quota
+        self.client_factory = client_factory
+        self.timeout = timeout
+        self.base_url = base_url
+
+    def _client(self):
+        if self.client_factory is not None:
+            return self.client_factory()
+        # test_server.py처럼 앱 설정 없이 쓰는 경우를 위해 여기서 import
+        from app.core.http_client import get_httpx_client
+        return get_httpx_client()
+
+    async def search(
+        self,
+        query: str,
+        count: int,
+        orientation: str = "landscape",
+        priority: str = PRIORITY_EXTRA
+    ) -> List[Dict[str, Any]]:
+        # 한도에 닿기 전에 우선순위가 낮은 검색부터 생략
+        if self.quota is not None and not await self.quota.acquire(priority):
+            raise QuotaExhaustedError(query)
+
+        response = await self._client().get(
+            f"{self.base_url}/search/photos",
+            headers={
+                "Authorization": f"Client-ID {self.access_key}",
+                "Accept-Version": "v1"
+            },
+            params={
+                "query": query,
+                "per_page": count,
+                "orientation": orientation,
+                "content_filter": "high",
+                "order_by": "relevant"
+            },
+            timeout=self.timeout
+        )
+        if self.quota is not None:
+            await self.quota.record(response.headers, response.status_code)
+
+        if response.status_code != 200:
+            raise ImageProviderError(f"Unsplash HTTP {response.status_code}")
+
+        images = [self._format(photo, query) for photo in response.json().get("results", [])]
+        logger.info("Unsplash 이미지 검색 성공", query=query, count=len(images))
+        return images
+
+    def _format(self, photo: Dict[str, Any], query: str) -> Dict[str, Any]:
+        """Unsplash 결과를 표준 포맷으로 변환"""
+        urls = photo.get("urls", {})
+        user_url = photo.get("user", {}).get("links", {}).get("html") or ""
+        return {
+            "id": photo.get("id"),
+            "url": urls.get("regular"),
+            "thumb_url": urls.get("thumb"),
+            "small_url": urls.get("small"),
+            "download_url": urls.get("full"),
+            "alt_text": photo.get("alt_description") or f"{query} 관련 이미지",
+            "attribution": {
+                "photographer": photo.get("user", {}).get("name") or "Unknown",
+                "photographer_url": user_url,
+                "profile_url": user_url,
+                "source": "Unsplash",
+                "source_url": photo.get("links", {}).get("html") or ""
+            },
+            "width": photo.get("width", 800),
+            "height": photo.get("height", 600)
+        }
+
+
+class LocalCacheProvider(ImageProvider):
+    """검색 캐시에 남아 있는 마지막 성공 결과 (기간이 지난 결과 포함, 네트워크 호출 없음)"""
+
+    name = "local_cache"
+
+    def __init__(self, cache: ImageSearchCache, namespace: str = CACHE_NAMESPACE):
+        self.cache = cache
+        self.namespace = namespace
+
+    async def search(
+        self,
+        query: str,
+        count: int,
+        orientation: str = "landscape",
+        priority: str = PRIORITY_EXTRA
+    ) -> List[Dict[str, Any]]:
+        return await self.cache.peek(self.namespace, query, count, orientation) or []
+
+
+class PicsumProvider(ImageProvider):
+    """Lorem Picsum 대체 이미지 (항상 성공, 같은 쿼리는 같은 이미지)"""
+
+    name = "picsum"
+    placeholder = True
+
+    def images(self, query: str, count: int) -> List[Dict[str, Any]]:
+        # hash()는 프로세스마다 달라지므로 sha1로 시드 고정
+        query_seed = int(sha1(query.encode('utf-8')).hexdigest()[:8], 16) % 1000
+        images = []
+        for i in range(count):
+            image_seed = (query_seed + i * 100) % 1000
+            images.append({
+                "id": f"picsum_{query_seed}_{i}",
+                "url": f"https://picsum.photos/800/600?random={image_seed}",
+                "thumb_url": f"https://picsum.photos/300/200?random={image_seed}",
+                "download_url": f"https://picsum.photos/1200/800?random={image_seed}",
+                "alt_text": f"{query} 관련 이미지 {i+1}",
+                "attribution": {
+                    "photographer": "Lorem Picsum",
+                    "photographer_url": "https://picsum.photos",
+                    "source": "Lorem Picsum",
+                    "source_url": "https://picsum.photos"
+                },
+                "width": 800,
+                "height": 600
+            })
+        return images
+
+    async def search(
+        self,
+        query: str,
+        count: int,
+        orientation: str = "landscape",
+        priority: str = PRIORITY_EXTRA
+    ) -> List[Dict[str, Any]]:
+        return self.images(query, count)
+
+
+class ImageProviderChain:
+    """공급자를 순서대로 시도하는 이미지 검색 (공급자별 서킷 브레이커 + 캐시)"""
+
+    def __init__(
+        self,
+        providers: Sequence[ImageProvider],
+        cache: Optional[ImageSearchCache] = None,
+        breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        namespace: str = CACHE_NAMESPACE
+    ):
+        self.providers = list(providers)
+        self.cache = cache
+        self.namespace = namespace
+        self.breakers = breakers if breakers is not None else {
+            provider.name: get_circuit_breaker(provider.name) for provider in self.providers
+        }
+
+    async def _call(
+        self,
+        provider: ImageProvider,
+        query: str,
+        count: int,
+        orientation: str,
+        priority: str
+    ) -> List[Dict[str, Any]]:
+        breaker = self.breakers[provider.name]
+        if not breaker.allow():
+            raise CircuitOpenError(provider.name)
+
+        try:
+            images = await provider.search(query, count, orientation, priority)
+        except (QuotaExhaustedError, asyncio.CancelledError):
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return images
+
+    async def _search_provider(
+        self,
+        provider: ImageProvider,
+        query: str,
+        count: int,
+        orientation: str,
+        priority: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        if provider.cacheable and self.cache is not None:
+            # 같은 쿼리는 캐시된 결과 사용 (API 한도 절약)
+            return await self.cache.get_or_fetch(
+                self.namespace, query, count, orientation,
+                lambda: self._call(provider, query, count, orientation, priority)
+            )
+        return await self._call(provider, query, count, orientation, priority)
+
+    async def search(
+        self,
+        query: str,
+        count: int = 3,
+        orientation: str = "landscape",
+        priority: str = PRIORITY_EXTRA,
+        allow_placeholder: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        공급자를 순서대로 시도해 이미지를 돌려준 첫 공급자의 결과를 반환합니다.
+        모든 공급자가 실패하거나 결과가 없으면 빈 리스트를 반환합니다.
+
+        allow_placeholder가 False이면 Lorem Picsum 같은 자리 채움 공급자는 건너뜁니다
+        (호출하는 쪽이 다른 검색어로 재시도할 수 있도록).
+        """
+        # 한국어 검색어는 영어로 변환 (Unsplash 결과 품질, 캐시 키 공유)
+        query = translate_query(query)
+
+        for provider in self.providers:
+            if provider.placeholder and not allow_placeholder:
+                continue
+            breaker = self.breakers[provider.name]
+            if breaker.is_open():
+                # 차단 중에는 캐시 조회도 건너뜀 (캐시 결과는 로컬 캐시 공급자가 반환)
+                breaker.stats["short_circuits"] += 1
+                continue
+
+            try:
+                images = await self._search_provider(provider, query, count, orientation, priority)
+            except QuotaExhaustedError:
+                logger.info("Unsplash 호출 한도 임박 - 다음 공급자 사용", priority=priority)
+                continue
+            except Exception as e:
+                logger.warning(f"이미지 공급자 검색 실패: {str(e)}", provider=provider.name)
+                continue
+
+            if images:
+                if provider is not self.providers[0]:
+                    logger.info("대체 이미지 공급자 사용", provider=provider.name, query=query)
+                return images
+
+        return []
+
+
+# 글로벌 인스턴스
+image_provider_chain = None
+
+def get_image_provider_chain() -> ImageProviderChain:
+    """앱 설정으로 구성한 이미지 공급자 체인 반환 (Unsplash → 로컬 캐시 → Lorem Picsum)"""
+    global image_provider_chain
+    if image_provider_chain is None:
+        from app.core.config import settings
+        from app.services.image_cache import get_image_search_cache
+        from app.services.unsplash_quota import get_unsplash_quota
+
+        cache = get_image_search_cache()
+        providers: List[ImageProvider] = []
+        if settings.unsplash_access_key:
+            providers.append(UnsplashProvider(settings.unsplash_access_key, quota=get_unsplash_quota()))
+        providers.extend([LocalCacheProvider(cache), PicsumProvider()])
+
+        image_provider_chain = ImageProviderChain(
+            providers,
+            cache=cache,
+            breakers={
+                provider.name: get_circuit_breaker(
+                    provider.name,
+                    failure_threshold=settings.image_provider_failure_threshold,
+                    recovery_timeout=settings.image_provider_recovery_seconds
+                )
+                for provider in providers
+            }
+        )
+    return image_provider_chain
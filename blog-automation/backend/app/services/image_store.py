@@ -0,0 +1,237 @@
+"""
+로컬 리사이즈 이미지 캐시
+
+발행된 포스트와 대시보드가 images.unsplash.com / picsum.photos 원본을 직접 불러오지 않도록,
+선택된 이미지를 한 번만 내려받아 용도별 크기(thumb, content, featured)로 줄여 디스크에 저장합니다.
+
+- 원본 바이트의 해시로 저장 (같은 사진을 다른 URL로 받아도 한 벌만 저장)
+- URL → 해시 색인을 디스크에 남겨 재시작 후에도 다시 내려받지 않음
+- 리사이즈는 오프로드 풀(프로세스)에서 실행
+- /images/{digest}/{variant}.jpg 라우트가 긴 캐시 헤더로 파일을 제공
+"""
+import asyncio
+import io
+import os
+import re
+from hashlib import sha1, sha256
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import structlog
+
+from app.core.config import settings
+from app.core.executor import offload
+from app.core.http_client import get_http_session
+
+logger = structlog.get_logger()
+
+# 용도별 최대 가로 크기 (원본보다 크게 늘리지는 않음)
+IMAGE_VARIANTS = {
+    "thumb": 400,
+    "content": 800,
+    "featured": 1200,
+}
+
+DIGEST_RE = re.compile(r'^[0-9a-f]{32}$')
+MAX_DOWNLOAD_BYTES = 15 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+# 발행된 포스트 독자가 접근할 수 없는 주소
+LOCAL_HOSTS = frozenset(['localhost', '127.0.0.1', '0.0.0.0', '::1'])
+
+_inactive_warned = False
+
+
+def image_store_active() -> bool:
+    """
+    이미지 URL을 로컬 캐시 주소로 바꿔도 되는지 확인합니다.
+    image_store_enabled가 켜져 있고 공개 주소가 localhost가 아닌 경우에만 True입니다
+    (localhost로 바뀐 URL이 저장/발행되면 독자에게 이미지가 보이지 않음).
+    """
+    global _inactive_warned
+    if not settings.image_store_enabled:
+        return False
+    host = urlparse(settings.image_public_base_url or '').hostname
+    if host and host not in LOCAL_HOSTS:
+        return True
+    if not _inactive_warned:
+        logger.warning(
+            "image_public_base_url이 외부 주소가 아니어서 로컬 이미지 캐시를 사용하지 않습니다",
+            image_public_base_url=settings.image_public_base_url
+        )
+        _inactive_warned = True
+    return False
+
+
+def render_variants(data: bytes, widths: Dict[str, int], quality: int = 82) -> Dict[str, bytes]:
+    """원본 이미지를 용도별 크기의 JPEG로 변환합니다 (프로세스 풀에서 실행)."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as source:
+        source = source.convert("RGB")
+        rendered = {}
+        for variant, width in widths.items():
+            image = source
+            if source.width > width:
+                height = round(source.height * width / source.width)
+                image = source.resize((width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+            rendered[variant] = buffer.getvalue()
+        return rendered
+
+
+class LocalImageStore:
+    """해시 주소 방식의 로컬 리사이즈 이미지 저장소"""
+
+    def __init__(self, root_dir: str, public_base_url: str = "", variants: Optional[Dict[str, int]] = None):
+        self.root_dir = root_dir
+        self.public_base_url = public_base_url.rstrip('/')
+        self.variants = variants or IMAGE_VARIANTS
+
+        self._url_index: Dict[str, str] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        os.makedirs(os.path.join(self.root_dir, "urls"), exist_ok=True)
+
+    # 경로
+
+    def variant_path(self, digest: str, variant: str) -> Optional[str]:
+        """저장된 변환본 파일 경로 (잘못된 이름이거나 없으면 None)"""
+        if not DIGEST_RE.match(digest) or variant not in self.variants:
+            return None
+        path = os.path.join(self.root_dir, digest[:2], digest, f"{variant}.jpg")
+        return path if os.path.exists(path) else None
+
+    def variant_url(self, digest: str, variant: str) -> str:
+        """변환본을 제공하는 라우트 URL"""
+        return f"{self.public_base_url}/images/{digest}/{variant}.jpg"
+
+    def _index_path(self, url: str) -> str:
+        return os.path.join(self.root_dir, "urls", sha1(url.encode('utf-8')).hexdigest())
+
+    def _has_variants(self, digest: str) -> bool:
+        return all(self.variant_path(digest, variant) is not None for variant in self.variants)
+
+    def _find_cached(self, url: str, digest: Optional[str]) -> Optional[str]:
+        """색인 파일을 읽고 변환본이 모두 있는지 확인합니다 (스레드 풀에서 실행)."""
+        if digest is None:
+            try:
+                with open(self._index_path(url), encoding='utf-8') as f:
+                    digest = f.read().strip()
+            except FileNotFoundError:
+                return None
+        # 색인은 있지만 파일이 지워진 경우 다시 받음
+        return digest if self._has_variants(digest) else None
+
+    async def _lookup_url(self, url: str) -> Optional[str]:
+        # 색인/파일 확인은 이벤트 루프 밖에서 한 번에 실행
+        digest = await offload(self._find_cached, url, self._url_index.get(url))
+        if digest is not None:
+            self._url_index[url] = digest
+        return digest
+
+    def _write_variants(self, digest: str, rendered: Dict[str, bytes]):
+        directory = os.path.join(self.root_dir, digest[:2], digest)
+        os.makedirs(directory, exist_ok=True)
+        for variant, data in rendered.items():
+            path = os.path.join(directory, f"{variant}.jpg")
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    def _write_index(self, url: str, digest: str):
+        with open(self._index_path(url), 'w', encoding='utf-8') as f:
+            f.write(digest)
+        self._url_index[url] = digest
+
+    # 내려받기
+
+    async def _download(self, url: str) -> bytes:
+        """이미지를 조각 단위로 내려받습니다 (크기 제한 초과 시 중단)."""
+        session = get_http_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise ValueError(f"HTTP {response.status}")
+            chunks = []
+            size = 0
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_DOWNLOAD_BYTES:
+                    raise ValueError("이미지가 너무 큽니다")
+                chunks.append(chunk)
+            return b''.join(chunks)
+
+    async def _cache(self, url: str) -> str:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.image_store_download_concurrency)
+
+        async with self._semaphore:
+            data = await self._download(url)
+
+        digest = sha256(data).hexdigest()[:32]
+        if not await offload(self._has_variants, digest):
+            rendered = await offload(render_variants, data, self.variants, kind="process")
+            await offload(self._write_variants, digest, rendered)
+        await offload(self._write_index, url, digest)
+
+        logger.info("이미지 로컬 캐시 저장", url=url, digest=digest, size=len(data))
+        return digest
+
+    async def cache_image(self, url: str) -> str:
+        """이미지를 내려받아 변환본을 저장하고 해시를 반환합니다 (이미 있으면 바로 반환)."""
+        digest = await self._lookup_url(url)
+        if digest is not None:
+            return digest
+
+        # 같은 URL 동시 요청은 한 번만 내려받음
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._cache(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
+
+    async def localize_image(self, image: Dict[str, Any], main_variant: str = "content") -> Dict[str, Any]:
+        """
+        이미지 정보의 url/thumb_url을 로컬 변환본 URL로 바꾼 사본을 반환합니다.
+        원본 URL은 source_url에 남기고, 실패하면 원래 정보를 그대로 반환합니다.
+        """
+        source_url = image.get("url")
+        if not source_url:
+            return image
+        try:
+            digest = await self.cache_image(source_url)
+        except Exception as e:
+            logger.warning(f"이미지 로컬 캐시 실패 - 원본 URL 사용: {str(e)}", url=source_url)
+            return image
+
+        return {
+            **image,
+            "url": self.variant_url(digest, main_variant),
+            "thumb_url": self.variant_url(digest, "thumb"),
+            "source_url": source_url,
+            "local_digest": digest
+        }
+
+    async def localize_images(self, images: List[Dict[str, Any]], main_variant: str = "content") -> List[Dict[str, Any]]:
+        """여러 이미지를 동시에 로컬 캐시로 바꿉니다."""
+        return list(await asyncio.gather(*[
+            self.localize_image(image, main_variant) for image in images
+        ]))
+
+
+# 글로벌 인스턴스
+image_store = None
+
+def get_image_store() -> LocalImageStore:
+    """로컬 이미지 저장소 인스턴스 반환"""
+    global image_store
+    if image_store is None:
+        image_store = LocalImageStore(
+            root_dir=settings.image_store_dir,
+            public_base_url=settings.image_public_base_url or ""
+        )
+    return image_store
@@ -0,0 +1,248 @@
+"""
+단락 단위 증분 SEO 채점
+
+문서를 단락(마크다운 빈 줄 / HTML 블록 요소) 단위로 나누고 단락 해시별 지표를 캐시합니다.
+수정 후에는 바뀐 단락만 다시 분석하고, 문서 합계(키워드 수, 단어/문장 수, 헤딩 통계)는
+빠진 단락을 빼고 새 단락을 더하는 방식으로 갱신합니다.
+편집 중 키 입력마다 호출해도 될 만큼 가볍게 유지하는 것이 목적입니다.
+"""
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Dict, List, Optional, Tuple
+import re
+
+from bs4 import BeautifulSoup
+import structlog
+
+from app.services.keyword_matcher import get_keyword_matcher
+from app.services.markdown_analyzer import FENCE_RE, tokenize, blocks_to_text, looks_like_markdown
+from app.services.seo_optimizer import SEOOptimizer
+
+logger = structlog.get_logger()
+
+SENTENCE_BREAK_RE = re.compile(r'[.!?]+')
+HTML_BLOCK_END_RE = re.compile(r'</(?:p|h[1-6]|ul|ol|blockquote|pre|table|figure)>', re.IGNORECASE)
+
+# 문서별 채점기 개수 상한 (LRU)
+MAX_SCORERS = 512
+
+
+@dataclass
+class ParagraphMetrics:
+    """단락 하나의 SEO 지표"""
+    word_count: int
+    sentence_breaks: int
+    keyword_counts: Dict[str, int]
+    headings: List[Tuple[int, str]] = field(default_factory=list)
+
+
+def split_markdown_paragraphs(content: str) -> List[str]:
+    """빈 줄 기준으로 단락을 나눕니다 (코드 블록 안의 빈 줄은 무시)."""
+    paragraphs: List[str] = []
+    current: List[str] = []
+    fence: Optional[str] = None
+
+    for line in content.split('\n'):
+        if fence is not None:
+            current.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+            continue
+
+        fence_match = FENCE_RE.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+            current.append(line)
+            continue
+
+        if not line.strip():
+            if current:
+                paragraphs.append('\n'.join(current))
+                current = []
+            continue
+        current.append(line)
+
+    if current:
+        paragraphs.append('\n'.join(current))
+    return paragraphs
+
+
+def split_html_paragraphs(content: str) -> List[str]:
+    """블록 요소 닫는 태그 기준으로 HTML을 단락으로 나눕니다."""
+    paragraphs: List[str] = []
+    start = 0
+    for match in HTML_BLOCK_END_RE.finditer(content):
+        chunk = content[start:match.end()].strip()
+        if chunk:
+            paragraphs.append(chunk)
+        start = match.end()
+    tail = content[start:].strip()
+    if tail:
+        paragraphs.append(tail)
+    return paragraphs
+
+
+class IncrementalSEOScorer:
+    """문서 하나에 대한 증분 SEO 채점기
+
+    같은 키워드 집합으로 연속된 수정본을 채점할 때 사용합니다.
+    키워드가 바뀌면 단락 캐시가 무효가 되므로 새 인스턴스를 만들어야 합니다.
+    """
+
+    def __init__(
+        self,
+        keywords: List[str],
+        content_format: str = "markdown",
+        optimizer: Optional[SEOOptimizer] = None
+    ):
+        self.keywords = list(keywords)
+        self.content_format = content_format
+        self.optimizer = optimizer or SEOOptimizer()
+        self.matcher = get_keyword_matcher(
+            self.keywords, korean_boundaries=self.optimizer.korean_keyword_boundaries
+        )
+
+        self._cache: Dict[str, ParagraphMetrics] = {}
+        self._paragraph_hashes: List[str] = []
+
+        # 문서 합계 (델타로 갱신)
+        self._word_count = 0
+        self._sentence_breaks = 0
+        self._keyword_counts: Counter = Counter()
+        self._heading_counts: Counter = Counter()
+
+        self.last_reanalyzed = 0
+
+    @property
+    def paragraph_count(self) -> int:
+        return len(self._paragraph_hashes)
+
+    def _split(self, content: str) -> List[str]:
+        if self.content_format == "markdown":
+            return split_markdown_paragraphs(content)
+        return split_html_paragraphs(content)
+
+    def _analyze_paragraph(self, paragraph: str) -> ParagraphMetrics:
+        if self.content_format == "markdown":
+            blocks = tokenize(paragraph)
+            text = blocks_to_text(blocks)
+            headings = [
+                (block.level, block.text.strip())
+                for block in blocks if block.kind == 'heading' and block.level <= 3
+            ]
+        else:
+            soup = BeautifulSoup(paragraph, 'html.parser')
+            text = soup.get_text()
+            headings = [
+                (int(tag.name[1]), tag.get_text().strip())
+                for tag in soup.find_all(['h1', 'h2', 'h3'])
+            ]
+
+        return ParagraphMetrics(
+            word_count=len(text.split()),
+            sentence_breaks=len(SENTENCE_BREAK_RE.findall(text)),
+            keyword_counts=self.matcher.count(text),
+            headings=headings
+        )
+
+    def _apply(self, metrics: ParagraphMetrics, sign: int):
+        self._word_count += sign * metrics.word_count
+        self._sentence_breaks += sign * metrics.sentence_breaks
+        for keyword, count in metrics.keyword_counts.items():
+            self._keyword_counts[keyword] += sign * count
+        for level, _ in metrics.headings:
+            self._heading_counts[level] += sign
+
+    def update(self, content: str) -> Dict:
+        """새 본문으로 채점 상태를 갱신하고 분석 결과를 반환합니다."""
+        paragraphs = self._split(content)
+        new_hashes = []
+        reanalyzed = 0
+
+        for paragraph in paragraphs:
+            digest = blake2b(paragraph.encode('utf-8'), digest_size=16).hexdigest()
+            new_hashes.append(digest)
+            if digest not in self._cache:
+                self._cache[digest] = self._analyze_paragraph(paragraph)
+                reanalyzed += 1
+
+        # 빠진 단락은 빼고 새로 생긴 단락은 더함 (같은 단락이 여러 번 나오는 경우도 처리)
+        old_counter = Counter(self._paragraph_hashes)
+        new_counter = Counter(new_hashes)
+        for digest, count in (old_counter - new_counter).items():
+            for _ in range(count):
+                self._apply(self._cache[digest], -1)
+        for digest, count in (new_counter - old_counter).items():
+            for _ in range(count):
+                self._apply(self._cache[digest], 1)
+
+        self._paragraph_hashes = new_hashes
+        self.last_reanalyzed = reanalyzed
+
+        # 현재 문서에 없는 단락 캐시는 일정 크기를 넘으면 정리
+        if len(self._cache) > len(new_counter) * 4 + 64:
+            self._cache = {digest: self._cache[digest] for digest in new_counter}
+
+        return self.analysis()
+
+    def analysis(self) -> Dict:
+        """현재 합계로 SEOOptimizer.analyze_content와 같은 형식의 결과를 만듭니다."""
+        heading_texts = {1: [], 2: [], 3: []}
+        for digest in self._paragraph_hashes:
+            for level, text in self._cache[digest].headings:
+                heading_texts[level].append(text)
+
+        heading_analysis = {
+            "h1_count": self._heading_counts[1],
+            "h2_count": self._heading_counts[2],
+            "h3_count": self._heading_counts[3],
+            "total_headings": self._heading_counts[1] + self._heading_counts[2] + self._heading_counts[3],
+            "heading_texts": heading_texts[1] + heading_texts[2] + heading_texts[3]
+        }
+
+        keyword_density = self.optimizer._keyword_density_from_counts(
+            self._keyword_counts, self.keywords, self._word_count
+        )
+        # 전체 텍스트를 문장 구분자로 나눈 조각 수 = 구분자 수 + 1
+        readability_score = self.optimizer._readability_from_counts(
+            self._word_count, self._sentence_breaks + 1
+        )
+
+        return self.optimizer._build_analysis(keyword_density, readability_score, heading_analysis)
+
+
+_scorers: "OrderedDict[str, IncrementalSEOScorer]" = OrderedDict()
+
+
+def get_incremental_scorer(
+    document_key: str,
+    keywords: List[str],
+    content_format: str = "markdown"
+) -> IncrementalSEOScorer:
+    """문서별 증분 채점기 반환 (키워드나 형식이 바뀌면 새로 생성)"""
+    scorer = _scorers.get(document_key)
+    if scorer is None or scorer.keywords != list(keywords) or scorer.content_format != content_format:
+        scorer = IncrementalSEOScorer(keywords, content_format=content_format)
+        _scorers[document_key] = scorer
+    _scorers.move_to_end(document_key)
+
+    while len(_scorers) > MAX_SCORERS:
+        _scorers.popitem(last=False)
+
+    return scorer
+
+
+def score_content_update(document_key: str, content: str, keywords: List[str]) -> Dict:
+    """수정된 본문을 증분 채점합니다."""
+    content_format = "markdown" if looks_like_markdown(content) else "html"
+    scorer = get_incremental_scorer(document_key, keywords, content_format)
+    result = scorer.update(content)
+
+    logger.debug(
+        "Incremental SEO rescoring",
+        document=document_key,
+        reanalyzed_paragraphs=scorer.last_reanalyzed,
+        total_paragraphs=scorer.paragraph_count
+    )
+    return result
@@ -0,0 +1,151 @@
+"""
+Aho-Corasick 기반 다중 키워드 매칭 엔진
+
+키워드 집합마다 오토마톤을 한 번만 빌드하고, 본문을 한 번만 훑어서
+모든 키워드의 출현 위치와 횟수를 계산합니다.
+SEO 점수 계산, 이미지 배치, 내부 링크 등 키워드 출현이 필요한 곳에서 공용으로 사용합니다.
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+# 키워드 뒤에 붙어도 같은 어절로 보는 한국어 조사/어미 (긴 것부터 매칭)
+KOREAN_PARTICLES: Tuple[str, ...] = tuple(sorted({
+    "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도", "만", "로", "으로",
+    "에서", "에게", "께", "한테", "부터", "까지", "보다", "처럼", "같이", "마다", "이나", "나",
+    "이란", "란", "이라", "라", "이며", "며", "이고", "고", "이다", "다", "입니다", "이에요", "예요",
+    "에는", "에서는", "으로는", "로는", "와는", "과는", "에도", "으로도", "로도", "만의", "들", "들은",
+    "들이", "들을", "들의", "를통해", "에대한", "에대해",
+}, key=len, reverse=True))
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """키워드 집합에 대한 Aho-Corasick 오토마톤
+
+    Args:
+        keywords: 매칭할 키워드 리스트 (대소문자 무시)
+        korean_boundaries: True면 어절 경계를 지킨 매칭만 셉니다.
+            키워드 앞은 어절 시작이어야 하고, 뒤는 어절 끝이거나 조사/어미만 붙어야 합니다.
+            ("인공지능은" O, "비인공지능" X, "AI" in "MAIL" X)
+    """
+
+    def __init__(self, keywords: Iterable[str], korean_boundaries: bool = False):
+        self.keywords: List[str] = []
+        self.korean_boundaries = korean_boundaries
+
+        # 트라이: goto[state] = {char: next_state}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # output[state] = 해당 상태에서 끝나는 키워드 인덱스 목록 (fail 체인 포함)
+        self._output: List[List[int]] = [[]]
+        self._lengths: List[int] = []
+        # 입력 키워드 -> 고유 키워드 인덱스 (대소문자만 다른 중복 키워드도 같은 카운트를 공유)
+        self._aliases: Dict[str, int] = {}
+
+        unique: Dict[str, int] = {}
+        for keyword in keywords:
+            normalized = keyword.strip().lower()
+            if not normalized:
+                continue
+            if normalized not in unique:
+                unique[normalized] = len(self.keywords)
+                self._add(normalized, unique[normalized])
+                self.keywords.append(keyword.strip())
+                self._lengths.append(len(normalized))
+            self._aliases.setdefault(keyword, unique[normalized])
+
+        self._build()
+
+    def _add(self, word: str, index: int):
+        state = 0
+        for ch in word:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append(index)
+
+    def _build(self):
+        """BFS로 실패 링크를 계산하고 출력 집합을 병합합니다."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str):
+        """(키워드 인덱스, 시작 위치, 끝 위치) 튜플을 순서대로 반환합니다."""
+        if not self.keywords:
+            return
+        lowered = text.lower()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for position, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            for index in output[state]:
+                start = position - self._lengths[index] + 1
+                end = position + 1
+                if self.korean_boundaries and not self._at_boundary(lowered, start, end):
+                    continue
+                yield index, start, end
+
+    def _at_boundary(self, text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if end >= len(text) or not _is_word_char(text[end]):
+            return True
+        # 키워드 뒤에 조사/어미가 붙고 그 뒤가 어절 끝이면 허용 ("AI는", "인공지능으로")
+        for particle in KOREAN_PARTICLES:
+            if text.startswith(particle, end):
+                tail = end + len(particle)
+                if tail >= len(text) or not _is_word_char(text[tail]):
+                    return True
+        return False
+
+    def find_all(self, text: str) -> List[Tuple[str, int, int]]:
+        """(키워드, 시작 위치, 끝 위치) 리스트를 반환합니다."""
+        return [(self.keywords[index], start, end) for index, start, end in self.iter_matches(text)]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """본문을 한 번 훑어서 입력 키워드별 출현 횟수를 반환합니다."""
+        counts = [0] * len(self.keywords)
+        for index, _, _ in self.iter_matches(text):
+            counts[index] += 1
+        return {keyword: counts[index] for keyword, index in self._aliases.items()}
+
+    def first_positions(self, text: str) -> Dict[str, int]:
+        """입력 키워드별 첫 출현 위치를 반환합니다 (없으면 포함하지 않음)."""
+        first: Dict[int, int] = {}
+        for index, start, _ in self.iter_matches(text):
+            first.setdefault(index, start)
+        return {keyword: first[index] for keyword, index in self._aliases.items() if index in first}
+
+
+@lru_cache(maxsize=256)
+def _cached_matcher(keywords: Tuple[str, ...], korean_boundaries: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, korean_boundaries=korean_boundaries)
+
+
+def get_keyword_matcher(keywords: Iterable[str], korean_boundaries: bool = False) -> KeywordMatcher:
+    """키워드 집합별로 캐시된 KeywordMatcher 인스턴스 반환"""
+    return _cached_matcher(tuple(keywords), korean_boundaries)
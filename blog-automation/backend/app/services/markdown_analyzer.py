@@ -0,0 +1,146 @@
+"""
+마크다운 토큰 스트림 분석기
+
+Claude가 생성하는 마크다운 본문을 HTML로 렌더링하지 않고 한 번의 라인 스캔으로
+헤딩, 단락, 리스트, 이미지, 코드 블록 토큰으로 나눕니다.
+SEOOptimizer의 마크다운 경로가 이 토큰으로 HTML 경로와 같은 지표를 계산합니다.
+"""
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+import re
+
+HEADING_RE = re.compile(r'^ {0,3}(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$')
+LIST_ITEM_RE = re.compile(r'^[ \t]*(?:([-*+])|(\d{1,9})[.)])[ \t]+(.*)$')
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+HR_RE = re.compile(r'^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+BLOCKQUOTE_RE = re.compile(r'^ {0,3}>[ \t]?(.*)$')
+IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
+LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+EMPHASIS_RE = re.compile(r'(\*{1,3}|_{1,3})(?=\S)(.+?)(?<=\S)\1')
+CODE_SPAN_RE = re.compile(r'`+([^`]*)`+')
+STRIKE_RE = re.compile(r'~~(.+?)~~')
+ESCAPE_RE = re.compile(r'\\([\\`*_{}\[\]()#+\-.!>~|])')
+
+
+@dataclass
+class MarkdownBlock:
+    """마크다운 블록 토큰
+
+    kind: heading, paragraph, list_item, image, code
+    """
+    kind: str
+    text: str
+    level: int = 0
+    url: Optional[str] = None
+    ordered: bool = False
+
+
+def strip_inline(text: str) -> str:
+    """인라인 마크업을 제거하고 HTML get_text()와 같은 텍스트를 반환합니다."""
+    if not text:
+        return text
+    text = IMAGE_RE.sub('', text)
+    text = LINK_RE.sub(r'\1', text)
+    text = CODE_SPAN_RE.sub(r'\1', text)
+    text = STRIKE_RE.sub(r'\1', text)
+    text = EMPHASIS_RE.sub(r'\2', text)
+    text = ESCAPE_RE.sub(r'\1', text)
+    return text
+
+
+def iter_blocks(content: str) -> Iterator[MarkdownBlock]:
+    """마크다운을 블록 토큰 스트림으로 변환합니다."""
+    paragraph: List[str] = []
+    fence: Optional[str] = None
+    code: List[str] = []
+
+    def flush_paragraph():
+        if paragraph:
+            text = strip_inline('\n'.join(paragraph))
+            paragraph.clear()
+            # 이미지만 있는 줄은 단락으로 치지 않음 (HTML get_text()에도 텍스트가 없음)
+            if text.strip():
+                return MarkdownBlock('paragraph', text)
+        return None
+
+    for line in content.split('\n'):
+        # 코드 블록 내부
+        if fence is not None:
+            if line.strip().startswith(fence):
+                yield MarkdownBlock('code', '\n'.join(code))
+                code = []
+                fence = None
+            else:
+                code.append(line)
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            block = flush_paragraph()
+            if block:
+                yield block
+            continue
+
+        fence_match = FENCE_RE.match(line)
+        if fence_match:
+            block = flush_paragraph()
+            if block:
+                yield block
+            fence = fence_match.group(1)
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            block = flush_paragraph()
+            if block:
+                yield block
+            yield MarkdownBlock('heading', strip_inline(heading.group(2)), level=len(heading.group(1)))
+            continue
+
+        if HR_RE.match(line):
+            block = flush_paragraph()
+            if block:
+                yield block
+            continue
+
+        item = LIST_ITEM_RE.match(line)
+        if item:
+            block = flush_paragraph()
+            if block:
+                yield block
+            for image in IMAGE_RE.finditer(item.group(3)):
+                yield MarkdownBlock('image', image.group(1), url=image.group(2))
+            yield MarkdownBlock('list_item', strip_inline(item.group(3)), ordered=item.group(2) is not None)
+            continue
+
+        quote = BLOCKQUOTE_RE.match(line)
+        if quote:
+            line = quote.group(1)
+
+        # 단락 내 이미지 (단독 이미지 줄 포함)
+        for image in IMAGE_RE.finditer(line):
+            yield MarkdownBlock('image', image.group(1), url=image.group(2))
+        paragraph.append(line)
+
+    if fence is not None and code:
+        yield MarkdownBlock('code', '\n'.join(code))
+    block = flush_paragraph()
+    if block:
+        yield block
+
+
+def tokenize(content: str) -> List[MarkdownBlock]:
+    """마크다운 블록 토큰 리스트를 반환합니다."""
+    return list(iter_blocks(content))
+
+
+def blocks_to_text(blocks: List[MarkdownBlock]) -> str:
+    """이미지를 제외한 블록 텍스트를 줄바꿈으로 이어 붙입니다 (HTML get_text()에 대응)."""
+    return '\n'.join(block.text for block in blocks if block.kind != 'image' and block.text)
+
+
+def looks_like_markdown(content: str) -> bool:
+    """본문이 HTML이 아니라 마크다운인지 간단히 판별합니다."""
+    if re.search(r'<(p|h[1-6]|ul|ol|div|article|section)[\s>]', content, re.IGNORECASE):
+        return False
+    return True
@@ -0,0 +1,102 @@
+"""
+한 콘텐츠를 여러 블로그 계정에 동시에 발행하는 팬아웃 헬퍼
+
+계정마다 Celery 태스크(이벤트 루프, DB 세션, Publisher)를 따로 띄우지 않고 한 작업 안에서
+asyncio.gather로 함께 발행합니다.
+
+- 발행 인자(제목, 본문, 키워드, 대표 이미지)는 콘텐츠당 한 번 만들어 모든 계정이 공유
+- 플랫폼별 동시 발행 수 제한 (네이버 브라우저 발행은 브라우저 풀 세션 수에 맞춤)
+- 계정 하나가 실패해도 나머지는 계속 진행하고, 끝나는 순서대로 결과 콜백(on_result) 호출
+  (호출하는 쪽이 Publication 상태를 항목별로 바로 반영)
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+from app.core.config import settings
+from app.models.blog_account import BlogPlatform
+from app.services.publishers import get_publisher
+
+logger = structlog.get_logger()
+
+ResultCallback = Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[None]]
+
+
+def platform_concurrency() -> Dict[BlogPlatform, int]:
+    """플랫폼별 동시 발행 수 상한"""
+    return {
+        BlogPlatform.WORDPRESS: settings.publish_fanout_wordpress_concurrency,
+        BlogPlatform.TISTORY: settings.publish_fanout_tistory_concurrency,
+        BlogPlatform.NAVER: settings.publish_fanout_naver_concurrency,
+    }
+
+
+def build_publish_payload(content) -> Dict[str, Any]:
+    """모든 계정이 공유하는 Publisher.publish 인자"""
+    return {
+        "title": content.title,
+        "content": content.content,
+        "meta_description": content.meta_description,
+        "keywords": content.keywords,
+        "featured_image": {
+            "url": content.featured_image_url,
+            "alt_text": content.featured_image_alt
+        } if content.featured_image_url else None
+    }
+
+
+async def fan_out_publish(
+    targets: List[Dict[str, Any]],
+    payload: Dict[str, Any],
+    on_result: Optional[ResultCallback] = None,
+    concurrency: Optional[Dict[BlogPlatform, int]] = None,
+    publisher_factory: Callable[..., Any] = get_publisher
+) -> List[Dict[str, Any]]:
+    """
+    같은 콘텐츠를 여러 계정에 동시에 발행합니다.
+
+    Args:
+        targets: 발행 대상 목록 ({"publication_id", "platform", "credentials"})
+        payload: build_publish_payload로 만든 공유 발행 인자
+        on_result: 대상 하나가 끝날 때마다 (target, result)로 호출
+        concurrency: 플랫폼별 동시 발행 수 (None이면 설정값)
+        publisher_factory: 플랫폼과 인증 정보로 Publisher를 만드는 함수
+
+    Returns:
+        대상별 결과 (입력 순서 유지, 실패는 {"success": False, "error": ...})
+    """
+    limits = concurrency or platform_concurrency()
+    semaphores = {platform: asyncio.Semaphore(limit) for platform, limit in limits.items()}
+
+    async def run(target: Dict[str, Any]) -> Dict[str, Any]:
+        semaphore = semaphores.setdefault(target["platform"], asyncio.Semaphore(1))
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                publisher = publisher_factory(platform=target["platform"], credentials=target["credentials"])
+                result = await publisher.publish(**payload)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            logger.info(
+                "팬아웃 발행 항목 완료",
+                publication_id=target["publication_id"],
+                platform=str(target["platform"]),
+                success=result["success"],
+                elapsed_ms=round((time.perf_counter() - started) * 1000)
+            )
+
+        if on_result is not None:
+            try:
+                await on_result(target, result)
+            except Exception as e:
+                # 상태 반영 실패가 다른 계정의 발행을 멈추지 않도록 기록만 함
+                logger.error(
+                    "팬아웃 발행 결과 반영 실패",
+                    publication_id=target["publication_id"],
+                    error=str(e)
+                )
+        return result
+
+    return await asyncio.gather(*(run(target) for target in targets))
@@ -0,0 +1,166 @@
+"""
+네이버 스마트에디터 ONE 본문 입력 준비
+
+본문을 한 글자씩 타이핑하는 대신, 에디터가 붙여넣기로 받아들이는 블록(단락, 제목, 목록, 인용 등)을
+정리된 HTML로 묶어 몇 번의 붙여넣기 이벤트로 넣을 수 있게 나눕니다.
+에디터가 받지 못하는 요소(표, 이미지, iframe 등)는 기존처럼 타이핑으로 입력합니다.
+브라우저 없이 발행할 때(naver_http) 쓰는 문서 모델(documentModel)도 여기서 만듭니다.
+"""
+import json
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+# 붙여넣기로 넣을 블록 요소
+PASTE_BLOCK_TAGS = frozenset(['p', 'h1', 'h2', 'h3', 'h4', 'ul', 'ol', 'blockquote', 'hr', 'pre'])
+# 블록 안에 남길 인라인 요소 (그 밖의 태그는 텍스트만 남김)
+PASTE_INLINE_TAGS = frozenset(['strong', 'b', 'em', 'i', 'u', 's', 'a', 'br', 'code', 'p', 'li', 'ul', 'ol'])
+# 내용 없이 버릴 요소
+DROP_TAGS = frozenset(['script', 'style'])
+
+SEGMENT_PASTE = "paste"
+SEGMENT_TYPE = "type"
+
+Segment = Tuple[str, Union[str, List[Union[Tag, NavigableString]]]]
+
+# 붙여넣기 이벤트를 에디터에 보내고 입력 전 본문 길이를 반환하는 스크립트
+PASTE_SCRIPT = """
+([html, text]) => {
+    const editor = document.querySelector('.se-content');
+    const target = document.activeElement && editor && editor.contains(document.activeElement)
+        ? document.activeElement : editor;
+    const before = editor ? editor.innerText.length : 0;
+    const data = new DataTransfer();
+    data.setData('text/html', html);
+    data.setData('text/plain', text);
+    target.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+    return before;
+}
+"""
+
+# 붙여넣기가 반영되어 본문이 늘었는지 확인하는 조건
+PASTE_APPLIED_SCRIPT = """
+(before) => {
+    const editor = document.querySelector('.se-content');
+    return editor && editor.innerText.length > before;
+}
+"""
+
+
+def _clean(element: Tag) -> Tag:
+    """허용한 인라인 요소만 남기고 속성은 a[href]만 유지"""
+    for child in element.find_all(True):
+        if child.name in DROP_TAGS:
+            child.decompose()
+        elif child.name not in PASTE_INLINE_TAGS:
+            child.unwrap()
+        else:
+            href = child.get('href') if child.name == 'a' else None
+            child.attrs = {'href': href} if href else {}
+    element.attrs = {}
+    return element
+
+
+def build_segments(content: str) -> List[Segment]:
+    """
+    본문을 입력 단위로 나눕니다.
+
+    Returns:
+        [("paste", 정리된 HTML), ("type", [타이핑할 요소...]), ...] - 연속된 같은 종류는 하나로 묶음
+    """
+    soup = BeautifulSoup(content or '', 'html.parser')
+    segments: List[Segment] = []
+
+    def add(kind: str, item):
+        if segments and segments[-1][0] == kind:
+            if kind == SEGMENT_PASTE:
+                segments[-1] = (kind, segments[-1][1] + item)
+            else:
+                segments[-1][1].append(item)
+        else:
+            segments.append((kind, item if kind == SEGMENT_PASTE else [item]))
+
+    for element in list(soup.children):
+        if isinstance(element, NavigableString):
+            text = str(element).strip()
+            if text:
+                # 최상위 텍스트는 단락으로 감쌈
+                paragraph = soup.new_tag('p')
+                paragraph.string = text
+                add(SEGMENT_PASTE, str(paragraph))
+        elif element.name in DROP_TAGS:
+            continue
+        elif element.name in PASTE_BLOCK_TAGS:
+            add(SEGMENT_PASTE, str(_clean(element)))
+        else:
+            add(SEGMENT_TYPE, element)
+
+    return segments
+
+
+def plain_text(html: str) -> str:
+    """붙여넣기 text/plain 대체 값"""
+    return BeautifulSoup(html, 'html.parser').get_text('\n')
+
+
+def _text_component(ctype: str, lines: List[str]) -> dict:
+    return {
+        "@ctype": ctype,
+        "value": [
+            {"@ctype": "paragraph", "nodes": [{"@ctype": "textNode", "value": line}]}
+            for line in lines
+        ]
+    }
+
+
+def build_document_model(title: str, content: str) -> dict:
+    """
+    HTTP 발행용 스마트에디터 ONE 문서 모델 (documentModel).
+    제목은 documentTitle, h1~h4는 sectionTitle, 나머지 블록은 text 컴포넌트의 단락으로 변환합니다.
+    """
+    components = [_text_component("documentTitle", [title])]
+    paragraphs: List[str] = []
+
+    def flush():
+        if paragraphs:
+            components.append(_text_component("text", list(paragraphs)))
+            paragraphs.clear()
+
+    soup = BeautifulSoup(content or '', 'html.parser')
+    for element in soup.children:
+        if isinstance(element, NavigableString):
+            text = str(element).strip()
+            if text:
+                paragraphs.append(text)
+        elif element.name in DROP_TAGS:
+            continue
+        elif element.name in ('h1', 'h2', 'h3', 'h4'):
+            flush()
+            components.append(_text_component("sectionTitle", [element.get_text().strip()]))
+        elif element.name == 'ul':
+            paragraphs.extend(f"• {li.get_text().strip()}" for li in element.find_all('li'))
+        elif element.name == 'ol':
+            paragraphs.extend(f"{i}. {li.get_text().strip()}" for i, li in enumerate(element.find_all('li'), 1))
+        else:
+            paragraphs.extend(line.strip() for line in element.get_text('\n').split('\n') if line.strip())
+    flush()
+
+    return {
+        "documentId": "",
+        "document": {
+            "version": "2.8.0",
+            "theme": "default",
+            "language": "ko-KR",
+            "components": components
+        }
+    }
+
+
+@lru_cache(maxsize=32)
+def document_model_json(title: str, content: str) -> str:
+    """
+    직렬화한 문서 모델.
+    같은 글을 여러 네이버 계정에 동시에 발행할 때(팬아웃) 변환을 한 번만 하도록 캐시합니다.
+    """
+    return json.dumps(build_document_model(title, content), ensure_ascii=False)
@@ -0,0 +1,192 @@
+"""
+브라우저 없이 HTTP로 네이버 블로그 글쓰기
+
+브라우저 풀에 저장된 계정 로그인 상태(storage_state)의 네이버 쿠키로 스마트에디터 ONE이
+호출하는 글쓰기 엔드포인트를 직접 호출합니다. Chromium을 띄우지 않으므로 CPU/메모리/시간이 적게 들고
+워커당 동시 발행 수를 늘릴 수 있습니다.
+
+- 저장된 로그인 상태가 없거나 만료되면 로그인 콜백(브라우저 로그인)을 한 번 실행하고 다시 시도
+- 글이 쓰이지 않은 것이 확실한 실패(로그인 실패, 연결 실패, 4xx, isSuccess=false)는 NaverRequestNotApplied로 올려
+  호출하는 쪽이 브라우저 경로로 대체할 수 있게 하고, 요청이 전달된 뒤의 실패(시간 초과, 5xx, 해석할 수 없는 응답)는
+  글이 이미 만들어졌을 수 있으므로 NaverHttpError로 구분
+- 공유 aiohttp 세션을 쓰되 쿠키는 요청마다 헤더로 넣음 (세션 쿠키 저장소에 계정 쿠키를 남기지 않음)
+"""
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+import structlog
+
+from app.core.http_client import get_http_session
+from app.services.browser_pool import BrowserPool
+from app.services.publishers.naver_editor import document_model_json
+
+logger = structlog.get_logger()
+
+# 스마트에디터 ONE이 사용하는 엔드포인트 (blog.naver.com 기준 경로)
+WRITE_PATH = "/RabbitWrite.naver"
+UPDATE_PATH = "/RabbitUpdate.naver"
+DELETE_PATH = "/PostDelete.naver"
+
+# 공개 설정 → populationParams.configuration.openType
+OPEN_TYPES = {"public": 2, "neighbor": 1, "private": 0}
+MAX_TAGS = 10
+
+
+class NaverHttpError(Exception):
+    """HTTP 글쓰기 요청이 실패했거나 응답을 해석할 수 없음 (글이 이미 쓰였을 수 있음)"""
+
+
+class NaverRequestNotApplied(NaverHttpError):
+    """요청이 반영되지 않은 것이 확실한 실패 (다른 경로로 다시 시도해도 중복되지 않음)"""
+
+
+class NaverSessionExpired(NaverRequestNotApplied):
+    """저장된 로그인 쿠키가 만료됨"""
+
+
+class NaverHttpTransport:
+    """저장된 로그인 쿠키로 네이버 블로그 글쓰기 엔드포인트를 호출하는 전송 계층"""
+
+    def __init__(
+        self,
+        blog_id: str,
+        account_key: str,
+        pool: BrowserPool,
+        login: Callable[[], Awaitable[bool]],
+        base_url: str = "https://blog.naver.com"
+    ):
+        self.blog_id = blog_id
+        self.account_key = account_key
+        self.pool = pool
+        self.login = login
+        self.base_url = base_url.rstrip('/')
+
+    # 쿠키
+
+    async def _cookie_header(self) -> Optional[str]:
+        state = await self.pool.load_state(self.account_key)
+        if not state:
+            return None
+        cookies = [
+            f"{cookie['name']}={cookie['value']}"
+            for cookie in state.get("cookies", [])
+            if cookie.get("domain", "").lstrip('.').endswith("naver.com")
+        ]
+        return "; ".join(cookies) or None
+
+    # 요청
+
+    async def _post(self, path: str, form: Dict[str, str], cookie: str) -> Dict[str, Any]:
+        session = get_http_session()
+        try:
+            async with session.post(
+                f"{self.base_url}{path}",
+                data=form,
+                headers={
+                    "Cookie": cookie,
+                    "Referer": f"https://blog.naver.com/{self.blog_id}/postwrite",
+                    "Accept": "application/json",
+                },
+                allow_redirects=False
+            ) as response:
+                # 로그인이 필요하면 nid.naver.com 로그인 페이지로 돌려보냄
+                location = response.headers.get("Location", "")
+                if response.status in (401, 403) or "nid.naver.com" in location:
+                    raise NaverSessionExpired(f"HTTP {response.status}")
+                if 400 <= response.status < 500:
+                    raise NaverRequestNotApplied(f"HTTP {response.status}: {await response.text()}")
+                if response.status != 200:
+                    raise NaverHttpError(f"HTTP {response.status}: {await response.text()}")
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    raise NaverHttpError("JSON이 아닌 응답")
+        except aiohttp.ClientConnectorError as e:
+            # 연결 자체가 안 됨 (요청이 전달되지 않음)
+            raise NaverRequestNotApplied(f"연결 실패: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise NaverHttpError(f"요청 후 응답 없음: {str(e) or type(e).__name__}")
+
+        if not isinstance(data, dict) or not data.get("isSuccess"):
+            if isinstance(data, dict) and data.get("errorCode") == "NOT_LOGIN":
+                raise NaverSessionExpired(data.get("message", "NOT_LOGIN"))
+            if isinstance(data, dict) and data.get("isSuccess") is False:
+                raise NaverRequestNotApplied(f"요청 거부: {data.get('message')}")
+            raise NaverHttpError(f"해석할 수 없는 응답: {data}")
+        return data
+
+    async def _call(self, path: str, form: Dict[str, str]) -> Dict[str, Any]:
+        """저장된 쿠키로 요청하고, 쿠키가 없거나 만료되었으면 한 번 로그인 후 재시도"""
+        cookie = await self._cookie_header()
+        if cookie is not None:
+            try:
+                return await self._post(path, form, cookie)
+            except NaverSessionExpired:
+                logger.info("네이버 로그인 쿠키 만료 - 다시 로그인", account=self.account_key)
+                await self.pool.clear_state(self.account_key)
+
+        if not await self.login():
+            raise NaverRequestNotApplied("Login failed")
+        cookie = await self._cookie_header()
+        if cookie is None:
+            raise NaverRequestNotApplied("로그인 후에도 저장된 쿠키가 없습니다")
+        return await self._post(path, form, cookie)
+
+    def _post_result(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        redirect_url = (data.get("result") or {}).get("redirectUrl", "")
+        log_no = parse_qs(urlparse(redirect_url).query).get("logNo", [""])[0]
+        if not log_no:
+            raise NaverHttpError(f"포스트 번호가 없는 응답: {redirect_url}")
+        return {
+            "success": True,
+            "post_id": log_no,
+            "url": f"https://blog.naver.com/{self.blog_id}/{log_no}"
+        }
+
+    @staticmethod
+    def _population_params(keywords: Optional[List[str]], visibility: str) -> str:
+        return json.dumps({
+            "configuration": {"openType": OPEN_TYPES.get(visibility, OPEN_TYPES["public"])},
+            "tags": ",".join((keywords or [])[:MAX_TAGS])
+        }, ensure_ascii=False)
+
+    # 공개 API
+
+    async def publish(
+        self,
+        title: str,
+        content: str,
+        keywords: Optional[List[str]] = None,
+        visibility: str = "public"
+    ) -> Dict[str, Any]:
+        data = await self._call(WRITE_PATH, {
+            "blogId": self.blog_id,
+            "documentModel": document_model_json(title, content),
+            "populationParams": self._population_params(keywords, visibility),
+            "productApiVersion": "v1",
+        })
+        return self._post_result(data)
+
+    async def update(
+        self,
+        post_id: str,
+        title: str,
+        content: str,
+        keywords: Optional[List[str]] = None,
+        visibility: str = "public"
+    ) -> Dict[str, Any]:
+        data = await self._call(UPDATE_PATH, {
+            "blogId": self.blog_id,
+            "logNo": post_id,
+            "documentModel": document_model_json(title, content),
+            "populationParams": self._population_params(keywords, visibility),
+            "productApiVersion": "v1",
+        })
+        return self._post_result(data)
+
+    async def delete(self, post_id: str) -> Dict[str, Any]:
+        await self._call(DELETE_PATH, {"blogId": self.blog_id, "logNo": post_id})
+        return {"success": True}
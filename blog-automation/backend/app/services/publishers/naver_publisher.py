@@ -1,8 +1,20 @@
 from typing import Dict, List, Optional
-from playwright.async_api import async_playwright
 import asyncio
+import time
 from bs4 import BeautifulSoup
 
+from app.core.config import settings
+from app.services.browser_automation import StepTimer, login_naver
+from app.services.browser_pool import BrowserSession, get_browser_pool
+from app.services.publishers.naver_http import NaverHttpTransport, NaverRequestNotApplied
+from app.services.publishers.naver_editor import (
+    PASTE_APPLIED_SCRIPT,
+    PASTE_SCRIPT,
+    SEGMENT_PASTE,
+    SEGMENT_TYPE,
+    build_segments,
+    plain_text,
+)
 from app.services.publishers.base_publisher import BasePublisher
 
 
@@ -14,6 +26,8 @@ class NaverPublisher(BasePublisher):
         self.username = credentials.get("username")
         self.password = credentials.get("password")
         self.blog_id = credentials.get("blog_id", self.username)  # 기본값은 username
+        # 계정별 전송 방식: browser(Playwright) 또는 http(저장된 로그인 쿠키로 직접 요청, 실패 시 browser)
+        self.transport = credentials.get("transport") or settings.naver_transport
     
     async def publish(
         self,
@@ -23,77 +37,81 @@ class NaverPublisher(BasePublisher):
         keywords: Optional[List[str]] = None,
         **kwargs
     ) -> Dict:
+        if self.transport == "http":
+            result = await self._via_http(
+                "publish", title, content, keywords, kwargs.get("visibility", "public")
+            )
+            if result is not None:
+                return result
+        
+        timer = StepTimer("naver_publish", blog_id=self.blog_id)
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context()
-                page = await context.new_page()
+            async with get_browser_pool().session(self._account_key(), profile="editor") as session:
+                page = session.page
+                
+                # 블로그 글쓰기 페이지로 이동 (저장된 로그인 상태가 만료되었으면 로그인)
+                async with timer.step("open"):
+                    logged_in = await self._goto_logged_in(
+                        session, f"https://blog.naver.com/{self.blog_id}/postwrite", timer
+                    )
+                if not logged_in:
+                    return {
+                        "success": False,
+                        "error": "Login failed"
+                    }
                 
-                try:
-                    # 로그인
-                    login_success = await self._login(page)
-                    if not login_success:
-                        return {
-                            "success": False,
-                            "error": "Login failed"
-                        }
-                    
-                    # 블로그 글쓰기 페이지로 이동
-                    await page.goto(f"https://blog.naver.com/{self.blog_id}/postwrite")
-                    await page.wait_for_load_state("networkidle")
-                    
-                    # 제목 입력
+                # 제목 입력
+                async with timer.step("title"):
                     title_input = await page.wait_for_selector('input[name="post.title"]', timeout=10000)
                     await title_input.fill(title)
-                    
-                    # 에디터가 로드될 때까지 대기
+                
+                # 콘텐츠 입력 (Smart Editor One, 에디터가 로드될 때까지 대기)
+                async with timer.step("content"):
                     await page.wait_for_selector('.se-content', timeout=10000)
-                    
-                    # 콘텐츠 입력 (Smart Editor One)
                     await self._input_content_to_editor(page, content)
-                    
-                    # 태그 입력
-                    if keywords:
+                
+                # 태그 입력
+                if keywords:
+                    async with timer.step("tags"):
                         await self._add_tags(page, keywords)
-                    
-                    # 공개 설정
-                    visibility = kwargs.get("visibility", "public")
+                
+                # 공개 설정
+                visibility = kwargs.get("visibility", "public")
+                async with timer.step("visibility"):
                     await self._set_visibility(page, visibility)
-                    
-                    # 발행 버튼 클릭
+                
+                # 발행 버튼 클릭 후 글쓰기 페이지를 벗어날 때까지 대기
+                async with timer.step("submit"):
                     publish_button = await page.wait_for_selector('button:has-text("발행")', timeout=5000)
                     await publish_button.click()
-                    
-                    # 발행 완료 대기
-                    await page.wait_for_navigation(timeout=10000)
-                    
-                    # 발행된 URL 가져오기
-                    current_url = page.url
-                    
-                    # 포스트 ID 추출
-                    post_id = self._extract_post_id(current_url)
-                    
-                    self.logger.info(
-                        "Naver blog post published successfully",
-                        post_id=post_id,
-                        url=current_url
-                    )
-                    
-                    return {
-                        "success": True,
-                        "post_id": post_id,
-                        "url": current_url
-                    }
-                    
-                finally:
-                    await browser.close()
-                    
+                    await self._wait_until_left_editor(page)
+                
+                # 발행된 URL 가져오기
+                current_url = page.url
+                
+                # 포스트 ID 추출
+                post_id = self._extract_post_id(current_url)
+                
+                self.logger.info(
+                    "Naver blog post published successfully",
+                    post_id=post_id,
+                    url=current_url
+                )
+                
+                return {
+                    "success": True,
+                    "post_id": post_id,
+                    "url": current_url
+                }
+                
         except Exception as e:
             self.logger.error("Naver publish error", error=str(e))
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            timer.log()
     
     async def update(
         self,
@@ -102,34 +120,39 @@ class NaverPublisher(BasePublisher):
         content: Optional[str] = None,
         **kwargs
     ) -> Dict:
+        # HTTP 수정은 문서 전체를 바꾸므로 제목과 본문이 모두 있을 때만 사용
+        if self.transport == "http" and title and content:
+            result = await self._via_http(
+                "update", post_id, title, content, kwargs.get("keywords"), kwargs.get("visibility", "public")
+            )
+            if result is not None:
+                return result
+        
+        timer = StepTimer("naver_update", blog_id=self.blog_id, post_id=post_id)
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context()
-                page = await context.new_page()
+            async with get_browser_pool().session(self._account_key(), profile="editor") as session:
+                page = session.page
                 
-                try:
-                    # 로그인
-                    login_success = await self._login(page)
-                    if not login_success:
-                        return {
-                            "success": False,
-                            "error": "Login failed"
-                        }
-                    
-                    # 수정 페이지로 이동
-                    edit_url = f"https://blog.naver.com/{self.blog_id}/postwrite/{post_id}"
-                    await page.goto(edit_url)
-                    await page.wait_for_load_state("networkidle")
-                    
-                    # 제목 수정
-                    if title:
+                # 수정 페이지로 이동
+                edit_url = f"https://blog.naver.com/{self.blog_id}/postwrite/{post_id}"
+                async with timer.step("open"):
+                    logged_in = await self._goto_logged_in(session, edit_url, timer)
+                if not logged_in:
+                    return {
+                        "success": False,
+                        "error": "Login failed"
+                    }
+                
+                # 제목 수정
+                if title:
+                    async with timer.step("title"):
                         title_input = await page.wait_for_selector('input[name="post.title"]', timeout=10000)
                         await title_input.fill("")
                         await title_input.fill(title)
-                    
-                    # 콘텐츠 수정
-                    if content:
+                
+                # 콘텐츠 수정
+                if content:
+                    async with timer.step("content"):
                         # 기존 콘텐츠 삭제
                         await page.evaluate("""
                             const editor = document.querySelector('.se-content');
@@ -140,139 +163,237 @@ class NaverPublisher(BasePublisher):
                         
                         # 새 콘텐츠 입력
                         await self._input_content_to_editor(page, content)
-                    
-                    # 수정 버튼 클릭
+                
+                # 수정 버튼 클릭 후 수정 페이지를 벗어날 때까지 대기
+                async with timer.step("submit"):
                     update_button = await page.wait_for_selector('button:has-text("수정")', timeout=5000)
                     await update_button.click()
-                    
-                    # 수정 완료 대기
-                    await page.wait_for_navigation(timeout=10000)
-                    
-                    return {
-                        "success": True,
-                        "post_id": post_id,
-                        "url": page.url
-                    }
-                    
-                finally:
-                    await browser.close()
-                    
+                    await self._wait_until_left_editor(page)
+                
+                return {
+                    "success": True,
+                    "post_id": post_id,
+                    "url": page.url
+                }
+                
         except Exception as e:
             self.logger.error("Naver update error", error=str(e))
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            timer.log()
     
     async def delete(self, post_id: str) -> Dict:
+        if self.transport == "http":
+            result = await self._via_http("delete", post_id)
+            if result is not None:
+                return result
+        
+        timer = StepTimer("naver_delete", blog_id=self.blog_id, post_id=post_id)
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context()
-                page = await context.new_page()
+            async with get_browser_pool().session(self._account_key(), profile="editor") as session:
+                page = session.page
+                
+                # 블로그 관리 페이지로 이동
+                async with timer.step("open"):
+                    logged_in = await self._goto_logged_in(
+                        session, f"https://blog.naver.com/{self.blog_id}/admin/post", timer
+                    )
+                if not logged_in:
+                    return {
+                        "success": False,
+                        "error": "Login failed"
+                    }
                 
-                try:
-                    # 로그인
-                    login_success = await self._login(page)
-                    if not login_success:
-                        return {
-                            "success": False,
-                            "error": "Login failed"
-                        }
-                    
-                    # 블로그 관리 페이지로 이동
-                    await page.goto(f"https://blog.naver.com/{self.blog_id}/admin/post")
-                    await page.wait_for_load_state("networkidle")
-                    
-                    # 포스트 찾기 및 삭제
-                    # 포스트 체크박스 선택
-                    checkbox = await page.wait_for_selector(f'input[value="{post_id}"]', timeout=10000)
+                # 포스트 체크박스 선택
+                checkbox_selector = f'input[value="{post_id}"]'
+                async with timer.step("select"):
+                    checkbox = await page.wait_for_selector(checkbox_selector, timeout=10000)
                     await checkbox.check()
-                    
-                    # 삭제 버튼 클릭
+                
+                # 확인 대화상자는 삭제 버튼을 누르기 전에 등록해야 수락됨
+                page.once("dialog", lambda dialog: dialog.accept())
+                
+                # 삭제 버튼 클릭 후 포스트가 목록에서 사라질 때까지 대기
+                async with timer.step("delete"):
                     delete_button = await page.wait_for_selector('button:has-text("삭제")', timeout=5000)
                     await delete_button.click()
-                    
-                    # 확인 대화상자 처리
-                    page.on("dialog", lambda dialog: dialog.accept())
-                    
-                    # 삭제 완료 대기
-                    await page.wait_for_timeout(2000)
-                    
-                    return {"success": True}
-                    
-                finally:
-                    await browser.close()
-                    
+                    await page.wait_for_selector(
+                        checkbox_selector, state="detached", timeout=settings.browser_wait_timeout_ms
+                    )
+                
+                return {"success": True}
+                
         except Exception as e:
             self.logger.error("Naver delete error", error=str(e))
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            timer.log()
     
-    async def _login(self, page) -> bool:
-        """네이버 로그인을 수행합니다."""
+    def _account_key(self) -> str:
+        return f"naver:{self.username}"
+    
+    def _http_transport(self) -> NaverHttpTransport:
+        return NaverHttpTransport(
+            blog_id=self.blog_id,
+            account_key=self._account_key(),
+            pool=get_browser_pool(),
+            login=self._browser_login,
+            base_url=settings.naver_blog_base_url
+        )
+    
+    async def _via_http(self, operation: str, *args) -> Optional[Dict]:
+        """
+        HTTP 전송으로 실행합니다.
+        요청이 반영되지 않은 것이 확실한 실패면 None을 반환해 브라우저 경로로 대체합니다.
+        그 밖의 실패(요청 후 시간 초과, 해석할 수 없는 응답 등)는 글이 이미 쓰였을 수 있으므로
+        publish/update는 다시 시도하지 않고 실패로 반환합니다 (delete는 다시 해도 같은 결과라 대체).
+        """
+        started = time.perf_counter()
         try:
-            await page.goto("https://nid.naver.com/nidlogin.login")
-            
-            # 아이디 입력
-            await page.fill('input[name="id"]', self.username)
-            
-            # 비밀번호 입력
-            await page.fill('input[name="pw"]', self.password)
-            
-            # 로그인 버튼 클릭
-            await page.click('button[type="submit"]')
-            
-            # 로그인 완료 대기
-            await page.wait_for_timeout(3000)
-            
-            # 로그인 성공 확인
-            current_url = page.url
-            if "nid.naver.com" not in current_url:
+            result = await getattr(self._http_transport(), operation)(*args)
+        except NaverRequestNotApplied as e:
+            self.logger.warning(f"Naver HTTP {operation} not applied, falling back to browser", error=str(e))
+            return None
+        except Exception as e:
+            if operation == "delete":
+                self.logger.warning(f"Naver HTTP {operation} failed, falling back to browser", error=str(e))
+                return None
+            self.logger.error(f"Naver HTTP {operation} failed after the request was sent", error=str(e))
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        self.logger.info(
+            f"Naver HTTP {operation} succeeded",
+            post_id=result.get("post_id"),
+            elapsed_ms=round((time.perf_counter() - started) * 1000)
+        )
+        return result
+    
+    async def _browser_login(self) -> bool:
+        """브라우저로 로그인해 로그인 상태를 저장합니다 (HTTP 전송의 쿠키 갱신용)."""
+        async with get_browser_pool().session(self._account_key(), profile="login") as session:
+            if not await self._login(session.page):
+                return False
+            await session.save_state()
+            return True
+    
+    async def _goto_logged_in(self, session: BrowserSession, url: str, timer: Optional[StepTimer] = None) -> bool:
+        """
+        로그인이 필요한 페이지로 이동합니다.
+        저장된 로그인 상태가 있으면 바로 이동하고, 로그인 페이지로 돌려보내지면(세션 만료) 다시 로그인합니다.
+        networkidle 대신 DOM이 준비되면 돌아오고, 필요한 요소는 이후 단계에서 각각 기다립니다.
+        """
+        page = session.page
+        if session.restored:
+            await page.goto(url, wait_until="domcontentloaded")
+            if "nid.naver.com" not in page.url:
                 return True
-            
-            # 추가 인증이 필요한 경우 처리
-            # (예: 2단계 인증, 캡차 등)
-            
+            self.logger.info("Naver session expired, logging in again")
+            await session.clear_state()
+        
+        if timer:
+            async with timer.step("login"):
+                logged_in = await self._login(page)
+        else:
+            logged_in = await self._login(page)
+        if not logged_in:
             return False
-            
+        await session.save_state()
+        await page.goto(url, wait_until="domcontentloaded")
+        return True
+    
+    async def _wait_until_left_editor(self, page):
+        """발행/수정 후 글쓰기 페이지(/postwrite)를 벗어날 때까지 기다립니다."""
+        await page.wait_for_url(
+            lambda url: "/postwrite" not in url,
+            timeout=settings.browser_wait_timeout_ms
+        )
+    
+    async def _login(self, page) -> bool:
+        """네이버 로그인을 수행합니다 (로그인 페이지를 벗어나거나 오류가 뜰 때까지만 대기)."""
+        try:
+            return await login_naver(page, self.username, self.password)
         except Exception as e:
             self.logger.error("Login error", error=str(e))
             return False
     
     async def _input_content_to_editor(self, page, content: str):
-        """Smart Editor One에 콘텐츠를 입력합니다."""
-        # HTML 콘텐츠를 에디터에 맞게 변환
-        soup = BeautifulSoup(content, 'html.parser')
+        """
+        Smart Editor One에 콘텐츠를 입력합니다.
+        paste 모드는 블록 요소를 묶어 붙여넣기 이벤트로 넣고, 에디터가 받지 않은 부분만 타이핑합니다.
+        """
+        started = time.perf_counter()
         
         # 에디터 클릭하여 포커스
         editor = await page.wait_for_selector('.se-content', timeout=10000)
         await editor.click()
         
-        # 텍스트와 HTML 요소를 순차적으로 입력
-        for element in soup.children:
-            if element.name == 'p':
-                await page.keyboard.type(element.get_text())
-                await page.keyboard.press('Enter')
-            elif element.name in ['h1', 'h2', 'h3']:
-                # 제목 스타일 적용
-                await self._apply_heading_style(page, element.name)
-                await page.keyboard.type(element.get_text())
+        if settings.naver_editor_input_mode == "paste":
+            segments = build_segments(content)
+        else:
+            segments = [(SEGMENT_TYPE, list(BeautifulSoup(content, 'html.parser').children))]
+        
+        pasted = typed = 0
+        for kind, item in segments:
+            if kind == SEGMENT_PASTE:
+                if await self._paste_html(page, item):
+                    pasted += 1
+                    continue
+                item = list(BeautifulSoup(item, 'html.parser').children)
+            for element in item:
+                await self._type_element(page, element)
+            typed += 1
+        
+        self.logger.info(
+            "Naver editor content input",
+            mode=settings.naver_editor_input_mode,
+            chars=len(content),
+            pasted_segments=pasted,
+            typed_segments=typed,
+            elapsed_ms=round((time.perf_counter() - started) * 1000)
+        )
+    
+    async def _paste_html(self, page, html: str) -> bool:
+        """HTML 블록을 붙여넣기 이벤트로 넣고 본문에 반영되었는지 확인합니다."""
+        try:
+            before = await page.evaluate(PASTE_SCRIPT, [html, plain_text(html)])
+            await page.wait_for_function(
+                PASTE_APPLIED_SCRIPT, arg=before, timeout=settings.naver_editor_paste_timeout_ms
+            )
+            return True
+        except Exception as e:
+            self.logger.warning("Naver editor paste not applied, typing instead", error=str(e))
+            return False
+    
+    async def _type_element(self, page, element):
+        """요소 하나를 키 입력으로 넣습니다 (붙여넣기가 안 되는 요소용)."""
+        if element.name == 'p':
+            await page.keyboard.type(element.get_text())
+            await page.keyboard.press('Enter')
+        elif element.name in ['h1', 'h2', 'h3']:
+            # 제목 스타일 적용
+            await self._apply_heading_style(page, element.name)
+            await page.keyboard.type(element.get_text())
+            await page.keyboard.press('Enter')
+        elif element.name == 'ul':
+            for li in element.find_all('li'):
+                await page.keyboard.type(f"• {li.get_text()}")
                 await page.keyboard.press('Enter')
-            elif element.name == 'ul':
-                for li in element.find_all('li'):
-                    await page.keyboard.type(f"• {li.get_text()}")
-                    await page.keyboard.press('Enter')
-            elif element.name == 'ol':
-                for i, li in enumerate(element.find_all('li'), 1):
-                    await page.keyboard.type(f"{i}. {li.get_text()}")
-                    await page.keyboard.press('Enter')
-            else:
-                # 기타 텍스트
-                await page.keyboard.type(str(element))
+        elif element.name == 'ol':
+            for i, li in enumerate(element.find_all('li'), 1):
+                await page.keyboard.type(f"{i}. {li.get_text()}")
                 await page.keyboard.press('Enter')
+        else:
+            # 기타 텍스트
+            await page.keyboard.type(str(element))
+            await page.keyboard.press('Enter')
     
     async def _apply_heading_style(self, page, heading_type: str):
         """제목 스타일을 적용합니다."""
@@ -306,7 +427,8 @@ class NaverPublisher(BasePublisher):
             for keyword in keywords[:10]:  # 네이버는 최대 10개 태그
                 await tag_input.fill(keyword)
                 await page.keyboard.press('Enter')
-                await page.wait_for_timeout(500)
+                # 태그가 등록되면 입력 필드가 비워짐
+                await page.wait_for_function("input => input.value === ''", arg=tag_input, timeout=2000)
         except:
             # 태그 추가 실패 시 그냥 진행
             pass
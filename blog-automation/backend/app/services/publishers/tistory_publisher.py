@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional
-import aiohttp
 from urllib.parse import urlencode
 
+from app.core.http_client import get_http_session
 from app.services.publishers.base_publisher import BasePublisher
 
 
@@ -41,47 +41,47 @@ class TistoryPublisher(BasePublisher):
             }
             
             # API 호출
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/post/write",
-                    data=params
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
+            session = get_http_session()
+            async with session.post(
+                f"{self.api_url}/post/write",
+                data=params
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    if result.get("tistory", {}).get("status") == "200":
+                        post_id = result["tistory"]["postId"]
+                        post_url = result["tistory"]["url"]
                         
-                        if result.get("tistory", {}).get("status") == "200":
-                            post_id = result["tistory"]["postId"]
-                            post_url = result["tistory"]["url"]
-                            
-                            self.logger.info(
-                                "Tistory post published successfully",
-                                post_id=post_id,
-                                url=post_url
-                            )
-                            
-                            return {
-                                "success": True,
-                                "post_id": str(post_id),
-                                "url": post_url
-                            }
-                        else:
-                            error_msg = result.get("tistory", {}).get("error_message", "Unknown error")
-                            self.logger.error(
-                                "Tistory publish failed",
-                                error=error_msg
-                            )
-                            
-                            return {
-                                "success": False,
-                                "error": error_msg
-                            }
+                        self.logger.info(
+                            "Tistory post published successfully",
+                            post_id=post_id,
+                            url=post_url
+                        )
+                        
+                        return {
+                            "success": True,
+                            "post_id": str(post_id),
+                            "url": post_url
+                        }
                     else:
-                        error_text = await response.text()
+                        error_msg = result.get("tistory", {}).get("error_message", "Unknown error")
+                        self.logger.error(
+                            "Tistory publish failed",
+                            error=error_msg
+                        )
+                        
                         return {
                             "success": False,
-                            "error": f"HTTP {response.status}: {error_text}"
+                            "error": error_msg
                         }
-                        
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             self.logger.error("Tistory publish error", error=str(e))
             return {
@@ -121,33 +121,33 @@ class TistoryPublisher(BasePublisher):
                 params["tag"] = ",".join(kwargs["tag"]) if isinstance(kwargs["tag"], list) else kwargs["tag"]
             
             # API 호출
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/post/modify",
-                    data=params
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if result.get("tistory", {}).get("status") == "200":
-                            return {
-                                "success": True,
-                                "post_id": post_id,
-                                "url": result["tistory"]["url"]
-                            }
-                        else:
-                            error_msg = result.get("tistory", {}).get("error_message", "Unknown error")
-                            return {
-                                "success": False,
-                                "error": error_msg
-                            }
+            session = get_http_session()
+            async with session.post(
+                f"{self.api_url}/post/modify",
+                data=params
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    if result.get("tistory", {}).get("status") == "200":
+                        return {
+                            "success": True,
+                            "post_id": post_id,
+                            "url": result["tistory"]["url"]
+                        }
                     else:
-                        error_text = await response.text()
+                        error_msg = result.get("tistory", {}).get("error_message", "Unknown error")
                         return {
                             "success": False,
-                            "error": f"HTTP {response.status}: {error_text}"
+                            "error": error_msg
                         }
-                        
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             self.logger.error("Tistory update error", error=str(e))
             return {
@@ -164,29 +164,29 @@ class TistoryPublisher(BasePublisher):
                 "postId": post_id
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/post/delete",
-                    data=params
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if result.get("tistory", {}).get("status") == "200":
-                            return {"success": True}
-                        else:
-                            error_msg = result.get("tistory", {}).get("error_message", "Unknown error")
-                            return {
-                                "success": False,
-                                "error": error_msg
-                            }
+            session = get_http_session()
+            async with session.post(
+                f"{self.api_url}/post/delete",
+                data=params
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    if result.get("tistory", {}).get("status") == "200":
+                        return {"success": True}
                     else:
-                        error_text = await response.text()
+                        error_msg = result.get("tistory", {}).get("error_message", "Unknown error")
                         return {
                             "success": False,
-                            "error": f"HTTP {response.status}: {error_text}"
+                            "error": error_msg
                         }
-                        
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             self.logger.error("Tistory delete error", error=str(e))
             return {
@@ -204,35 +204,35 @@ class TistoryPublisher(BasePublisher):
                 "postId": post_id
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}/post/read",
-                    params=params
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if result.get("tistory", {}).get("status") == "200":
-                            item = result["tistory"]["item"]
-                            return {
-                                "success": True,
-                                "title": item["title"],
-                                "content": item["content"],
-                                "visibility": item["visibility"],
-                                "category": item["categoryId"],
-                                "tags": item["tags"]["tag"] if item.get("tags") else []
-                            }
-                        else:
-                            return {
-                                "success": False,
-                                "error": result.get("tistory", {}).get("error_message", "Unknown error")
-                            }
+            session = get_http_session()
+            async with session.get(
+                f"{self.api_url}/post/read",
+                params=params
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    if result.get("tistory", {}).get("status") == "200":
+                        item = result["tistory"]["item"]
+                        return {
+                            "success": True,
+                            "title": item["title"],
+                            "content": item["content"],
+                            "visibility": item["visibility"],
+                            "category": item["categoryId"],
+                            "tags": item["tags"]["tag"] if item.get("tags") else []
+                        }
                     else:
                         return {
                             "success": False,
-                            "error": f"HTTP {response.status}"
+                            "error": result.get("tistory", {}).get("error_message", "Unknown error")
                         }
-                        
+                else:
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}"
+                    }
+                    
         except Exception as e:
             return {
                 "success": False,
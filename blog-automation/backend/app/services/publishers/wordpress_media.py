@@ -0,0 +1,356 @@
+"""
+WordPress 미디어 업로드
+
+본문 이미지와 대표 이미지를 Unsplash 등 외부 URL로 핫링크하지 않고, 사이트의 미디어 라이브러리(/wp/v2/media)에
+올린 뒤 본문 URL을 업로드된 주소로 바꾸고 featured_media를 지정할 수 있게 합니다.
+
+- 이미지는 스트리밍으로 내려받으며 해시를 계산 (로컬 이미지 저장소 URL이면 디스크의 변환본을 그대로 사용)
+- 사이트별 콘텐츠 해시 → 미디어 ID 색인 (wordpress_store): 같은 사진은 같은 사이트에 한 번만 업로드
+- TTL이 지난 색인 항목은 include 조회 한 번으로 아직 있는지 확인
+- 내려받기/업로드는 세마포어로 동시 실행 수 제한, 같은 해시의 동시 업로드는 한 번만 실행
+"""
+import asyncio
+import html
+import re
+import time
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import structlog
+
+from app.core.config import settings
+from app.core.executor import offload
+from app.core.http_client import get_http_session
+from app.services.image_store import MAX_DOWNLOAD_BYTES, LocalImageStore, get_image_store, image_store_active
+from app.services.publishers.wordpress_store import WordPressSiteStore
+
+logger = structlog.get_logger()
+
+# 마크다운 이미지 ![alt](url) 또는 HTML <img ... src="url" ...>
+CONTENT_IMAGE_RE = re.compile(
+    r'!\[([^\]]*)\]\((\S+?)\)|<img\b[^>]*?\bsrc="([^"]+)"[^>]*>'
+)
+IMG_ALT_RE = re.compile(r'\balt="([^"]*)"')
+LOCAL_IMAGE_RE = re.compile(r'/images/([0-9a-f]{32})/(\w+)\.jpg$')
+
+MAX_PER_PAGE = 100
+CHUNK_SIZE = 64 * 1024
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+
+
+def find_content_images(content: str) -> List[Dict[str, Any]]:
+    """본문의 이미지 URL과 대체 텍스트 (등장 순서, 중복 제거)"""
+    images: Dict[str, Dict[str, Any]] = {}
+    for match in CONTENT_IMAGE_RE.finditer(content or ''):
+        if match.group(2):
+            url, alt_text = match.group(2), match.group(1)
+        else:
+            url = html.unescape(match.group(3))
+            alt_match = IMG_ALT_RE.search(match.group(0))
+            alt_text = html.unescape(alt_match.group(1)) if alt_match else ""
+        if url.startswith(("http://", "https://")) and url not in images:
+            images[url] = {"url": url, "alt_text": alt_text}
+    return list(images.values())
+
+
+def rewrite_image_urls(content: str, urls: Dict[str, str]) -> str:
+    """본문 이미지 URL을 한 번의 스캔으로 바꿉니다 (바뀐 URL이 다시 치환되지 않음)."""
+    if not urls or not content:
+        return content
+    # HTML 속성에는 &가 &amp;로 들어가므로 이스케이프된 형태도 같이 바꿈
+    replacements = dict(urls)
+    for url, new_url in urls.items():
+        replacements.setdefault(html.escape(url), html.escape(new_url))
+    # 긴 URL부터 시도해 다른 URL의 접두어인 URL이 먼저 잡히지 않게 함
+    pattern = re.compile('|'.join(re.escape(url) for url in sorted(replacements, key=len, reverse=True)))
+    return pattern.sub(lambda match: replacements[match.group(0)], content)
+
+
+class WordPressMediaUploader:
+    """사이트별 콘텐츠 해시로 중복을 막는 WordPress 미디어 업로더"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 86400,
+        redis_url: Optional[str] = None,
+        disk_dir: Optional[str] = None,
+        concurrency: int = 4,
+        image_store: Optional[LocalImageStore] = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.concurrency = concurrency
+        self.image_store = image_store
+
+        # scope(사이트 API URL + "media") → 콘텐츠 해시 → {"id", "source_url", "stored_at"}
+        self.store = WordPressSiteStore("wp_media", redis_url=redis_url, disk_dir=disk_dir)
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        self.stats = {
+            "downloaded": 0,
+            "local": 0,
+            "uploaded": 0,
+            "reused": 0,
+            "revalidated": 0,
+            "errors": 0,
+        }
+
+    # 이미지 읽기
+
+    def _local_path(self, url: str) -> Optional[str]:
+        """로컬 이미지 저장소가 제공하는 URL이면 디스크의 변환본 경로"""
+        if self.image_store is None or not url.startswith(self.image_store.public_base_url + "/images/"):
+            return None
+        match = LOCAL_IMAGE_RE.search(url)
+        return self.image_store.variant_path(match.group(1), match.group(2)) if match else None
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        with open(path, 'rb') as f:
+            return f.read()
+
+    async def _download(self, url: str) -> Tuple[bytes, str]:
+        """이미지를 조각 단위로 내려받습니다 (크기 제한 초과 시 중단)."""
+        session = get_http_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise ValueError(f"HTTP {response.status}")
+            content_type = response.content_type or "image/jpeg"
+            if not content_type.startswith("image/"):
+                raise ValueError(f"이미지가 아닙니다: {content_type}")
+            chunks = []
+            size = 0
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_DOWNLOAD_BYTES:
+                    raise ValueError("이미지가 너무 큽니다")
+                chunks.append(chunk)
+            return b''.join(chunks), content_type
+
+    async def _read_image(self, url: str, semaphore: asyncio.Semaphore) -> Tuple[bytes, str]:
+        path = self._local_path(url)
+        if path is not None:
+            self.stats["local"] += 1
+            return await offload(self._read_file, path), "image/jpeg"
+        async with semaphore:
+            result = await self._download(url)
+        self.stats["downloaded"] += 1
+        return result
+
+    # WordPress API
+
+    async def _existing_media(
+        self,
+        api_url: str,
+        auth: aiohttp.BasicAuth,
+        media_ids: List[int],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[int, str]:
+        """아직 있는 미디어 → {ID: source_url}"""
+        existing: Dict[int, str] = {}
+        for i in range(0, len(media_ids), MAX_PER_PAGE):
+            chunk = media_ids[i:i + MAX_PER_PAGE]
+            async with semaphore:
+                session = get_http_session()
+                async with session.get(
+                    f"{api_url}/media",
+                    params={"include": ",".join(map(str, chunk)), "per_page": MAX_PER_PAGE},
+                    auth=auth
+                ) as response:
+                    if response.status != 200:
+                        raise ValueError(f"HTTP {response.status}: {await response.text()}")
+                    for item in await response.json():
+                        existing[item["id"]] = item["source_url"]
+        return existing
+
+    async def _upload(
+        self,
+        api_url: str,
+        auth: aiohttp.BasicAuth,
+        digest: str,
+        data: bytes,
+        content_type: str,
+        image: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        extension = CONTENT_TYPE_EXTENSIONS.get(content_type, "jpg")
+        headers = {
+            "Content-Type": content_type,
+            "Content-Disposition": f'attachment; filename="{digest[:16]}.{extension}"'
+        }
+        # 미디어 생성 요청은 본문이 파일이므로 메타데이터는 쿼리 파라미터로 전달
+        params = {}
+        if image.get("alt_text"):
+            params["alt_text"] = image["alt_text"]
+        attribution = image.get("attribution") or {}
+        if attribution.get("photographer"):
+            params["caption"] = f"사진: {attribution['photographer']} ({attribution.get('source', 'Unsplash')})"
+
+        async with semaphore:
+            session = get_http_session()
+            async with session.post(
+                f"{api_url}/media",
+                data=data,
+                headers=headers,
+                params=params,
+                auth=auth
+            ) as response:
+                if response.status != 201:
+                    raise ValueError(f"HTTP {response.status}: {await response.text()}")
+                result = await response.json()
+
+        self.stats["uploaded"] += 1
+        logger.info("WordPress 미디어 업로드", media_id=result["id"], digest=digest, size=len(data))
+        return {"id": result["id"], "source_url": result["source_url"], "stored_at": time.time()}
+
+    async def _upload_once(
+        self,
+        scope: str,
+        api_url: str,
+        auth: aiohttp.BasicAuth,
+        digest: str,
+        data: bytes,
+        content_type: str,
+        image: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        # 같은 사이트에 같은 해시를 동시에 올리는 요청은 한 번만 업로드
+        key = (scope, digest)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._upload(api_url, auth, digest, data, content_type, image, semaphore)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    # 공개 API
+
+    async def upload_images(
+        self,
+        api_url: str,
+        auth: aiohttp.BasicAuth,
+        images: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        이미지를 사이트 미디어 라이브러리에 올립니다 (이미 올린 사진은 재사용).
+
+        Args:
+            api_url: 사이트의 wp/v2 API URL
+            auth: 사이트 인증 정보
+            images: url, alt_text, attribution을 가진 이미지 정보
+
+        Returns:
+            원본 URL → {"id", "source_url"} (실패한 이미지는 제외, 원본 URL 유지)
+        """
+        unique: Dict[str, Dict[str, Any]] = {}
+        for image in images:
+            if image and image.get("url") and image["url"] not in unique:
+                unique[image["url"]] = image
+        if not unique:
+            return {}
+
+        scope = f"{api_url}|media"
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        # 1. 동시에 내려받아 콘텐츠 해시 계산
+        urls = list(unique)
+        reads = await asyncio.gather(*[self._read_image(url, semaphore) for url in urls], return_exceptions=True)
+        payloads: Dict[str, Tuple[str, bytes, str]] = {}
+        for url, result in zip(urls, reads):
+            if isinstance(result, Exception):
+                self.stats["errors"] += 1
+                logger.warning(f"WordPress 업로드용 이미지 읽기 실패: {str(result)}", url=url)
+                continue
+            data, content_type = result
+            payloads[url] = (sha256(data).hexdigest()[:32], data, content_type)
+
+        # 2. 색인에 있는 해시는 재사용 (TTL이 지난 항목은 include 조회로 확인)
+        index = await self.store.load(scope)
+        now = time.time()
+        media: Dict[str, Dict[str, Any]] = {}
+        stale: Dict[str, Dict[str, Any]] = {}
+        for digest, _, _ in payloads.values():
+            entry = index.get(digest)
+            if entry is None:
+                continue
+            if now - entry["stored_at"] < self.ttl_seconds:
+                media[digest] = entry
+            else:
+                stale[digest] = entry
+
+        updates: Dict[str, Dict[str, Any]] = {}
+        if stale:
+            try:
+                existing = await self._existing_media(
+                    api_url, auth, [entry["id"] for entry in stale.values()], semaphore
+                )
+            except Exception as e:
+                logger.warning(f"WordPress 미디어 확인 실패: {str(e)}")
+                existing = {}
+            gone = []
+            for digest, entry in stale.items():
+                if entry["id"] in existing:
+                    media[digest] = updates[digest] = {
+                        "id": entry["id"], "source_url": existing[entry["id"]], "stored_at": now
+                    }
+                    self.stats["revalidated"] += 1
+                else:
+                    gone.append(digest)
+            await self.store.forget(scope, gone)
+        self.stats["reused"] += len(media)
+
+        # 3. 없는 해시만 동시에 업로드 (같은 사진이 여러 URL로 들어와도 한 번)
+        pending: Dict[str, str] = {}
+        for url, (digest, _, _) in payloads.items():
+            if digest not in media:
+                pending.setdefault(digest, url)
+        if pending:
+            results = await asyncio.gather(*[
+                self._upload_once(
+                    scope, api_url, auth, digest, payloads[url][1], payloads[url][2], unique[url], semaphore
+                )
+                for digest, url in pending.items()
+            ], return_exceptions=True)
+            for (digest, url), result in zip(pending.items(), results):
+                if isinstance(result, Exception):
+                    self.stats["errors"] += 1
+                    logger.warning(f"WordPress 미디어 업로드 실패: {str(result)}", url=url)
+                else:
+                    media[digest] = updates[digest] = result
+
+        if updates:
+            await self.store.store(scope, updates)
+
+        return {
+            url: {"id": media[digest]["id"], "source_url": media[digest]["source_url"]}
+            for url, (digest, _, _) in payloads.items()
+            if digest in media
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """업로드 지표"""
+        return {**self.stats, "store_errors": self.store.errors, "sites": self.store.scopes}
+
+
+# 글로벌 인스턴스
+wordpress_media_uploader = None
+
+def get_wordpress_media_uploader() -> WordPressMediaUploader:
+    """WordPress 미디어 업로더 인스턴스 반환"""
+    global wordpress_media_uploader
+    if wordpress_media_uploader is None:
+        wordpress_media_uploader = WordPressMediaUploader(
+            ttl_seconds=settings.wordpress_term_cache_ttl_seconds,
+            redis_url=settings.redis_url if settings.wordpress_term_cache_backend == "redis" else None,
+            disk_dir=settings.wordpress_media_cache_dir if settings.wordpress_term_cache_backend == "disk" else None,
+            concurrency=settings.wordpress_media_upload_concurrency,
+            image_store=get_image_store() if image_store_active() else None
+        )
+    return wordpress_media_uploader
@@ -1,8 +1,17 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
 import aiohttp
 from bs4 import BeautifulSoup
 
+from app.core.config import settings
+from app.core.http_client import get_http_session
 from app.services.publishers.base_publisher import BasePublisher
+from app.services.publishers.wordpress_media import (
+    find_content_images,
+    get_wordpress_media_uploader,
+    rewrite_image_urls,
+)
+from app.services.publishers.wordpress_terms import get_wordpress_term_cache, normalize_term
 
 
 class WordPressPublisher(BasePublisher):
@@ -14,6 +23,8 @@ class WordPressPublisher(BasePublisher):
         self.username = credentials.get("username")
         self.password = credentials.get("password")
         self.api_url = f"{self.site_url}/wp-json/wp/v2"
+        self.term_cache = get_wordpress_term_cache()
+        self.media_uploader = get_wordpress_media_uploader() if settings.wordpress_media_upload else None
     
     async def publish(
         self,
@@ -28,61 +39,52 @@ class WordPressPublisher(BasePublisher):
             prepared_content = self._prepare_content(content)
             tags = self._prepare_tags(keywords)
             
-            # 카테고리 ID 가져오기 (선택사항)
-            category_ids = await self._get_or_create_categories(kwargs.get("categories", []))
-            
-            # 태그 ID 가져오기
-            tag_ids = await self._get_or_create_tags(tags)
+            # 카테고리(선택사항), 태그 ID와 이미지 업로드를 동시에 진행
+            category_ids, tag_ids, (prepared_content, featured_media) = await asyncio.gather(
+                self._get_or_create_categories(kwargs.get("categories", [])),
+                self._get_or_create_tags(tags),
+                self._upload_media(prepared_content, kwargs.get("featured_image"), kwargs.get("images"))
+            )
             
             # 포스트 데이터 준비
-            post_data = {
-                "title": title,
-                "content": prepared_content,
-                "status": "publish",
-                "categories": category_ids,
-                "tags": tag_ids,
-            }
-            
-            # 메타 데이터 추가 (Yoast SEO 플러그인 지원)
-            if meta_description:
-                post_data["meta"] = {
-                    "_yoast_wpseo_metadesc": meta_description
-                }
+            post_data = self._post_data(
+                title, prepared_content, meta_description, category_ids, tag_ids, featured_media
+            )
             
             # API 호출
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/posts",
-                    json=post_data,
-                    auth=aiohttp.BasicAuth(self.username, self.password)
-                ) as response:
-                    if response.status == 201:
-                        result = await response.json()
-                        
-                        self.logger.info(
-                            "WordPress post published successfully",
-                            post_id=result["id"],
-                            url=result["link"]
-                        )
-                        
-                        return {
-                            "success": True,
-                            "post_id": str(result["id"]),
-                            "url": result["link"]
-                        }
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(
-                            "WordPress publish failed",
-                            status=response.status,
-                            error=error_text
-                        )
-                        
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}: {error_text}"
-                        }
-                        
+            session = get_http_session()
+            async with session.post(
+                f"{self.api_url}/posts",
+                json=post_data,
+                auth=self._auth()
+            ) as response:
+                if response.status == 201:
+                    result = await response.json()
+                    
+                    self.logger.info(
+                        "WordPress post published successfully",
+                        post_id=result["id"],
+                        url=result["link"]
+                    )
+                    
+                    return {
+                        "success": True,
+                        "post_id": str(result["id"]),
+                        "url": result["link"]
+                    }
+                else:
+                    error_text = await response.text()
+                    self.logger.error(
+                        "WordPress publish failed",
+                        status=response.status,
+                        error=error_text
+                    )
+                    
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             self.logger.error("WordPress publish error", error=str(e))
             return {
@@ -106,27 +108,39 @@ class WordPressPublisher(BasePublisher):
             if content:
                 update_data["content"] = self._prepare_content(content)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(
-                    f"{self.api_url}/posts/{post_id}",
-                    json=update_data,
-                    auth=aiohttp.BasicAuth(self.username, self.password)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        return {
-                            "success": True,
-                            "post_id": str(result["id"]),
-                            "url": result["link"]
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}: {error_text}"
-                        }
-                        
+            # 이미지 업로드 후 본문 URL 교체, 대표 이미지 지정
+            if content or kwargs.get("featured_image"):
+                prepared_content, featured_media = await self._upload_media(
+                    update_data.get("content", ""),
+                    kwargs.get("featured_image"),
+                    kwargs.get("images")
+                )
+                if content:
+                    update_data["content"] = prepared_content
+                if featured_media:
+                    update_data["featured_media"] = featured_media
+            
+            session = get_http_session()
+            async with session.patch(
+                f"{self.api_url}/posts/{post_id}",
+                json=update_data,
+                auth=self._auth()
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    return {
+                        "success": True,
+                        "post_id": str(result["id"]),
+                        "url": result["link"]
+                    }
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             self.logger.error("WordPress update error", error=str(e))
             return {
@@ -136,20 +150,20 @@ class WordPressPublisher(BasePublisher):
     
     async def delete(self, post_id: str) -> Dict:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(
-                    f"{self.api_url}/posts/{post_id}",
-                    auth=aiohttp.BasicAuth(self.username, self.password)
-                ) as response:
-                    if response.status == 200:
-                        return {"success": True}
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}: {error_text}"
-                        }
-                        
+            session = get_http_session()
+            async with session.delete(
+                f"{self.api_url}/posts/{post_id}",
+                auth=self._auth()
+            ) as response:
+                if response.status == 200:
+                    return {"success": True}
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             self.logger.error("WordPress delete error", error=str(e))
             return {
@@ -157,62 +171,215 @@ class WordPressPublisher(BasePublisher):
                 "error": str(e)
             }
     
-    async def _get_or_create_categories(self, category_names: List[str]) -> List[int]:
-        """카테고리 ID를 가져오거나 생성합니다."""
-        category_ids = []
+    async def publish_batch(self, operations: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        여러 포스트의 생성/수정/삭제를 /batch/v1 요청으로 묶어 보냅니다 (요청당 최대 wordpress_batch_size개).
+        태그/카테고리는 모든 포스트 것을 한 번에 조회/생성하고, 이미지는 포스트별로 동시에 업로드합니다.
+        
+        Args:
+            operations: {"action": "create" | "update" | "delete", "ref": 호출자 식별값, "post_id",
+                         "title", "content", "meta_description", "keywords", "categories",
+                         "featured_image", "images"}
+        
+        Returns:
+            operations 순서의 결과 리스트 ({"ref", "success", "post_id", "url", "error"})
+        """
+        if not operations:
+            return []
+        
+        try:
+            requests = await self._batch_requests(operations)
+        except Exception as e:
+            self.logger.error("WordPress batch prepare error", error=str(e))
+            return [{"ref": op.get("ref"), "success": False, "error": str(e)} for op in operations]
         
-        for name in category_names:
-            # 기존 카테고리 검색
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}/categories",
-                    params={"search": name},
-                    auth=aiohttp.BasicAuth(self.username, self.password)
-                ) as response:
-                    if response.status == 200:
-                        categories = await response.json()
-                        
-                        if categories:
-                            category_ids.append(categories[0]["id"])
-                        else:
-                            # 새 카테고리 생성
-                            async with session.post(
-                                f"{self.api_url}/categories",
-                                json={"name": name},
-                                auth=aiohttp.BasicAuth(self.username, self.password)
-                            ) as create_response:
-                                if create_response.status == 201:
-                                    new_category = await create_response.json()
-                                    category_ids.append(new_category["id"])
+        size = max(1, settings.wordpress_batch_size)
+        chunks = [requests[i:i + size] for i in range(0, len(requests), size)]
+        semaphore = asyncio.Semaphore(settings.wordpress_request_concurrency)
+        responses = await asyncio.gather(*[
+            self._send_batch(chunk, semaphore) for chunk in chunks
+        ], return_exceptions=True)
         
-        return category_ids
+        results = []
+        for chunk, chunk_responses in zip(chunks, responses):
+            if isinstance(chunk_responses, Exception):
+                self.logger.error("WordPress batch error", error=str(chunk_responses))
+                chunk_responses = [{"status": 0, "body": {"message": str(chunk_responses)}}] * len(chunk)
+            for request, response in zip(chunk, chunk_responses):
+                results.append(self._batch_result(request, response))
+        
+        for op, result in zip(operations, results):
+            result["ref"] = op.get("ref")
+        
+        self.logger.info(
+            "WordPress batch completed",
+            total=len(results),
+            succeeded=sum(1 for result in results if result["success"]),
+            batches=len(chunks)
+        )
+        return results
     
-    async def _get_or_create_tags(self, tag_names: List[str]) -> List[int]:
-        """태그 ID를 가져오거나 생성합니다."""
-        tag_ids = []
+    async def _batch_requests(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """작업 목록 → /batch/v1 요청 항목 (method, path, body)"""
+        auth = self._auth()
+        writes = [op for op in operations if op.get("action", "create") != "delete"]
+        tag_names = [tag for op in writes for tag in self._prepare_tags(op.get("keywords"))]
+        category_names = [name for op in writes for name in op.get("categories") or []]
         
-        for name in tag_names:
-            # 기존 태그 검색
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}/tags",
-                    params={"search": name},
-                    auth=aiohttp.BasicAuth(self.username, self.password)
-                ) as response:
-                    if response.status == 200:
-                        tags = await response.json()
-                        
-                        if tags:
-                            tag_ids.append(tags[0]["id"])
-                        else:
-                            # 새 태그 생성
-                            async with session.post(
-                                f"{self.api_url}/tags",
-                                json={"name": name},
-                                auth=aiohttp.BasicAuth(self.username, self.password)
-                            ) as create_response:
-                                if create_response.status == 201:
-                                    new_tag = await create_response.json()
-                                    tag_ids.append(new_tag["id"])
+        tag_ids, category_ids, *media = await asyncio.gather(
+            self.term_cache.resolve_names(self.api_url, "tags", tag_names, auth),
+            self.term_cache.resolve_names(self.api_url, "categories", category_names, auth),
+            *[
+                self._upload_media(
+                    self._prepare_content(op["content"]) if op.get("content") else "",
+                    op.get("featured_image"),
+                    op.get("images")
+                )
+                for op in writes
+            ]
+        )
         
-        return tag_ids
\ No newline at end of file
+        requests = []
+        prepared = iter(media)
+        for op in operations:
+            action = op.get("action", "create")
+            if action == "delete":
+                requests.append({"method": "DELETE", "path": f"/wp/v2/posts/{op['post_id']}"})
+                continue
+            
+            content, featured_media = next(prepared)
+            if action == "create":
+                body = self._post_data(
+                    op.get("title"),
+                    content,
+                    op.get("meta_description"),
+                    self._term_ids(category_ids, op.get("categories") or []),
+                    self._term_ids(tag_ids, self._prepare_tags(op.get("keywords"))),
+                    featured_media
+                )
+                requests.append({"method": "POST", "path": "/wp/v2/posts", "body": body})
+            elif action == "update":
+                body = {}
+                if op.get("title"):
+                    body["title"] = op["title"]
+                if op.get("content"):
+                    body["content"] = content
+                if featured_media:
+                    body["featured_media"] = featured_media
+                requests.append({"method": "PATCH", "path": f"/wp/v2/posts/{op['post_id']}", "body": body})
+            else:
+                raise ValueError(f"Unsupported batch action: {action}")
+        return requests
+    
+    async def _send_batch(self, requests: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> List[Dict]:
+        """요청 항목을 /batch/v1로 보냅니다 (배치 API가 없는 WordPress 5.6 미만은 항목별 요청)."""
+        async with semaphore:
+            session = get_http_session()
+            async with session.post(
+                f"{self.site_url}/wp-json/batch/v1",
+                json={"validation": "normal", "requests": requests},
+                auth=self._auth()
+            ) as response:
+                if response.status == 404:
+                    self.logger.warning("WordPress batch API not available, sending requests one by one")
+                else:
+                    data = await response.json(content_type=None)
+                    if response.status not in (200, 207) or not isinstance(data, dict):
+                        raise ValueError(f"HTTP {response.status}: {data}")
+                    return data.get("responses", [])
+        
+        return await asyncio.gather(*[self._send_single(request, semaphore) for request in requests])
+    
+    async def _send_single(self, request: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict:
+        async with semaphore:
+            session = get_http_session()
+            async with session.request(
+                request["method"],
+                f"{self.site_url}/wp-json{request['path']}",
+                json=request.get("body"),
+                auth=self._auth()
+            ) as response:
+                return {"status": response.status, "body": await response.json(content_type=None)}
+    
+    def _batch_result(self, request: Dict[str, Any], response: Dict[str, Any]) -> Dict:
+        """배치 응답 항목 → publish/update/delete와 같은 형태의 결과"""
+        status = response.get("status", 0)
+        body = response.get("body") or {}
+        if status not in (200, 201):
+            message = body.get("message") if isinstance(body, dict) else body
+            return {"success": False, "error": f"HTTP {status}: {message}"}
+        if request["method"] == "DELETE":
+            return {"success": True}
+        return {"success": True, "post_id": str(body["id"]), "url": body.get("link")}
+    
+    def _post_data(
+        self,
+        title: str,
+        content: str,
+        meta_description: Optional[str],
+        category_ids: List[int],
+        tag_ids: List[int],
+        featured_media: Optional[int] = None
+    ) -> Dict[str, Any]:
+        post_data = {
+            "title": title,
+            "content": content,
+            "status": "publish",
+            "categories": category_ids,
+            "tags": tag_ids,
+        }
+        if featured_media:
+            post_data["featured_media"] = featured_media
+        
+        # 메타 데이터 추가 (Yoast SEO 플러그인 지원)
+        if meta_description:
+            post_data["meta"] = {
+                "_yoast_wpseo_metadesc": meta_description
+            }
+        return post_data
+    
+    @staticmethod
+    def _term_ids(resolved: Dict[str, int], names: List[str]) -> List[int]:
+        ids = [resolved.get(normalize_term(name)) for name in names]
+        return list(dict.fromkeys(term_id for term_id in ids if term_id is not None))
+    
+    def _auth(self) -> aiohttp.BasicAuth:
+        return aiohttp.BasicAuth(self.username, self.password)
+    
+    async def _upload_media(
+        self,
+        content: str,
+        featured_image: Optional[Dict[str, Any]] = None,
+        images: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[str, Optional[int]]:
+        """
+        본문 이미지와 대표 이미지를 미디어 라이브러리에 올리고 본문 URL을 바꿉니다.
+        
+        Returns:
+            (URL을 바꾼 본문, 대표 이미지 미디어 ID) - 업로드에 실패한 이미지는 원본 URL 유지
+        """
+        if self.media_uploader is None:
+            return content, None
+        
+        # 전달받은 이미지 정보(출처 캡션 등)를 본문에서 찾은 이미지에 합침
+        known = {image["url"]: image for image in images or [] if image and image.get("url")}
+        targets = [{**image, **known.get(image["url"], {})} for image in find_content_images(content)]
+        if featured_image and featured_image.get("url"):
+            targets.insert(0, featured_image)
+        if not targets:
+            return content, None
+        
+        media = await self.media_uploader.upload_images(self.api_url, self._auth(), targets)
+        content = rewrite_image_urls(content, {url: item["source_url"] for url, item in media.items()})
+        featured = media.get(featured_image["url"]) if featured_image and featured_image.get("url") else None
+        
+        self.logger.info("WordPress media prepared", uploaded=len(media), requested=len(targets))
+        return content, featured["id"] if featured else None
+    
+    async def _get_or_create_categories(self, category_names: List[str]) -> List[int]:
+        """카테고리 ID를 가져오거나 생성합니다 (사이트별 캐시, 없는 이름만 한꺼번에 조회/생성)."""
+        return await self.term_cache.resolve(self.api_url, "categories", category_names, self._auth())
+    
+    async def _get_or_create_tags(self, tag_names: List[str]) -> List[int]:
+        """태그 ID를 가져오거나 생성합니다 (사이트별 캐시, 없는 이름만 한꺼번에 조회/생성)."""
+        return await self.term_cache.resolve(self.api_url, "tags", tag_names, self._auth())
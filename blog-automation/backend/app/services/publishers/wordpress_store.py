@@ -0,0 +1,142 @@
+"""
+WordPress 사이트별 키-값 저장소
+
+태그/카테고리 ID 캐시와 업로드한 미디어 색인이 함께 쓰는 저장 계층입니다.
+scope(사이트 API URL + 종류)마다 키 → 항목(dict)을 프로세스 메모리에 두고,
+Redis 해시(redis_url) 또는 디스크 JSON에 남겨 워커 재시작 후에도 유지합니다.
+"""
+import asyncio
+import json
+import os
+import threading
+import uuid
+from hashlib import sha1
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from app.core.executor import offload
+
+logger = structlog.get_logger()
+
+
+class WordPressSiteStore:
+    """scope별 키 → 항목 저장소 (메모리 + Redis 해시 또는 디스크 JSON)"""
+
+    def __init__(self, key_prefix: str, redis_url: Optional[str] = None, disk_dir: Optional[str] = None):
+        self.key_prefix = key_prefix
+        self.redis_url = redis_url
+        self.disk_dir = disk_dir
+
+        self._entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._redis = None
+        self._redis_loop = None
+        self.errors = 0
+
+        # 디스크 쓰기는 스레드 풀에서 실행되므로, 늦게 끝난 이전 내용이 최신 파일을 덮지 않도록 순번으로 구분
+        self._write_lock = threading.Lock()
+        self._write_seq: Dict[str, int] = {}
+        self._written_seq: Dict[str, int] = {}
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @property
+    def scopes(self) -> int:
+        return len(self._entries)
+
+    def _redis_client(self):
+        # redis.asyncio 연결은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+            self._redis_loop = loop
+        return self._redis
+
+    def _disk_path(self, scope: str) -> str:
+        return os.path.join(self.disk_dir, sha1(scope.encode('utf-8')).hexdigest() + '.json')
+
+    @staticmethod
+    def _read_file(path: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write_file(self, scope: str, seq: int, data: str):
+        path = self._disk_path(scope)
+        with self._write_lock:
+            if self._written_seq.get(scope, 0) > seq:
+                return
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._written_seq[scope] = seq
+
+    async def _save_to_disk(self, scope: str, entries: Dict[str, Dict[str, Any]]):
+        # 직렬화는 루프에서 (항목이 바뀌는 도중에 읽지 않도록), 파일 쓰기는 이벤트 루프 밖에서 실행
+        data = json.dumps(entries, ensure_ascii=False)
+        seq = self._write_seq.get(scope, 0) + 1
+        self._write_seq[scope] = seq
+        await offload(self._write_file, scope, seq, data)
+
+    async def load(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        """scope의 전체 항목 (처음 한 번만 Redis/디스크에서 읽음)"""
+        entries = self._entries.get(scope)
+        if entries is not None:
+            return entries
+
+        entries = {}
+        try:
+            if self.redis_url:
+                raw = await self._redis_client().hgetall(f"{self.key_prefix}:{scope}")
+                entries = {key: json.loads(value) for key, value in raw.items()}
+            elif self.disk_dir:
+                entries = await offload(self._read_file, self._disk_path(scope))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"WordPress 캐시 로드 실패: {str(e)}", prefix=self.key_prefix, scope=scope)
+
+        # 읽는 동안 같은 scope에 먼저 저장/로드된 항목이 있으면 그쪽을 유지
+        current = self._entries.get(scope)
+        if current is not None:
+            for key, entry in entries.items():
+                current.setdefault(key, entry)
+            return current
+        self._entries[scope] = entries
+        return entries
+
+    async def store(self, scope: str, updates: Dict[str, Dict[str, Any]]):
+        """항목 추가/갱신"""
+        entries = self._entries.setdefault(scope, {})
+        entries.update(updates)
+        try:
+            if self.redis_url:
+                await self._redis_client().hset(
+                    f"{self.key_prefix}:{scope}",
+                    mapping={key: json.dumps(entry) for key, entry in updates.items()}
+                )
+            elif self.disk_dir:
+                await self._save_to_disk(scope, entries)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"WordPress 캐시 저장 실패: {str(e)}", prefix=self.key_prefix, scope=scope)
+
+    async def forget(self, scope: str, keys: List[str]):
+        """항목 삭제"""
+        if not keys:
+            return
+        entries = self._entries.get(scope, {})
+        for key in keys:
+            entries.pop(key, None)
+        try:
+            if self.redis_url:
+                await self._redis_client().hdel(f"{self.key_prefix}:{scope}", *keys)
+            elif self.disk_dir:
+                await self._save_to_disk(scope, entries)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"WordPress 캐시 삭제 실패: {str(e)}", prefix=self.key_prefix, scope=scope)
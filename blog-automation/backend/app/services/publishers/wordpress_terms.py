@@ -0,0 +1,266 @@
+"""
+WordPress 태그/카테고리 ID 캐시
+
+포스트마다 태그 이름을 하나씩 검색하고 없으면 만드는 대신, 사이트별 이름 → ID 캐시를 두고
+캐시에 없는 이름만 한꺼번에 조회/생성합니다.
+
+- 캐시: 프로세스 메모리 + Redis 해시(redis_url) 또는 디스크 JSON (wordpress_store, 워커 재시작 후에도 유지)
+- TTL이 지난 ID는 include=1,2,3 조회 한 번으로 아직 있는지 확인
+- 캐시에 없는 이름은 search 조회를 동시에 보내 이름이 정확히 같은 항목만 사용 (부분 일치 X)
+- 그래도 없는 이름은 동시에 생성, 다른 워커가 먼저 만들어 term_exists가 오면 응답의 term_id 사용
+"""
+import asyncio
+import html
+import re
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import structlog
+
+from app.core.config import settings
+from app.core.http_client import get_http_session
+from app.services.publishers.wordpress_store import WordPressSiteStore
+
+logger = structlog.get_logger()
+
+WHITESPACE_RE = re.compile(r'\s+')
+MAX_PER_PAGE = 100
+
+
+def normalize_term(name: str) -> str:
+    """대소문자, 공백, 유니코드 조합형, HTML 엔티티 차이를 없앤 태그 이름"""
+    name = unicodedata.normalize('NFC', html.unescape(name or ''))
+    return WHITESPACE_RE.sub(' ', name).strip().lower()
+
+
+class WordPressTermCache:
+    """사이트별 WordPress 태그/카테고리 이름 → ID 캐시"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 86400,
+        redis_url: Optional[str] = None,
+        disk_dir: Optional[str] = None,
+        concurrency: int = 8
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.concurrency = concurrency
+
+        # scope(사이트 API URL + 분류) → 정규화 이름 → {"id", "stored_at"}
+        self.store = WordPressSiteStore("wp_terms", redis_url=redis_url, disk_dir=disk_dir)
+
+        self.stats = {
+            "hits": 0,
+            "revalidated": 0,
+            "searched": 0,
+            "created": 0,
+            "errors": 0,
+        }
+
+    # WordPress API
+
+    async def _list_terms(
+        self,
+        url: str,
+        auth: aiohttp.BasicAuth,
+        params: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """분류 목록 한 페이지 조회 → (항목 리스트, 전체 페이지 수)"""
+        async with semaphore:
+            session = get_http_session()
+            async with session.get(url, params={"per_page": MAX_PER_PAGE, **params}, auth=auth) as response:
+                if response.status != 200:
+                    raise ValueError(f"HTTP {response.status}: {await response.text()}")
+                total_pages = int(response.headers.get("X-WP-TotalPages", 1) or 1)
+                return await response.json(), total_pages
+
+    async def _revalidate(
+        self,
+        url: str,
+        auth: aiohttp.BasicAuth,
+        term_ids: List[int],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[int, str]:
+        """캐시된 ID가 아직 있는지 include 조회로 확인 → {ID: 정규화 이름}"""
+        chunks = [term_ids[i:i + MAX_PER_PAGE] for i in range(0, len(term_ids), MAX_PER_PAGE)]
+        pages = await asyncio.gather(*[
+            self._list_terms(url, auth, {"include": ",".join(map(str, chunk))}, semaphore)
+            for chunk in chunks
+        ])
+        return {term["id"]: normalize_term(term["name"]) for terms, _ in pages for term in terms}
+
+    async def _search(
+        self,
+        url: str,
+        auth: aiohttp.BasicAuth,
+        key: str,
+        name: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[int]:
+        """이름이 정확히 같은 항목의 ID (search는 부분 일치이므로 결과 페이지를 확인)"""
+        page = 1
+        while True:
+            terms, total_pages = await self._list_terms(url, auth, {"search": name, "page": page}, semaphore)
+            for term in terms:
+                if normalize_term(term["name"]) == key:
+                    return term["id"]
+            if page >= total_pages:
+                return None
+            page += 1
+
+    async def _create(
+        self,
+        url: str,
+        auth: aiohttp.BasicAuth,
+        name: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[int]:
+        """새 항목 생성 (이미 있으면 term_exists 응답의 ID)"""
+        async with semaphore:
+            session = get_http_session()
+            async with session.post(url, json={"name": name}, auth=auth) as response:
+                data = await response.json(content_type=None)
+                if response.status == 201:
+                    return data["id"]
+                if response.status == 400 and isinstance(data, dict) and data.get("code") == "term_exists":
+                    term_id = data.get("data", {}).get("term_id")
+                    return int(term_id) if term_id is not None else None
+                raise ValueError(f"HTTP {response.status}: {data}")
+
+    # 공개 API
+
+    async def resolve(
+        self,
+        api_url: str,
+        taxonomy: str,
+        names: List[str],
+        auth: aiohttp.BasicAuth
+    ) -> List[int]:
+        """
+        이름 목록을 ID 목록으로 바꿉니다 (없는 이름은 생성).
+
+        Args:
+            api_url: 사이트의 wp/v2 API URL
+            taxonomy: "tags" 또는 "categories"
+            names: 태그/카테고리 이름
+            auth: 사이트 인증 정보
+
+        Returns:
+            입력 순서의 ID 리스트 (조회/생성에 실패한 이름은 제외, 중복 제거)
+        """
+        resolved = await self.resolve_names(api_url, taxonomy, names, auth)
+        ids = [resolved.get(normalize_term(name)) for name in names]
+        return list(dict.fromkeys(term_id for term_id in ids if term_id is not None))
+
+    async def resolve_names(
+        self,
+        api_url: str,
+        taxonomy: str,
+        names: List[str],
+        auth: aiohttp.BasicAuth
+    ) -> Dict[str, int]:
+        """
+        이름 목록을 정규화 이름 → ID 딕셔너리로 바꿉니다 (없는 이름은 생성).
+        여러 포스트의 태그를 한 번에 처리할 때 사용합니다.
+        """
+        originals: Dict[str, str] = {}
+        for name in names:
+            key = normalize_term(name)
+            if key and key not in originals:
+                originals[key] = name.strip()
+        if not originals:
+            return {}
+
+        scope = f"{api_url}|{taxonomy}"
+        url = f"{api_url}/{taxonomy}"
+        semaphore = asyncio.Semaphore(self.concurrency)
+        terms = await self.store.load(scope)
+        now = time.time()
+
+        resolved: Dict[str, int] = {}
+        stale: Dict[str, int] = {}
+        for key in originals:
+            entry = terms.get(key)
+            if entry is None:
+                continue
+            if now - entry["stored_at"] < self.ttl_seconds:
+                resolved[key] = entry["id"]
+            else:
+                stale[key] = entry["id"]
+        self.stats["hits"] += len(resolved)
+
+        updates: Dict[str, Dict[str, Any]] = {}
+
+        # 1. 기간이 지난 ID는 include 조회 한 번으로 확인 (삭제되었거나 이름이 바뀌었으면 다시 검색)
+        if stale:
+            try:
+                existing = await self._revalidate(url, auth, list(stale.values()), semaphore)
+            except Exception as e:
+                logger.warning(f"WordPress 태그 확인 실패: {str(e)}", taxonomy=taxonomy)
+                existing = {}
+            gone = []
+            for key, term_id in stale.items():
+                if existing.get(term_id) == key:
+                    resolved[key] = term_id
+                    updates[key] = {"id": term_id, "stored_at": now}
+                    self.stats["revalidated"] += 1
+                else:
+                    gone.append(key)
+            await self.store.forget(scope, gone)
+
+        # 2. 캐시에 없는 이름은 동시에 검색
+        missing = [key for key in originals if key not in resolved]
+        if missing:
+            results = await asyncio.gather(*[
+                self._search(url, auth, key, originals[key], semaphore) for key in missing
+            ], return_exceptions=True)
+            for key, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"WordPress 태그 검색 실패: {str(result)}", name=originals[key])
+                elif result is not None:
+                    resolved[key] = result
+                    updates[key] = {"id": result, "stored_at": now}
+                    self.stats["searched"] += 1
+
+        # 3. 그래도 없는 이름은 동시에 생성
+        missing = [key for key in originals if key not in resolved]
+        if missing:
+            results = await asyncio.gather(*[
+                self._create(url, auth, originals[key], semaphore) for key in missing
+            ], return_exceptions=True)
+            for key, result in zip(missing, results):
+                if isinstance(result, Exception) or result is None:
+                    self.stats["errors"] += 1
+                    logger.warning(f"WordPress 태그 생성 실패: {str(result)}", name=originals[key])
+                else:
+                    resolved[key] = result
+                    updates[key] = {"id": result, "stored_at": now}
+                    self.stats["created"] += 1
+
+        if updates:
+            await self.store.store(scope, updates)
+
+        return resolved
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 지표"""
+        return {**self.stats, "store_errors": self.store.errors, "sites": self.store.scopes}
+
+
+# 글로벌 인스턴스
+wordpress_term_cache = None
+
+def get_wordpress_term_cache() -> WordPressTermCache:
+    """WordPress 태그/카테고리 캐시 인스턴스 반환"""
+    global wordpress_term_cache
+    if wordpress_term_cache is None:
+        wordpress_term_cache = WordPressTermCache(
+            ttl_seconds=settings.wordpress_term_cache_ttl_seconds,
+            redis_url=settings.redis_url if settings.wordpress_term_cache_backend == "redis" else None,
+            disk_dir=settings.wordpress_term_cache_dir if settings.wordpress_term_cache_backend == "disk" else None,
+            concurrency=settings.wordpress_request_concurrency
+        )
+    return wordpress_term_cache
@@ -0,0 +1,115 @@
+"""
+이미지 검색어 한국어 → 영어 변환기
+
+Unsplash는 한국어 검색어에 대한 결과가 빈약해서 대체 검색이 늘어납니다.
+파일(app/data/korean_to_english.tsv)에서 읽은 용어 사전으로 KeywordMatcher(Aho-Corasick)를
+한 번만 빌드하고, 검색어를 한 번 훑어서 매칭된 용어를 모두 영어로 바꿉니다.
+
+- 긴 용어 우선, 겹치지 않게 왼쪽부터 매칭 ("빅데이터 분석" → "big data", "데이터" 단독 매칭 없음)
+- 어절 경계를 지키고 뒤에 붙은 조사는 함께 제거 ("인공지능의 미래" → "artificial intelligence future")
+- 하나라도 번역되면 사전에 없는 한국어 어절은 버림 (영어 검색어 품질 우선)
+- 결과는 메모이즈해서 같은 검색어는 다시 계산하지 않음
+
+앱 설정 없이도 쓸 수 있도록(test_server.py) app.core.config에 의존하지 않습니다.
+"""
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from app.services.keyword_matcher import KOREAN_PARTICLES, KeywordMatcher, _is_word_char
+
+DEFAULT_DICTIONARY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "korean_to_english.tsv"
+)
+
+HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+
+
+def load_dictionary(path: str = DEFAULT_DICTIONARY_PATH) -> Dict[str, str]:
+    """탭으로 구분된 한국어/영어 용어 사전을 읽습니다."""
+    terms: Dict[str, str] = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            korean, _, english = line.partition('\t')
+            if korean.strip() and english.strip():
+                terms[korean.strip().lower()] = english.strip()
+    return terms
+
+
+class QueryTranslator:
+    """용어 사전 기반 검색어 변환기"""
+
+    def __init__(self, terms: Dict[str, str], cache_size: int = 4096):
+        self.terms = {korean.lower(): english for korean, english in terms.items()}
+        self.matcher = KeywordMatcher(self.terms.keys(), korean_boundaries=True)
+        self.translate = lru_cache(maxsize=cache_size)(self._translate)
+
+    def _particle_end(self, text: str, end: int) -> int:
+        # 용어 바로 뒤에 붙은 조사까지 포함한 끝 위치
+        if end < len(text) and _is_word_char(text[end]):
+            for particle in KOREAN_PARTICLES:
+                tail = end + len(particle)
+                if text.startswith(particle, end) and (tail >= len(text) or not _is_word_char(text[tail])):
+                    return tail
+        return end
+
+    def _spans(self, query: str) -> List[Tuple[int, int, str]]:
+        """겹치지 않는 (시작, 끝, 영어) 매칭 구간 - 왼쪽부터, 같은 위치면 긴 용어 우선"""
+        lowered = query.lower()
+        matches = sorted(
+            self.matcher.iter_matches(query),
+            key=lambda match: (match[1], -(match[2] - match[1]))
+        )
+        spans = []
+        cursor = 0
+        for index, start, end in matches:
+            if start < cursor:
+                continue
+            english = self.terms[self.matcher.keywords[index].lower()]
+            end = self._particle_end(lowered, end)
+            spans.append((start, end, english))
+            cursor = end
+        return spans
+
+    def _translate(self, query: str) -> str:
+        spans = self._spans(query)
+        if not spans:
+            return query
+
+        words: List[str] = []
+
+        def add_gap(text: str):
+            for token in text.split():
+                # 사전에 없는 한국어 어절은 버리고 숫자/영어는 유지
+                if not HANGUL_RE.search(token):
+                    words.append(token)
+
+        cursor = 0
+        for start, end, english in spans:
+            add_gap(query[cursor:start])
+            if not words or words[-1] != english:
+                words.append(english)
+            cursor = end
+        add_gap(query[cursor:])
+
+        return " ".join(words)
+
+
+# 글로벌 인스턴스
+query_translator: Optional[QueryTranslator] = None
+
+def get_query_translator() -> QueryTranslator:
+    """공용 검색어 변환기 인스턴스 반환 (사전은 처음 한 번만 로드)"""
+    global query_translator
+    if query_translator is None:
+        query_translator = QueryTranslator(load_dictionary())
+    return query_translator
+
+
+def translate_query(query: str) -> str:
+    """이미지 검색어를 영어로 변환합니다 (번역할 용어가 없으면 그대로 반환)."""
+    return get_query_translator().translate(query)
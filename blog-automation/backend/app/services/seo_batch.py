@@ -0,0 +1,156 @@
+"""
+blog_posts 전체를 대상으로 한 배치 SEO 점수 계산
+
+Supabase에서 포스트를 페이지 단위로 스트리밍하고, ProcessPoolExecutor 워커에서
+SEOOptimizer 로직으로 점수를 계산한 뒤 바뀐 점수만 묶어서 다시 저장합니다.
+워커에서 실행되는 함수는 DB 클라이언트를 import하지 않도록 이 모듈에 둡니다.
+
+데몬 프로세스(Celery prefork 워커)는 자식 프로세스를 만들 수 없으므로, 그 안에서 호출되면
+프로세스 풀 없이 현재 프로세스에서 채점합니다. 병렬 채점은 CLI(python -m app.tasks.seo_tasks)로 실행합니다.
+"""
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+from app.services.seo_optimizer import SEOOptimizer
+
+logger = structlog.get_logger()
+
+POST_COLUMNS = "id, title, content, tags, seo_score, readability_score"
+
+# 프로세스별 SEOOptimizer (워커 초기화 시 한 번만 생성)
+_worker_optimizer: Optional[SEOOptimizer] = None
+
+
+def _init_worker():
+    global _worker_optimizer
+    _worker_optimizer = SEOOptimizer()
+
+
+def score_post(post: Dict[str, Any]) -> Tuple[Any, int, int]:
+    """포스트 하나의 (id, seo_score, readability_score)를 계산합니다 (_init_worker 이후 호출)."""
+    keywords = post.get("tags") or [post.get("title") or ""]
+    analysis = _worker_optimizer.analyze_content(post.get("content") or "", keywords)
+    return post["id"], analysis["seo_score"], analysis["readability_score"]
+
+
+def _in_daemon_process() -> bool:
+    return multiprocessing.current_process().daemon
+
+
+def iter_post_pages(client, page_size: int = 200) -> Iterator[List[Dict[str, Any]]]:
+    """blog_posts를 id 순서로 페이지 단위 스트리밍합니다."""
+    start = 0
+    while True:
+        result = client.table('blog_posts').select(POST_COLUMNS).order('id').range(
+            start, start + page_size - 1
+        ).execute()
+        rows = result.data or []
+        if not rows:
+            return
+        yield rows
+        if len(rows) < page_size:
+            return
+        start += page_size
+
+
+def write_changed_scores(client, changed: List[Tuple[Any, int, int]]) -> int:
+    """바뀐 점수를 (seo_score, readability_score) 조합별로 묶어서 한 번에 업데이트합니다.
+
+    점수는 구간 단위라 조합 수가 적기 때문에, 행마다 UPDATE하는 대신
+    조합당 UPDATE ... WHERE id IN (...) 한 번으로 끝납니다.
+    """
+    groups: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+    for post_id, seo_score, readability_score in changed:
+        groups[(seo_score, readability_score)].append(post_id)
+
+    for (seo_score, readability_score), post_ids in groups.items():
+        client.table('blog_posts').update({
+            "seo_score": seo_score,
+            "readability_score": readability_score
+        }).in_('id', post_ids).execute()
+
+    return len(groups)
+
+
+def run_batch_scoring(
+    client,
+    page_size: int = 200,
+    workers: Optional[int] = None,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """모든 포스트의 SEO 점수를 다시 계산하고 바뀐 것만 저장합니다.
+
+    Args:
+        client: Supabase 클라이언트
+        page_size: 한 번에 가져올 포스트 수
+        workers: 프로세스 수 (기본값: CPU 코어 수, 1이거나 데몬 프로세스면 풀 없이 현재 프로세스에서 실행)
+        dry_run: True면 점수 계산만 하고 저장하지 않음
+
+    Returns:
+        처리 통계 (scanned, changed, update_batches, elapsed_seconds, posts_per_second)
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and _in_daemon_process():
+        logger.warning("데몬 프로세스에서는 프로세스 풀을 만들 수 없어 현재 프로세스에서 채점합니다", requested_workers=workers)
+        workers = 1
+    chunksize = max(1, page_size // (workers * 4))
+
+    scanned = 0
+    changed_total = 0
+    update_batches = 0
+    started = time.perf_counter()
+
+    with ExitStack() as stack:
+        if workers > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers, initializer=_init_worker))
+
+            def score_page(rows):
+                return pool.map(score_post, rows, chunksize=chunksize)
+        else:
+            _init_worker()
+
+            def score_page(rows):
+                return map(score_post, rows)
+
+        for rows in iter_post_pages(client, page_size):
+            previous = {
+                row["id"]: (row.get("seo_score"), row.get("readability_score"))
+                for row in rows
+            }
+            changed = [
+                scored for scored in score_page(rows)
+                if previous[scored[0]] != (scored[1], scored[2])
+            ]
+
+            scanned += len(rows)
+            changed_total += len(changed)
+            if changed and not dry_run:
+                update_batches += write_changed_scores(client, changed)
+
+            elapsed = time.perf_counter() - started
+            logger.info(
+                "SEO batch page scored",
+                scanned=scanned,
+                changed=changed_total,
+                posts_per_second=round(scanned / elapsed, 1) if elapsed else None
+            )
+
+    elapsed = time.perf_counter() - started
+    stats = {
+        "scanned": scanned,
+        "changed": changed_total,
+        "update_batches": update_batches,
+        "workers": workers,
+        "elapsed_seconds": round(elapsed, 3),
+        "posts_per_second": round(scanned / elapsed, 1) if elapsed else 0.0,
+        "dry_run": dry_run
+    }
+    logger.info("SEO batch scoring completed", **stats)
+    return stats
@@ -1,10 +1,19 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 import re
 from bs4 import BeautifulSoup
 import structlog
 
+from app.core.config import settings
+from app.core.executor import offload
+from app.services.keyword_matcher import get_keyword_matcher
+from app.services.markdown_analyzer import (
+    MarkdownBlock, tokenize, blocks_to_text, looks_like_markdown
+)
+
 logger = structlog.get_logger()
 
+EMPTY_ALT_IMAGE_RE = re.compile(r'!\[\s*\]\(')
+
 
 class SEOOptimizer:
     def __init__(self):
@@ -12,22 +21,105 @@ class SEOOptimizer:
         self.min_heading_count = 3
         self.optimal_paragraph_length = 150  # words
         self.optimal_sentence_length = 20  # words
+        self.korean_keyword_boundaries = settings.seo_korean_keyword_boundaries  # 어절/조사 경계를 지킨 매칭만 카운트
     
-    async def optimize_content(self, content: str, keywords: List[str]) -> Dict:
-        """콘텐츠를 SEO 최적화하고 점수를 계산합니다."""
+    async def optimize_content(
+        self,
+        content: str,
+        keywords: List[str],
+        content_format: str = "html"
+    ) -> Dict:
+        """콘텐츠를 SEO 최적화하고 점수를 계산합니다.
+        
+        content_format이 "markdown"이면 HTML로 변환하지 않고 마크다운 토큰으로 분석합니다.
+        파싱과 분석은 CPU 작업이므로 오프로드 프로세스 풀에서 실행합니다
+        (API 프로세스가 아니면 app.core.executor가 스레드 풀에서 실행).
+        """
+        return await offload(
+            self.optimize_content_sync, content, keywords, content_format, kind="process"
+        )
+    
+    def optimize_content_sync(
+        self,
+        content: str,
+        keywords: List[str],
+        content_format: str = "html"
+    ) -> Dict:
+        """optimize_content의 동기 버전 (워커 프로세스에서 실행)"""
+        if content_format == "markdown":
+            blocks = tokenize(content)
+            analysis = self._analyze_blocks(blocks, keywords)
+            optimized_content = self._optimize_markdown_structure(content, blocks, keywords)
+            return {
+                "optimized_content": optimized_content,
+                **analysis
+            }
         
         # HTML 파싱
         soup = BeautifulSoup(content, 'html.parser')
         
         # 분석 수행
-        keyword_density = self._calculate_keyword_density(soup.get_text(), keywords)
-        readability_score = self._calculate_readability_score(soup.get_text())
-        heading_analysis = self._analyze_heading_structure(soup)
+        analysis = self._analyze_soup(soup, keywords)
         
         # 최적화 수행
-        optimized_soup = await self._optimize_content_structure(soup, keywords)
+        optimized_soup = self._optimize_soup(soup, keywords)
         optimized_content = str(optimized_soup)
         
+        return {
+            "optimized_content": optimized_content,
+            **analysis
+        }
+    
+    def analyze_content(
+        self,
+        content: str,
+        keywords: List[str],
+        content_format: Optional[str] = None
+    ) -> Dict:
+        """콘텐츠를 수정하지 않고 SEO 점수만 계산합니다.
+        
+        동기 함수라서 배치 작업의 프로세스 풀 워커에서도 그대로 사용할 수 있습니다.
+        content_format을 생략하면 본문을 보고 HTML/마크다운을 판별합니다.
+        """
+        if content_format is None:
+            content_format = "markdown" if looks_like_markdown(content) else "html"
+        
+        if content_format == "markdown":
+            return self._analyze_blocks(tokenize(content), keywords)
+        
+        soup = BeautifulSoup(content, 'html.parser')
+        return self._analyze_soup(soup, keywords)
+    
+    def analyze_markdown(self, content: str, keywords: List[str]) -> Dict:
+        """마크다운 본문의 SEO 지표를 계산합니다 (HTML 경로와 같은 지표)."""
+        return self._analyze_blocks(tokenize(content), keywords)
+    
+    def _analyze_soup(self, soup: BeautifulSoup, keywords: List[str]) -> Dict:
+        """파싱된 HTML 문서에서 SEO 지표를 계산합니다."""
+        return self._analyze_metrics(
+            soup.get_text(), self._analyze_heading_structure(soup), keywords
+        )
+    
+    def _analyze_blocks(self, blocks: List[MarkdownBlock], keywords: List[str]) -> Dict:
+        """마크다운 블록 토큰에서 SEO 지표를 계산합니다."""
+        return self._analyze_metrics(
+            blocks_to_text(blocks), self._analyze_markdown_headings(blocks), keywords
+        )
+    
+    def _analyze_metrics(self, text: str, heading_analysis: Dict, keywords: List[str]) -> Dict:
+        """본문 텍스트와 헤딩 분석으로 SEO 점수와 제안사항을 계산합니다."""
+        keyword_density = self._calculate_keyword_density(text, keywords)
+        readability_score = self._calculate_readability_score(text)
+        
+        return self._build_analysis(keyword_density, readability_score, heading_analysis)
+    
+    def _build_analysis(
+        self,
+        keyword_density: Dict,
+        readability_score: int,
+        heading_analysis: Dict
+    ) -> Dict:
+        """계산된 지표로 SEO 점수와 제안사항을 포함한 분석 결과를 만듭니다."""
         # SEO 점수 계산
         seo_score = self._calculate_seo_score(
             keyword_density, readability_score, heading_analysis
@@ -39,7 +131,6 @@ class SEOOptimizer:
         )
         
         return {
-            "optimized_content": optimized_content,
             "seo_score": seo_score,
             "readability_score": readability_score,
             "keyword_density": keyword_density,
@@ -49,13 +140,24 @@ class SEOOptimizer:
     
     def _calculate_keyword_density(self, text: str, keywords: List[str]) -> Dict:
         """키워드 밀도를 계산합니다."""
-        text_lower = text.lower()
-        words = text_lower.split()
-        total_words = len(words)
+        total_words = len(text.split())
+        
+        # 키워드 집합별로 캐시된 오토마톤으로 본문을 한 번만 훑어서 카운트
+        matcher = get_keyword_matcher(keywords, korean_boundaries=self.korean_keyword_boundaries)
+        counts = matcher.count(text)
         
+        return self._keyword_density_from_counts(counts, keywords, total_words)
+    
+    def _keyword_density_from_counts(
+        self,
+        counts: Dict[str, int],
+        keywords: List[str],
+        total_words: int
+    ) -> Dict:
+        """키워드별 출현 횟수와 전체 단어 수로 키워드 밀도를 계산합니다."""
         keyword_counts = {}
         for keyword in keywords:
-            count = text_lower.count(keyword.lower())
+            count = counts.get(keyword, 0)
             density = (count / total_words) * 100 if total_words > 0 else 0
             keyword_counts[keyword] = {
                 "count": count,
@@ -69,10 +171,14 @@ class SEOOptimizer:
         sentences = re.split(r'[.!?]+', text)
         words = text.split()
         
-        if not sentences or not words:
+        return self._readability_from_counts(len(words), len(sentences))
+    
+    def _readability_from_counts(self, word_count: int, sentence_count: int) -> int:
+        """단어 수와 문장 수로 가독성 점수를 계산합니다."""
+        if not sentence_count or not word_count:
             return 0
         
-        avg_sentence_length = len(words) / len(sentences)
+        avg_sentence_length = word_count / sentence_count
         
         # 한국어에 맞게 조정된 간단한 가독성 점수
         # 문장 길이가 짧을수록 높은 점수
@@ -108,18 +214,39 @@ class SEOOptimizer:
             "heading_texts": heading_texts
         }
     
+    def _analyze_markdown_headings(self, blocks: List[MarkdownBlock]) -> Dict:
+        """마크다운 헤딩 토큰으로 _analyze_heading_structure와 같은 결과를 만듭니다."""
+        counts = {1: 0, 2: 0, 3: 0}
+        heading_texts = {1: [], 2: [], 3: []}
+        for block in blocks:
+            if block.kind == 'heading' and block.level in counts:
+                counts[block.level] += 1
+                heading_texts[block.level].append(block.text.strip())
+        
+        return {
+            "h1_count": counts[1],
+            "h2_count": counts[2],
+            "h3_count": counts[3],
+            "total_headings": counts[1] + counts[2] + counts[3],
+            "heading_texts": heading_texts[1] + heading_texts[2] + heading_texts[3]
+        }
+    
     async def _optimize_content_structure(
         self, 
         soup: BeautifulSoup, 
         keywords: List[str]
     ) -> BeautifulSoup:
         """콘텐츠 구조를 최적화합니다."""
+        return self._optimize_soup(soup, keywords)
+    
+    def _optimize_soup(self, soup: BeautifulSoup, keywords: List[str]) -> BeautifulSoup:
+        """파싱된 HTML 문서의 구조를 최적화합니다."""
         
         # 첫 번째 단락에 주요 키워드 포함 확인
         first_paragraph = soup.find('p')
         if first_paragraph and keywords:
-            text = first_paragraph.get_text().lower()
-            if keywords[0].lower() not in text:
+            matcher = get_keyword_matcher(keywords, korean_boundaries=self.korean_keyword_boundaries)
+            if keywords[0] not in matcher.first_positions(first_paragraph.get_text()):
                 # 키워드를 자연스럽게 포함하도록 수정
                 logger.info(
                     "Adding primary keyword to first paragraph",
@@ -144,6 +271,44 @@ class SEOOptimizer:
         
         return soup
     
+    def _optimize_markdown_structure(
+        self,
+        content: str,
+        blocks: List[MarkdownBlock],
+        keywords: List[str]
+    ) -> str:
+        """마크다운 콘텐츠 구조를 최적화합니다 (HTML 경로와 같은 규칙)."""
+        
+        # 첫 번째 단락에 주요 키워드 포함 확인
+        first_paragraph = next(
+            (block for block in blocks if block.kind == 'paragraph' and block.text.strip()), None
+        )
+        if first_paragraph and keywords:
+            matcher = get_keyword_matcher(keywords, korean_boundaries=self.korean_keyword_boundaries)
+            if keywords[0] not in matcher.first_positions(first_paragraph.text):
+                logger.info(
+                    "Adding primary keyword to first paragraph",
+                    keyword=keywords[0]
+                )
+        
+        # 긴 단락 분할
+        for block in blocks:
+            if block.kind == 'paragraph':
+                word_count = len(block.text.split())
+                if word_count > self.optimal_paragraph_length * 1.5:
+                    logger.info(
+                        "Long paragraph detected",
+                        word_count=word_count
+                    )
+        
+        # alt 텍스트가 없는 이미지에 키워드 기반 alt 텍스트 추가
+        if keywords and any(block.kind == 'image' and not block.text for block in blocks):
+            # 키워드에 역슬래시가 있어도 치환 템플릿으로 해석되지 않도록 함수로 전달
+            alt_prefix = f"![{keywords[0]} 관련 이미지]("
+            content = EMPTY_ALT_IMAGE_RE.sub(lambda _: alt_prefix, content)
+        
+        return content
+    
     def _calculate_seo_score(
         self,
         keyword_density: Dict,
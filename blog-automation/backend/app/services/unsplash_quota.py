@@ -0,0 +1,185 @@
+"""
+Unsplash API 호출 한도 장부
+
+워커마다 따로 429가 날 때까지 호출하지 않도록, 응답 헤더의 X-Ratelimit-Remaining으로
+남은 호출 수를 Redis에 공유합니다 (Redis를 쓸 수 없으면 프로세스 로컬 장부 사용).
+
+- 호출 전에 acquire()로 한 건을 예약하고, 응답을 받으면 record()로 헤더 값을 반영
+- 남은 호출 수가 reserve 이하이면 대표 이미지(featured) 검색만 허용하고 나머지(extra)는 거절
+- 거절된 검색은 호출하는 쪽에서 캐시/대체 이미지로 처리 (한도에 닿기 전에 우회)
+- Unsplash 한도는 1시간 단위로 초기화되므로 마지막 헤더 기록 후 window가 지나면 장부를 비움
+"""
+import asyncio
+import time
+from typing import Any, Dict, Mapping, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+PRIORITY_FEATURED = "featured"
+PRIORITY_EXTRA = "extra"
+
+# 남은 호출 수가 예약 기준보다 많을 때만 1 차감 (여러 워커가 동시에 호출해도 원자적)
+ACQUIRE_SCRIPT = """
+local remaining = tonumber(redis.call('HGET', KEYS[1], 'remaining'))
+if remaining == nil then return 1 end
+if remaining <= tonumber(ARGV[1]) then return 0 end
+redis.call('HINCRBY', KEYS[1], 'remaining', -1)
+return 1
+"""
+
+
+class QuotaExhaustedError(Exception):
+    """Unsplash 호출 한도에 가까워 검색을 보내지 않은 경우"""
+
+
+class UnsplashQuotaLedger:
+    """Redis 공유 + 로컬 대체 Unsplash 호출 한도 장부"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        reserve: int = 10,
+        window_seconds: int = 3600,
+        key: str = "unsplash:quota"
+    ):
+        self.redis_url = redis_url
+        self.reserve = reserve
+        self.window_seconds = window_seconds
+        self.key = key
+
+        self._local: Dict[str, Any] = {}
+        self._redis = None
+        self._redis_loop = None
+
+        self.stats = {
+            "allowed": 0,
+            "denied_featured": 0,
+            "denied_extra": 0,
+            "rate_limited": 0,
+        }
+
+    def _redis_client(self):
+        # redis.asyncio 연결은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+            self._redis_loop = loop
+        return self._redis
+
+    def _threshold(self, priority: str) -> int:
+        return 0 if priority == PRIORITY_FEATURED else self.reserve
+
+    # 로컬 장부
+
+    def _local_remaining(self) -> Optional[int]:
+        if not self._local or time.time() >= self._local["expires_at"]:
+            self._local = {}
+            return None
+        return self._local["remaining"]
+
+    def _local_acquire(self, threshold: int) -> bool:
+        remaining = self._local_remaining()
+        if remaining is None:
+            return True
+        if remaining <= threshold:
+            return False
+        self._local["remaining"] = remaining - 1
+        return True
+
+    def _local_record(self, remaining: int, limit: Optional[int]):
+        self._local = {
+            "remaining": remaining,
+            "limit": limit,
+            "expires_at": time.time() + self.window_seconds
+        }
+
+    # 공개 API
+
+    async def acquire(self, priority: str = PRIORITY_EXTRA) -> bool:
+        """검색 한 건을 예약합니다. 한도에 가까우면 False."""
+        threshold = self._threshold(priority)
+        allowed = None
+
+        if self.redis_url:
+            try:
+                allowed = bool(await self._redis_client().eval(ACQUIRE_SCRIPT, 1, self.key, threshold))
+            except Exception as e:
+                logger.warning(f"Unsplash 한도 장부(Redis) 조회 실패 - 로컬 장부 사용: {str(e)}")
+
+        if allowed is None:
+            allowed = self._local_acquire(threshold)
+
+        if allowed:
+            self.stats["allowed"] += 1
+        else:
+            self.stats["denied_featured" if priority == PRIORITY_FEATURED else "denied_extra"] += 1
+            logger.info("Unsplash 호출 한도 임박 - 검색 생략", priority=priority)
+        return allowed
+
+    async def record(self, headers: Mapping[str, str], status: Optional[int] = None):
+        """응답 헤더의 남은 호출 수를 장부에 반영합니다."""
+        remaining = headers.get("X-Ratelimit-Remaining")
+        limit = headers.get("X-Ratelimit-Limit")
+
+        if status == 429:
+            self.stats["rate_limited"] += 1
+            remaining = 0
+        if remaining is None:
+            return
+
+        try:
+            remaining = int(remaining)
+            limit = int(limit) if limit is not None else None
+        except (TypeError, ValueError):
+            return
+
+        self._local_record(remaining, limit)
+
+        if self.redis_url:
+            try:
+                client = self._redis_client()
+                mapping = {"remaining": remaining}
+                if limit is not None:
+                    mapping["limit"] = limit
+                await client.hset(self.key, mapping=mapping)
+                await client.expire(self.key, self.window_seconds)
+            except Exception as e:
+                logger.warning(f"Unsplash 한도 장부(Redis) 기록 실패: {str(e)}")
+
+    async def remaining(self) -> Optional[int]:
+        """장부상 남은 호출 수 (모르면 None)"""
+        if self.redis_url:
+            try:
+                value = await self._redis_client().hget(self.key, "remaining")
+                return int(value) if value is not None else None
+            except Exception:
+                pass
+        return self._local_remaining()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """예약/거절 지표"""
+        return {
+            **self.stats,
+            "local_remaining": self._local_remaining(),
+            "reserve": self.reserve
+        }
+
+
+# 글로벌 인스턴스
+unsplash_quota = None
+
+def get_unsplash_quota() -> UnsplashQuotaLedger:
+    """Unsplash 호출 한도 장부 인스턴스 반환"""
+    global unsplash_quota
+    if unsplash_quota is None:
+        # test_server.py처럼 앱 설정 없이 쓰는 경우를 위해 여기서 import
+        from app.core.config import settings
+        unsplash_quota = UnsplashQuotaLedger(
+            redis_url=settings.redis_url,
+            reserve=settings.unsplash_quota_reserve,
+            window_seconds=settings.unsplash_quota_window_seconds
+        )
+    return unsplash_quota
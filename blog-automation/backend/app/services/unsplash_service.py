@@ -1,9 +1,13 @@
 """
 Unsplash API를 사용한 이미지 검색 서비스
 """
-import httpx
+import asyncio
+import functools
 from typing import List, Dict, Any, Optional
 from app.core.config import settings
+from app.services.image_fanout import fan_out_searches, hedged_search
+from app.services.image_providers import get_image_provider_chain
+from app.services.unsplash_quota import PRIORITY_EXTRA, PRIORITY_FEATURED
 import structlog
 
 logger = structlog.get_logger()
@@ -16,17 +20,15 @@ class UnsplashImageService:
             raise ValueError("Unsplash API 키가 설정되지 않았습니다. .env 파일에 UNSPLASH_ACCESS_KEY를 설정해주세요.")
         
         self.access_key = settings.unsplash_access_key
-        self.base_url = "https://api.unsplash.com"
-        self.headers = {
-            "Authorization": f"Client-ID {self.access_key}",
-            "Accept-Version": "v1"
-        }
+        self.providers = get_image_provider_chain()
 
     async def search_images(
         self, 
         query: str, 
         count: int = 5,
-        orientation: str = "landscape"
+        orientation: str = "landscape",
+        priority: str = PRIORITY_EXTRA,
+        allow_placeholder: bool = True
     ) -> List[Dict[str, Any]]:
         """
         키워드로 이미지 검색
@@ -35,57 +37,14 @@ class UnsplashImageService:
             query: 검색 키워드
             count: 가져올 이미지 수
             orientation: 이미지 방향 (landscape, portrait, squarish)
+            priority: 호출 한도가 임박했을 때의 우선순위 (featured는 예약분까지 사용)
+            allow_placeholder: 검색 결과가 없을 때 Lorem Picsum 이미지로 채울지 여부
             
         Returns:
             이미지 정보 리스트
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/search/photos",
-                    headers=self.headers,
-                    params={
-                        "query": query,
-                        "per_page": count,
-                        "orientation": orientation,
-                        "content_filter": "high",
-                        "order_by": "relevant"
-                    },
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    images = []
-                    
-                    for photo in data.get("results", []):
-                        image_info = {
-                            "id": photo.get("id"),
-                            "url": photo.get("urls", {}).get("regular"),
-                            "thumb_url": photo.get("urls", {}).get("thumb"),
-                            "small_url": photo.get("urls", {}).get("small"),
-                            "alt_text": photo.get("alt_description", f"{query} 관련 이미지"),
-                            "attribution": {
-                                "photographer": photo.get("user", {}).get("name", "Unknown"),
-                                "source": "Unsplash",
-                                "profile_url": photo.get("user", {}).get("links", {}).get("html")
-                            },
-                            "width": photo.get("width", 800),
-                            "height": photo.get("height", 600),
-                            "download_url": photo.get("links", {}).get("download")
-                        }
-                        images.append(image_info)
-                    
-                    logger.info(f"Unsplash 이미지 검색 성공", query=query, count=len(images))
-                    return images
-                    
-                else:
-                    logger.error(f"Unsplash API 오류: {response.status_code} - {response.text}")
-                    return []
-                    
-        except Exception as e:
-            logger.error(f"Unsplash 이미지 검색 실패: {e}")
-            return []
+        # Unsplash가 차단되었거나 한도가 임박하면 캐시된 결과나 Lorem Picsum 이미지로 대체
+        return await self.providers.search(query, count, orientation, priority, allow_placeholder)
 
     async def get_featured_image(self, keywords: List[str]) -> Optional[Dict[str, Any]]:
         """
@@ -97,22 +56,83 @@ class UnsplashImageService:
         Returns:
             대표 이미지 정보
         """
-        # 첫 번째 키워드로 검색
+        # 첫 번째 키워드로 검색하고, 늦어지거나 실패하면 일반적인 키워드로 동시에 재시도
         main_keyword = keywords[0] if keywords else "technology"
-        images = await self.search_images(main_keyword, count=1)
+        fallback_keywords = ["abstract", "nature", "technology", "business"]
         
-        if images:
-            return images[0]
+        result = await hedged_search(
+            functools.partial(
+                self.search_images, main_keyword, count=1, priority=PRIORITY_FEATURED, allow_placeholder=False
+            ),
+            [
+                functools.partial(
+                    self.search_images, keyword, count=1, priority=PRIORITY_FEATURED, allow_placeholder=False
+                )
+                for keyword in fallback_keywords
+            ],
+            hedge_delay=settings.featured_image_hedge_delay_seconds,
+            deadline=settings.featured_image_deadline_seconds
+        )
         
-        # 첫 번째 키워드로 실패하면 일반적인 키워드로 재시도
-        fallback_keywords = ["abstract", "nature", "technology", "business"]
-        for keyword in fallback_keywords:
-            images = await self.search_images(keyword, count=1)
-            if images:
-                logger.info(f"대체 키워드로 이미지 찾음: {keyword}")
-                return images[0]
+        if result is None:
+            logger.warning("대표 이미지 검색 시간 초과 또는 결과 없음", keyword=main_keyword)
+            return None
+        
+        index, images = result
+        if index > 0:
+            logger.info(f"대체 키워드로 이미지 찾음: {fallback_keywords[index - 1]}")
+        return images[0]
+
+    async def get_keyword_images(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """
+        키워드 기반 이미지 가져오기 (제목이 필요 없어 콘텐츠 생성 전에 시작할 수 있음)
+        
+        Args:
+            keywords: 키워드 리스트
+            
+        Returns:
+            중복을 제거한 이미지 최대 4개
+        """
+        keyword_searches = [
+            functools.partial(self.search_images, keyword, count=2)
+            for keyword in keywords[:3]  # 최대 3개 키워드
+        ]
+        
+        # 도착 순서대로 중복 제거, 고유 이미지 4개가 모이면 나머지 검색 취소
+        keyword_results = await fan_out_searches(keyword_searches, limit=4)
+        return [img for images in keyword_results for img in images][:4]  # 최대 4개
+
+    async def get_title_images(self, title: str) -> List[Dict[str, Any]]:
+        """
+        제목 기반 이미지 가져오기
         
-        return None
+        Args:
+            title: 콘텐츠 제목
+            
+        Returns:
+            이미지 최대 2개
+        """
+        title_words = title.split()[:3]  # 제목의 첫 3단어
+        title_query = " ".join(title_words)
+        if not title_query:
+            return []
+        return await self.search_images(title_query, count=2)
+
+    def prefetch_keyword_images(self, keywords: List[str]) -> asyncio.Task:
+        """
+        키워드만으로 가능한 이미지 검색(대표 이미지, 키워드 기반 이미지)을 백그라운드에서 시작합니다.
+        콘텐츠 생성(LLM 호출)과 동시에 실행해 이미지 단계를 응답 경로에서 뺍니다.
+        
+        Returns:
+            (대표 이미지, 키워드 기반 이미지 리스트)를 돌려주는 태스크
+        """
+        async def prefetch():
+            return await asyncio.gather(
+                self.get_featured_image(keywords),
+                self.get_keyword_images(keywords)
+            )
+        
+        return asyncio.create_task(prefetch())
 
     async def get_content_images(self, keywords: List[str], title: str) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -125,33 +145,16 @@ class UnsplashImageService:
         Returns:
             제목 기반 이미지와 키워드 기반 이미지
         """
+        # 제목 검색과 키워드 검색을 동시에 실행
+        title_images, keyword_images = await asyncio.gather(
+            self.get_title_images(title),
+            self.get_keyword_images(keywords)
+        )
         result = {
-            "title_based": [],
-            "keyword_based": []
+            "title_based": title_images,
+            "keyword_based": keyword_images
         }
         
-        # 제목에서 주요 단어 추출해서 검색
-        title_words = title.split()[:3]  # 제목의 첫 3단어
-        if title_words:
-            title_query = " ".join(title_words)
-            title_images = await self.search_images(title_query, count=2)
-            result["title_based"] = title_images
-        
-        # 각 키워드로 이미지 검색
-        for keyword in keywords[:3]:  # 최대 3개 키워드
-            keyword_images = await self.search_images(keyword, count=2)
-            result["keyword_based"].extend(keyword_images)
-        
-        # 중복 제거
-        seen_ids = set()
-        unique_keyword_images = []
-        for img in result["keyword_based"]:
-            if img["id"] not in seen_ids:
-                seen_ids.add(img["id"])
-                unique_keyword_images.append(img)
-        
-        result["keyword_based"] = unique_keyword_images[:4]  # 최대 4개
-        
         logger.info(f"콘텐츠 이미지 수집 완료", 
                    title_count=len(result["title_based"]),
                    keyword_count=len(result["keyword_based"]))
@@ -6,6 +6,7 @@ import structlog
 import asyncio
 
 from app.core.database import AsyncSessionLocal
+from app.core.http_client import close_http_clients
 from app.models.analytics import Analytics
 from app.models.publication import Publication, PublicationStatus
 from app.models.content import Content
@@ -93,7 +94,11 @@ def collect_analytics_for_publication(publication_id: str):
     
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
-    loop.run_until_complete(_collect())
+    try:
+        loop.run_until_complete(_collect())
+    finally:
+        # 이 루프에서 만든 공유 HTTP 세션 정리
+        loop.run_until_complete(close_http_clients())
 
 
 @shared_task
@@ -1,9 +1,9 @@
 from celery import shared_task
 from sqlalchemy import select
 import structlog
-import asyncio
 
 from app.core.database import AsyncSessionLocal
+from app.core.worker_loop import run_in_worker_loop
 from app.models.content import Content, ContentStatus
 from app.services.content_generator import ContentGeneratorService
 
@@ -72,10 +72,8 @@ def generate_content_task(
                 # 재시도
                 raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
     
-    # 비동기 함수 실행
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(_generate())
+    # 워커 상주 루프에서 실행 (공유 HTTP 클라이언트를 태스크 사이에 재사용하고 워커 종료 시 정리)
+    run_in_worker_loop(_generate())
 
 
 @shared_task
@@ -108,6 +106,4 @@ def schedule_content_generation_batch(user_id: str, batch_size: int = 5):
                 count=len(contents)
             )
     
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(_schedule_batch())
\ No newline at end of file
+    run_in_worker_loop(_schedule_batch())
\ No newline at end of file
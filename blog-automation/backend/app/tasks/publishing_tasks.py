@@ -1,15 +1,19 @@
 from celery import shared_task
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
 from sqlalchemy.orm import selectinload
+from collections import defaultdict
 from datetime import datetime
+from typing import Dict, List
 import structlog
 import asyncio
 
 from app.core.database import AsyncSessionLocal
+from app.core.worker_loop import run_in_worker_loop
 from app.models.publication import Publication, PublicationStatus
 from app.models.content import Content, ContentStatus
-from app.models.blog_account import BlogAccount
+from app.models.blog_account import BlogAccount, BlogPlatform
 from app.services.publishers import get_publisher
+from app.services.publish_fanout import build_publish_payload, fan_out_publish
 from app.core.security import encryption_service
 
 logger = structlog.get_logger()
@@ -41,34 +45,17 @@ def publish_content_task(self, publication_id: str):
                 publication.status = PublicationStatus.PENDING
                 await db.commit()
                 
-                # 인증 정보 복호화
-                encrypted_creds = publication.blog_account.auth_credentials.get("encrypted")
-                decrypted_creds = encryption_service.decrypt(encrypted_creds)
-                credentials = eval(decrypted_creds)  # JSON으로 저장하는 것이 더 안전함
-                
                 # Publisher 인스턴스 생성
                 publisher = get_publisher(
                     platform=publication.blog_account.platform,
-                    credentials=credentials
+                    credentials=decrypt_account_credentials(publication.blog_account)
                 )
                 
                 # 콘텐츠 발행
-                result = await publisher.publish(
-                    title=publication.content.title,
-                    content=publication.content.content,
-                    meta_description=publication.content.meta_description,
-                    keywords=publication.content.keywords
-                )
+                result = await publisher.publish(**build_publish_payload(publication.content))
                 
+                apply_publish_result(publication, result)
                 if result["success"]:
-                    publication.status = PublicationStatus.PUBLISHED
-                    publication.platform_post_id = result.get("post_id")
-                    publication.platform_post_url = result.get("url")
-                    publication.published_at = datetime.utcnow()
-                    
-                    # 콘텐츠 상태 업데이트
-                    publication.content.status = ContentStatus.PUBLISHED
-                    
                     logger.info(
                         "Content published successfully",
                         publication_id=publication_id,
@@ -76,9 +63,6 @@ def publish_content_task(self, publication_id: str):
                         url=result.get("url")
                     )
                 else:
-                    publication.status = PublicationStatus.FAILED
-                    publication.error_message = result.get("error", "Unknown error")
-                    
                     logger.error(
                         "Content publication failed",
                         publication_id=publication_id,
@@ -104,9 +88,188 @@ def publish_content_task(self, publication_id: str):
                 if self.request.retries < self.max_retries:
                     raise self.retry(exc=e, countdown=300 * (2 ** self.request.retries))
     
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(_publish())
+    # 워커 상주 루프에서 실행해 브라우저/HTTP 세션을 다음 태스크에서 재사용
+    run_in_worker_loop(_publish())
+
+
+def decrypt_account_credentials(account: BlogAccount) -> Dict:
+    """블로그 계정의 인증 정보를 복호화합니다."""
+    encrypted_creds = account.auth_credentials.get("encrypted")
+    return eval(encryption_service.decrypt(encrypted_creds))  # JSON으로 저장하는 것이 더 안전함
+
+
+def publish_result_values(result: dict) -> Dict:
+    """발행 결과로 바꿀 Publication 컬럼 값"""
+    if result["success"]:
+        return {
+            "status": PublicationStatus.PUBLISHED,
+            "platform_post_id": result.get("post_id"),
+            "platform_post_url": result.get("url"),
+            "published_at": datetime.utcnow(),
+            "error_message": None,
+        }
+    return {
+        "status": PublicationStatus.FAILED,
+        "error_message": result.get("error", "Unknown error"),
+    }
+
+
+def apply_publish_result(publication: Publication, result: dict):
+    """발행 결과를 Publication 행과 콘텐츠 상태에 반영합니다."""
+    for column, value in publish_result_values(result).items():
+        setattr(publication, column, value)
+    if result["success"]:
+        publication.content.status = ContentStatus.PUBLISHED
+
+
+@shared_task
+def publish_fanout_task(content_id: str, blog_account_ids: List[str]):
+    """
+    한 콘텐츠를 여러 블로그 계정에 한 작업 안에서 동시에 발행합니다.
+    콘텐츠 조회와 발행 인자 생성은 한 번이며, 각 Publication 상태는 발행이 끝나는 대로 따로 반영합니다.
+    """
+    
+    async def _fan_out():
+        async with AsyncSessionLocal() as db:
+            content_result = await db.execute(select(Content).where(Content.id == content_id))
+            content = content_result.scalar_one_or_none()
+            if not content:
+                logger.error("Content not found", content_id=content_id)
+                return
+            
+            # 계정별로 가장 최근에 만든, 아직 발행되지 않은 Publication
+            result = await db.execute(
+                select(Publication)
+                .options(selectinload(Publication.blog_account))
+                .where(
+                    and_(
+                        Publication.content_id == content_id,
+                        Publication.blog_account_id.in_(blog_account_ids),
+                        Publication.status != PublicationStatus.PUBLISHED
+                    )
+                )
+                .order_by(Publication.created_at.desc())
+            )
+            by_account = {}
+            for publication in result.scalars().all():
+                by_account.setdefault(str(publication.blog_account_id), publication)
+            
+            missing = [str(account_id) for account_id in blog_account_ids if str(account_id) not in by_account]
+            if missing:
+                logger.warning("No pending publication for accounts", content_id=content_id, account_ids=missing)
+            
+            targets = []
+            for publication in by_account.values():
+                try:
+                    credentials = decrypt_account_credentials(publication.blog_account)
+                except Exception as e:
+                    publication.status = PublicationStatus.FAILED
+                    publication.error_message = f"Invalid credentials: {str(e)}"
+                    continue
+                publication.status = PublicationStatus.PENDING
+                targets.append({
+                    "publication_id": str(publication.id),
+                    "platform": publication.blog_account.platform,
+                    "credentials": credentials,
+                })
+            payload = build_publish_payload(content)
+            await db.commit()
+        
+        async def record(target: Dict, result: Dict):
+            # 동시에 끝난 항목끼리 세션을 공유하지 않도록 항목마다 짧은 세션으로 반영
+            async with AsyncSessionLocal() as status_db:
+                await status_db.execute(
+                    update(Publication)
+                    .where(Publication.id == target["publication_id"])
+                    .values(**publish_result_values(result))
+                )
+                if result["success"]:
+                    await status_db.execute(
+                        update(Content)
+                        .where(Content.id == content_id)
+                        .values(status=ContentStatus.PUBLISHED)
+                    )
+                await status_db.commit()
+        
+        results = await fan_out_publish(targets, payload, on_result=record)
+        
+        logger.info(
+            "Fan-out publication completed",
+            content_id=content_id,
+            total=len(results),
+            succeeded=sum(1 for item in results if item["success"])
+        )
+    
+    # 워커 상주 루프에서 실행해 브라우저/HTTP 세션을 다음 태스크에서 재사용
+    run_in_worker_loop(_fan_out())
+
+
+@shared_task(bind=True, max_retries=3)
+def publish_batch_task(self, publication_ids: List[str]):
+    """
+    같은 WordPress 계정의 여러 Publication을 /batch/v1 요청으로 묶어 발행합니다.
+    인증 정보 복호화, 태그 조회는 계정당 한 번이며 결과는 항목별로 각 Publication에 반영합니다.
+    """
+    
+    async def _publish_batch():
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Publication)
+                .options(
+                    selectinload(Publication.content),
+                    selectinload(Publication.blog_account)
+                )
+                .where(Publication.id.in_(publication_ids))
+            )
+            publications = result.scalars().all()
+            
+            by_account = defaultdict(list)
+            for publication in publications:
+                if publication.blog_account.platform == BlogPlatform.WORDPRESS:
+                    by_account[publication.blog_account_id].append(publication)
+                else:
+                    # 배치 API가 없는 플랫폼은 개별 태스크로 발행
+                    publish_content_task.delay(str(publication.id))
+            
+            for account_publications in by_account.values():
+                account = account_publications[0].blog_account
+                for publication in account_publications:
+                    publication.status = PublicationStatus.PENDING
+                await db.commit()
+                
+                try:
+                    publisher = get_publisher(
+                        platform=account.platform,
+                        credentials=decrypt_account_credentials(account)
+                    )
+                    
+                    # 이미 포스트 ID가 있는 Publication(재시도 등)은 수정으로 보냄
+                    results = await publisher.publish_batch([
+                        {
+                            "action": "update" if publication.platform_post_id else "create",
+                            "ref": str(publication.id),
+                            "post_id": publication.platform_post_id,
+                            **build_publish_payload(publication.content)
+                        }
+                        for publication in account_publications
+                    ])
+                except Exception as e:
+                    logger.error("Batch publication failed", account_id=str(account.id), error=str(e))
+                    results = [{"success": False, "error": str(e)}] * len(account_publications)
+                
+                for publication, item in zip(account_publications, results):
+                    apply_publish_result(publication, item)
+                await db.commit()
+                
+                logger.info(
+                    "Batch publication completed",
+                    account_id=str(account.id),
+                    total=len(results),
+                    succeeded=sum(1 for item in results if item["success"])
+                )
+    
+    # 워커 상주 루프에서 실행해 브라우저/HTTP 세션을 다음 태스크에서 재사용
+    run_in_worker_loop(_publish_batch())
 
 
 @shared_task
@@ -128,6 +291,11 @@ def publish_scheduled_content():
             )
             contents = result.scalars().all()
             
+            # 콘텐츠별로 모든 계정을 팬아웃 작업 하나로 발행하되,
+            # 이번에 여러 글이 몰린 WordPress 계정은 /batch/v1 배치로 보냄
+            fanouts = defaultdict(list)
+            wordpress = defaultdict(list)
+            
             for content in contents:
                 # 연결된 블로그 계정으로 발행
                 pub_result = await db.execute(
@@ -147,8 +315,20 @@ def publish_scheduled_content():
                     await db.commit()
                     await db.refresh(publication)
                     
-                    # 발행 태스크 실행
-                    publish_content_task.delay(str(publication.id))
+                    if account.platform == BlogPlatform.WORDPRESS:
+                        wordpress[account.id].append((str(content.id), str(publication.id)))
+                    else:
+                        fanouts[str(content.id)].append(str(account.id))
+            
+            for account_id, entries in wordpress.items():
+                if len(entries) > 1:
+                    publish_batch_task.delay([publication_id for _, publication_id in entries])
+                else:
+                    fanouts[entries[0][0]].append(str(account_id))
+            
+            # 발행 태스크 실행 (콘텐츠당 한 작업)
+            for content_id, account_ids in fanouts.items():
+                publish_fanout_task.delay(content_id, account_ids)
             
             logger.info(
                 "Scheduled content publishing initiated",
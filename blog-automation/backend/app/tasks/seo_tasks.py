@@ -0,0 +1,53 @@
+from celery import shared_task
+import argparse
+import structlog
+
+from app.core.database import supabase_client
+from app.services.seo_batch import run_batch_scoring
+
+logger = structlog.get_logger()
+
+
+@shared_task
+def rescore_all_posts(page_size: int = 200, workers: int = None, dry_run: bool = False):
+    """
+    blog_posts 전체의 SEO 점수를 다시 계산합니다.
+    prefork 워커(데몬 프로세스)에서는 프로세스 풀 없이 채점하므로, 많은 포스트를 병렬로 채점하려면
+    CLI로 실행하거나 solo/threads 풀 워커에서 실행합니다.
+    """
+    
+    stats = run_batch_scoring(
+        supabase_client,
+        page_size=page_size,
+        workers=workers,
+        dry_run=dry_run
+    )
+    
+    logger.info(
+        "Corpus SEO rescoring finished",
+        scanned=stats["scanned"],
+        changed=stats["changed"],
+        posts_per_second=stats["posts_per_second"]
+    )
+    
+    return stats
+
+
+if __name__ == "__main__":
+    # python -m app.tasks.seo_tasks --workers 8
+    parser = argparse.ArgumentParser(description="blog_posts 전체 SEO 점수 재계산")
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    
+    result = run_batch_scoring(
+        supabase_client,
+        page_size=args.page_size,
+        workers=args.workers,
+        dry_run=args.dry_run
+    )
+    print(
+        f"✅ {result['scanned']}개 포스트 채점, {result['changed']}개 변경 "
+        f"({result['posts_per_second']} posts/s, workers={result['workers']})"
+    )
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+본문 이미지 삽입 엔진 벤치마크
+
+50KB 안팎의 마크다운 포스트에 이미지를 삽입하는 시간과 삽입 개수를 측정합니다.
+기존 /test/publish 인라인 루프(빈 줄에서만 삽입)와 비교합니다.
+
+    python benchmark_image_insertion.py [--size 50000] [--runs 200]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.services.image_insertion import ImageInsertionPolicy, insert_images
+
+
+def make_post(size: int, seed: int = 7) -> str:
+    """헤딩, 단락, 리스트, 코드 블록이 섞인 마크다운 본문 (빈 줄 없이 이어지는 구간 포함)"""
+    rng = random.Random(seed)
+    words = ["인공지능", "클라우드", "데이터", "보안", "자동화", "블로그", "마케팅", "전략", "분석", "성장"]
+    blocks = []
+    length = 0
+    section = 0
+    while length < size:
+        kind = rng.random()
+        if kind < 0.1:
+            section += 1
+            block = f"## {section}. {rng.choice(words)} 활용법"
+        elif kind < 0.25:
+            block = '\n'.join(f"- {' '.join(rng.choices(words, k=6))}" for _ in range(rng.randint(3, 6)))
+        elif kind < 0.3:
+            block = "```python\n" + '\n'.join(f"print('{rng.choice(words)}')" for _ in range(5)) + "\n```"
+        else:
+            sentences = [' '.join(rng.choices(words, k=rng.randint(8, 16))) + '.' for _ in range(rng.randint(2, 5))]
+            block = ' '.join(sentences)
+        # 일부 단락은 빈 줄 없이 헤딩으로 이어짐
+        separator = '\n' if kind < 0.1 and rng.random() < 0.5 else '\n\n'
+        blocks.append(block + separator)
+        length += len(block) + len(separator)
+    return ''.join(blocks).strip()
+
+
+def make_images(count: int):
+    return [{
+        "id": f"img{i}",
+        "url": f"https://images.unsplash.com/photo-{i}",
+        "alt_text": f"이미지 {i}",
+        "attribution": {"photographer": "Photographer", "source": "Unsplash"},
+        "width": 1080,
+        "height": 720
+    } for i in range(count)]
+
+
+def legacy_insert(content: str, images) -> int:
+    """기존 인라인 루프 (500자가 넘은 뒤 빈 줄을 만나야만 삽입)"""
+    image_count = max(1, len(content) // 500)
+    inserted = 0
+    char_count = 0
+    new_lines = []
+    for line in content.split('\n'):
+        new_lines.append(line)
+        char_count += len(line)
+        if char_count >= (inserted + 1) * 500 and inserted < min(image_count, len(images)):
+            if line.strip() == '':
+                img = images[inserted]
+                new_lines.append(f"\n![{img['alt_text']}]({img['url']})\n*사진: Photographer (Unsplash)*\n")
+                inserted += 1
+    '\n'.join(new_lines)
+    return inserted
+
+
+def measure(fn, runs: int):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본문 이미지 삽입 벤치마크")
+    parser.add_argument("--size", type=int, default=50000, help="본문 글자 수")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--images", type=int, default=100, help="후보 이미지 수")
+    args = parser.parse_args()
+
+    content = make_post(args.size)
+    images = make_images(args.images)
+    print(f"본문 {len(content):,}자 / {content.count(chr(10)) + 1:,}줄, 후보 이미지 {len(images)}개")
+
+    for label, fn in [
+        ("기존 인라인 루프", lambda: legacy_insert(content, images)),
+        ("삽입 엔진 (markdown)", lambda: insert_images(content, images).count),
+        ("삽입 엔진 (html)", lambda: insert_images(content, images, ImageInsertionPolicy(output="html")).count),
+        ("삽입 엔진 (최대 6개)", lambda: insert_images(content, images, ImageInsertionPolicy(max_images=6)).count),
+    ]:
+        inserted, median_ms, max_ms = measure(fn, args.runs)
+        print(f"{label:<22} 삽입 {inserted:>3}개  중앙값 {median_ms:7.3f}ms  최대 {max_ms:7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
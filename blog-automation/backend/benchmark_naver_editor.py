@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+네이버 에디터 본문 입력 벤치마크
+
+로컬 Chromium에 스마트에디터를 흉내 낸 페이지(.se-content contenteditable, 붙여넣기 처리)를 띄우고
+5000자 안팎의 포스트를 타이핑 모드와 붙여넣기 모드로 입력하는 시간을 비교합니다.
+Playwright Chromium이 설치되어 있어야 합니다 (python -m playwright install chromium).
+설치할 수 없으면 --executable-path로 다른 Chromium/Chrome 실행 파일을 지정합니다.
+
+    python benchmark_naver_editor.py [--size 5000] [--runs 3] [--executable-path /path/to/chrome]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from app.core.config import settings
+from app.services.publishers.naver_publisher import NaverPublisher
+
+FAKE_EDITOR = """
+<html><body>
+<div class="se-content" contenteditable="true" style="min-height: 200px"></div>
+<script>
+  const editor = document.querySelector('.se-content');
+  editor.addEventListener('paste', (event) => {
+    event.preventDefault();
+    editor.insertAdjacentHTML('beforeend', event.clipboardData.getData('text/html'));
+  });
+</script>
+</body></html>
+"""
+
+
+def make_post(size: int, seed: int = 7) -> str:
+    """제목, 단락, 목록이 섞인 HTML 본문"""
+    rng = random.Random(seed)
+    words = ["인공지능", "클라우드", "데이터", "보안", "자동화", "블로그", "마케팅", "전략", "분석", "성장"]
+    blocks = []
+    length = 0
+    section = 0
+    while length < size:
+        kind = rng.random()
+        if kind < 0.1:
+            section += 1
+            block = f"<h2>{section}. {rng.choice(words)} 활용법</h2>"
+        elif kind < 0.25:
+            items = ''.join(f"<li>{' '.join(rng.choices(words, k=5))}</li>" for _ in range(rng.randint(3, 5)))
+            block = f"<ul>{items}</ul>"
+        else:
+            block = f"<p>{' '.join(rng.choices(words, k=rng.randint(20, 40)))}.</p>"
+        blocks.append(block)
+        length += len(block)
+    return ''.join(blocks)
+
+
+async def measure(content: str, mode: str, runs: int, executable_path: str = None) -> list:
+    settings.naver_editor_input_mode = mode
+    publisher = NaverPublisher({"username": "benchmark", "password": ""})
+    timings = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, executable_path=executable_path)
+        try:
+            for _ in range(runs):
+                page = await browser.new_page()
+                await page.set_content(FAKE_EDITOR)
+                started = time.perf_counter()
+                await publisher._input_content_to_editor(page, content)
+                timings.append((time.perf_counter() - started) * 1000)
+                await page.close()
+        finally:
+            await browser.close()
+    return timings
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--executable-path", default=None, help="Playwright Chromium 대신 사용할 브라우저 실행 파일")
+    args = parser.parse_args()
+
+    content = make_post(args.size)
+    print(f"본문 {len(content)}자 (HTML), 실행 {args.runs}회")
+    for mode in ("type", "paste"):
+        timings = await measure(content, mode, args.runs, args.executable_path)
+        print(f"{mode:>6}: 중앙값 {statistics.median(timings):9.1f}ms  최소 {min(timings):9.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
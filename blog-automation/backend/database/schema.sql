@@ -34,12 +34,18 @@ CREATE TABLE IF NOT EXISTS blog_posts (
     comments INTEGER DEFAULT 0,
     tags TEXT[], -- PostgreSQL 배열
     featured_image_url VARCHAR(1000),
+    seo_score INTEGER, -- 배치 SEO 채점 결과 (app.tasks.seo_tasks)
+    readability_score INTEGER,
     scheduled_at TIMESTAMP WITH TIME ZONE,
     published_at TIMESTAMP WITH TIME ZONE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 기존 설치본용 컬럼 추가
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS seo_score INTEGER;
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS readability_score INTEGER;
+
 -- 콘텐츠 생성 요청 테이블
 CREATE TABLE IF NOT EXISTS content_requests (
     id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
@@ -7,11 +7,15 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
-import asyncio
 from anthropic import Anthropic
 import os
 from dotenv import load_dotenv
-import aiohttp
+import httpx
+from app.services.image_cache import ImageSearchCache
+from app.services.image_providers import (
+    ImageProviderChain, LocalCacheProvider, PicsumProvider, UnsplashProvider
+)
+from app.services.unsplash_quota import PRIORITY_EXTRA, PRIORITY_FEATURED, UnsplashQuotaLedger
 # from app.core.supabase import get_supabase_client  # 임시 비활성화
 
 # 환경 변수 로드
@@ -23,6 +27,37 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 이미지 검색 결과 캐시 (REDIS_URL이 있으면 Redis, 없으면 디스크)
+image_search_cache = ImageSearchCache(
+    redis_url=os.getenv("REDIS_URL"),
+    disk_dir=None if os.getenv("REDIS_URL") else ".cache/image_search"
+)
+
+# Unsplash 호출 한도 장부 (여러 프로세스가 REDIS_URL로 공유, 없으면 프로세스 로컬)
+unsplash_quota = UnsplashQuotaLedger(redis_url=os.getenv("REDIS_URL"))
+
+# Unsplash 호출용 HTTP 클라이언트 (호출마다 연결을 새로 만들지 않음)
+unsplash_client: Optional[httpx.AsyncClient] = None
+
+def get_unsplash_client() -> httpx.AsyncClient:
+    global unsplash_client
+    if unsplash_client is None:
+        unsplash_client = httpx.AsyncClient()
+    return unsplash_client
+
+# 이미지 공급자 체인 - Unsplash가 연속으로 실패하면 차단하고 재시도 없이 바로 대체 공급자 사용
+image_provider_list = [LocalCacheProvider(image_search_cache), PicsumProvider()]
+if os.getenv("UNSPLASH_ACCESS_KEY"):
+    image_provider_list.insert(0, UnsplashProvider(
+        os.getenv("UNSPLASH_ACCESS_KEY"),
+        quota=unsplash_quota,
+        client_factory=get_unsplash_client,
+        timeout=httpx.Timeout(10.0, connect=3.0)  # 연결 및 읽기 타임아웃 분리
+    ))
+else:
+    print("Unsplash API 키가 설정되지 않음 - Lorem Picsum 사용")
+image_providers = ImageProviderChain(image_provider_list, cache=image_search_cache)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -162,7 +197,7 @@ async def test_generate_content(request: ContentRequest):
             content_body = content_text
         
         # 이미지 검색
-        title_images = await search_images(title, count=2)
+        title_images = await search_images(title, count=2, priority=PRIORITY_FEATURED)
         keyword_images = await search_images(" ".join(request.keywords), count=2)
         
         # 단어 수 계산 (간단한 방식)
@@ -184,142 +219,10 @@ async def test_generate_content(request: ContentRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"콘텐츠 생성 실패: {str(e)}")
 
-async def search_images(query: str, count: int = 3) -> List[ImageInfo]:
-    """Unsplash API를 사용한 키워드 기반 이미지 검색 (retry 로직 포함)"""
-    
-    # Unsplash API 설정
-    unsplash_access_key = os.getenv("UNSPLASH_ACCESS_KEY")
-    
-    if not unsplash_access_key:
-        print(f"Unsplash API 키가 설정되지 않음 - Lorem Picsum 사용")
-        return await search_images_fallback(query, count)
-    
-    print(f"Unsplash API 키 확인됨: {unsplash_access_key[:10]}...")
-    
-    # Retry 설정
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            print(f"Unsplash API 시도 {attempt + 1}/{max_retries}")
-            return await _search_images_single_attempt(query, count, unsplash_access_key)
-        except Exception as e:
-            print(f"시도 {attempt + 1} 실패: {str(e)}")
-            if attempt == max_retries - 1:  # 마지막 시도
-                print("모든 재시도 실패 - 백업 이미지 사용")
-                return await search_images_fallback(query, count)
-            await asyncio.sleep(1)  # 1초 대기 후 재시도
-
-async def _search_images_single_attempt(query: str, count: int, unsplash_access_key: str) -> List[ImageInfo]:
-    """단일 Unsplash API 호출 시도"""
-    # 한국어 키워드를 영어로 간단 변환
-    query_en = query
-    korean_to_english = {
-        "AI": "artificial intelligence",
-        "인공지능": "artificial intelligence",
-        "기술": "technology",
-        "프로그래밍": "programming",
-        "개발": "development",
-        "소프트웨어": "software",
-        "컴퓨터": "computer",
-        "데이터": "data",
-        "빅데이터": "big data",
-        "머신러닝": "machine learning",
-        "딥러닝": "deep learning",
-        "웹": "web",
-        "앱": "app",
-        "모바일": "mobile",
-        "클라우드": "cloud"
-    }
-    
-    for ko, en in korean_to_english.items():
-        if ko in query:
-            query_en = query.replace(ko, en)
-            break
-    
-    print(f"검색 쿼리 변환: '{query}' -> '{query_en}'")
-    
-    # 타임아웃 설정 - 연결 및 읽기 타임아웃 분리
-    timeout = aiohttp.ClientTimeout(total=10, connect=3)
-    connector = aiohttp.TCPConnector(
-        ssl=False,  # SSL 검증 비활성화 (개발용)
-        limit=10,
-        force_close=True,
-        enable_cleanup_closed=True
-    )
-    
-    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-        url = "https://api.unsplash.com/search/photos"
-        # Client-ID 방식으로 변경 (공식 문서 권장)
-        params = {
-            "client_id": unsplash_access_key,
-            "query": query_en,
-            "per_page": count,
-            "orientation": "landscape",
-            "content_filter": "high",
-            "order_by": "relevant"
-        }
-        
-        print(f"Unsplash API 호출: query='{query_en}', count={count}")
-        
-        async with session.get(url, params=params) as response:
-            # Rate limit 정보 확인
-            remaining = response.headers.get('X-Ratelimit-Remaining', 'Unknown')
-            limit = response.headers.get('X-Ratelimit-Limit', 'Unknown')
-            print(f"Unsplash API Rate Limit: {remaining}/{limit}")
-            
-            if response.status == 200:
-                data = await response.json()
-                images = []
-                
-                for image in data.get("results", []):
-                    images.append(ImageInfo(
-                        id=image["id"],
-                        url=image["urls"]["regular"],
-                        thumb_url=image["urls"]["thumb"],
-                        alt_text=image.get("alt_description", f"{query} 관련 이미지") or f"{query} 관련 이미지",
-                        attribution={
-                            "photographer": image["user"]["name"],
-                            "source": "Unsplash",
-                            "source_url": image["links"]["html"]
-                        },
-                        width=image["width"],
-                        height=image["height"]
-                    ))
-                
-                print(f"Unsplash API 성공: {len(images)}개 이미지 반환")
-                return images if images else await search_images_fallback(query, count)
-            elif response.status == 403:
-                print("Unsplash API 권한 오류 - API 키 확인 필요")
-                raise Exception("API 키 권한 오류")
-            elif response.status == 429:
-                print("Unsplash API Rate Limit 초과")
-                raise Exception("Rate limit 초과")
-            else:
-                error_text = await response.text()
-                print(f"Unsplash API 오류: {response.status} - {error_text}")
-                raise Exception(f"HTTP {response.status}: {error_text}")
-
-async def search_images_fallback(query: str, count: int = 3) -> List[ImageInfo]:
-    """Unsplash API 실패 시 Lorem Picsum을 사용한 백업 이미지 검색"""
-    images = []
-    
-    # 쿼리를 기반으로 일관된 이미지를 생성하기 위해 해시 사용
-    query_hash = hash(query) % 1000
-    
-    for i in range(count):
-        # 각 이미지마다 다른 시드 사용
-        image_seed = (query_hash + i * 100) % 1000
-        
-        images.append(ImageInfo(
-            id=f"picsum_{query_hash}_{i}",
-            url=f"https://picsum.photos/800/600?random={image_seed}",
-            thumb_url=f"https://picsum.photos/300/200?random={image_seed}",
-            alt_text=f"{query} 관련 이미지 {i+1}",
-            attribution={"photographer": "Lorem Picsum", "source": "https://picsum.photos"},
-            width=800, height=600
-        ))
-    
-    return images
+async def search_images(query: str, count: int = 3, priority: str = PRIORITY_EXTRA) -> List[ImageInfo]:
+    """키워드 기반 이미지 검색 (Unsplash → 캐시된 결과 → Lorem Picsum 순서, 공급자별 서킷 브레이커)"""
+    images = await image_providers.search(query, count, "landscape", priority)
+    return [ImageInfo(**image) for image in images]
 
 @app.get("/test/claude")
 async def test_claude_connection():
@@ -481,7 +384,7 @@ async def test_publish_content(request: PublishRequest):
         # Claude API가 없으면 더미 콘텐츠 생성
         if not claude_client:
             # 이미지 검색 먼저 실행
-            title_images = await search_images(request.keywords[0], count=3)
+            title_images = await search_images(request.keywords[0], count=3, priority=PRIORITY_FEATURED)
             keyword_images = await search_images(" ".join(request.keywords), count=2)
             
             # 본문에 이미지를 배치한 콘텐츠 생성
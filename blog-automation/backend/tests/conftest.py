@@ -1,6 +1,8 @@
 import pytest
 import asyncio
+from contextlib import AsyncExitStack
 from typing import AsyncGenerator
+from aiohttp.test_utils import TestServer
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from httpx import AsyncClient
@@ -10,6 +12,13 @@ from app.main import app
 from app.core.config import settings
 from app.models.user import User
 from app.core.security import get_password_hash
+from app.core.http_client import close_http_clients
+from app.services.browser_pool import BrowserPool
+from app.services.publishers.wordpress_media import WordPressMediaUploader
+from app.services.publishers.wordpress_publisher import WordPressPublisher
+from app.services.publishers.wordpress_terms import WordPressTermCache
+from tests.fake_playwright import FakePlaywright, FernetCipher
+from tests.fake_wordpress import FakeWordPress
 
 # 테스트용 데이터베이스 URL
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -92,4 +101,53 @@ async def auth_headers(test_user: User, client: AsyncClient) -> dict:
     assert response.status_code == 200
     token = response.json()["access_token"]
     
-    return {"Authorization": f"Bearer {token}"}
\ No newline at end of file
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def serve():
+    """aiohttp 앱을 TestServer로 띄우는 함수 (테스트가 끝나면 공유 HTTP 클라이언트와 서버 정리)"""
+    async with AsyncExitStack() as stack:
+        async def start(app) -> TestServer:
+            return await stack.enter_async_context(TestServer(app))
+
+        try:
+            yield start
+        finally:
+            await close_http_clients()
+
+
+@pytest.fixture
+def wordpress(request) -> FakeWordPress:
+    """가짜 WordPress 사이트 (옵션은 parametrize(..., indirect=True)로 전달)"""
+    return FakeWordPress(**getattr(request, "param", {}))
+
+
+@pytest.fixture
+async def fake_wordpress_server(serve, wordpress) -> str:
+    """가짜 WordPress 서버를 띄우고 사이트 URL 반환"""
+    server = await serve(wordpress.app)
+    return str(server.make_url("")).rstrip("/")
+
+
+@pytest.fixture
+def wordpress_publisher(fake_wordpress_server, tmp_path) -> WordPressPublisher:
+    """가짜 WordPress 서버로 발행하는 Publisher (태그/미디어 캐시는 임시 디렉터리)"""
+    publisher = WordPressPublisher({"site_url": fake_wordpress_server, "username": "admin", "password": "secret"})
+    publisher.term_cache = WordPressTermCache(disk_dir=str(tmp_path / "terms"))
+    publisher.media_uploader = WordPressMediaUploader(disk_dir=str(tmp_path / "media"))
+    return publisher
+
+
+@pytest.fixture
+def fake_playwright() -> FakePlaywright:
+    """가짜 Playwright"""
+    return FakePlaywright()
+
+
+@pytest.fixture
+async def browser_pool(fake_playwright, tmp_path) -> AsyncGenerator[BrowserPool, None]:
+    """가짜 Playwright를 쓰는 브라우저 풀 (로그인 상태는 임시 디렉터리에 암호화 저장)"""
+    pool = BrowserPool(state_dir=str(tmp_path), cipher=FernetCipher(), playwright_factory=fake_playwright)
+    yield pool
+    await pool.close()
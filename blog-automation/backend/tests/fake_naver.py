@@ -0,0 +1,80 @@
+"""
+테스트용 가짜 네이버 블로그 글쓰기 엔드포인트 (aiohttp.web)
+
+스마트에디터 ONE이 호출하는 RabbitWrite/RabbitUpdate/PostDelete 요청과 응답 형태를 기록한 대로 흉내 냅니다.
+로그인 쿠키(NID_AUT, NID_SES)가 유효하지 않으면 nid.naver.com 로그인 페이지로 돌려보냅니다.
+"""
+import json
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+VALID_COOKIES = {"NID_AUT": "valid-aut", "NID_SES": "valid-ses"}
+LOGIN_URL = "https://nid.naver.com/nidlogin.login?url=https%3A%2F%2Fblog.naver.com%2FRabbitWrite.naver"
+
+
+class FakeNaverBlog:
+    """메모리에 포스트를 두는 가짜 네이버 블로그"""
+
+    def __init__(self, reject: bool = False, fail_after_write: bool = False):
+        self.reject = reject  # 모든 요청을 isSuccess=false로 거부 (엔드포인트 변경 흉내)
+        self.fail_after_write = fail_after_write  # 글을 저장한 뒤 500 응답 (응답 유실 흉내)
+        self.posts: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[tuple] = []
+        self._next_log_no = 223000000001
+
+        self.app = web.Application()
+        self.app.router.add_post("/RabbitWrite.naver", self._write)
+        self.app.router.add_post("/RabbitUpdate.naver", self._update)
+        self.app.router.add_post("/PostDelete.naver", self._delete)
+
+    def _authorized(self, request: web.Request) -> bool:
+        return all(request.cookies.get(name) == value for name, value in VALID_COOKIES.items())
+
+    async def _form(self, request: web.Request):
+        self.requests.append((request.method, request.path))
+        if not self._authorized(request):
+            raise web.HTTPFound(LOGIN_URL)
+        return await request.post()
+
+    def _rejected(self) -> web.Response:
+        return web.json_response({"isSuccess": False, "errorCode": "INVALID_PARAMETER", "message": "잘못된 요청"})
+
+    def _success(self, blog_id: str, log_no: str) -> web.Response:
+        return web.json_response({
+            "isSuccess": True,
+            "result": {
+                "redirectUrl": f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}&redirect=Dlog"
+            }
+        })
+
+    async def _write(self, request: web.Request) -> web.Response:
+        form = await self._form(request)
+        if self.reject:
+            return self._rejected()
+        log_no = str(self._next_log_no)
+        self._next_log_no += 1
+        self.posts[log_no] = {
+            "blogId": form["blogId"],
+            "documentModel": json.loads(form["documentModel"]),
+            "populationParams": json.loads(form["populationParams"]),
+        }
+        if self.fail_after_write:
+            return web.Response(status=500, text="Internal Server Error")
+        return self._success(form["blogId"], log_no)
+
+    async def _update(self, request: web.Request) -> web.Response:
+        form = await self._form(request)
+        if self.reject:
+            return self._rejected()
+        if form["logNo"] not in self.posts:
+            return web.json_response({"isSuccess": False, "errorCode": "NOT_FOUND", "message": "없는 글"})
+        self.posts[form["logNo"]]["documentModel"] = json.loads(form["documentModel"])
+        return self._success(form["blogId"], form["logNo"])
+
+    async def _delete(self, request: web.Request) -> web.Response:
+        form = await self._form(request)
+        if self.reject:
+            return self._rejected()
+        self.posts.pop(form["logNo"], None)
+        return web.json_response({"isSuccess": True, "result": {}})
@@ -0,0 +1,84 @@
+"""
+테스트용 가짜 Playwright (BrowserPool.playwright_factory에 넣어 씀)
+
+chromium.launch()로 띄운 브라우저, 컨텍스트의 storage_state()/route()/new_page()만 흉내 내고
+브라우저 종료 횟수와 컨텍스트 생성/브라우저 실행 실패를 테스트에서 조절할 수 있게 합니다.
+"""
+from cryptography.fernet import Fernet
+
+
+class FernetCipher:
+    """EncryptionService와 같은 encrypt/decrypt(str) 인터페이스"""
+
+    def __init__(self):
+        self.fernet = Fernet(Fernet.generate_key())
+
+    def encrypt(self, data: str) -> str:
+        return self.fernet.encrypt(data.encode()).decode()
+
+    def decrypt(self, data: str) -> str:
+        return self.fernet.decrypt(data.encode()).decode()
+
+
+class FakeContext:
+    def __init__(self, storage_state=None):
+        self.storage = storage_state or {"cookies": [], "origins": []}
+        self.closed = False
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def new_page(self):
+        return object()
+
+    async def storage_state(self):
+        return self.storage
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+        self.close_calls = 0
+        self.fail_contexts = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, storage_state=None):
+        if not self.connected or self.fail_contexts:
+            raise RuntimeError("Browser has been closed")
+        context = FakeContext(storage_state)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.close_calls += 1
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.chromium = self
+        self.fail_launch = False
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        return self
+
+    async def launch(self, headless=True):
+        if self.fail_launch:
+            raise RuntimeError("Executable doesn't exist")
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
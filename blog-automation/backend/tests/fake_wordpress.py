@@ -0,0 +1,159 @@
+"""
+테스트용 가짜 WordPress REST API 서버 (aiohttp.web)
+
+wp/v2 태그/카테고리 엔드포인트의 search, include, per_page/page, term_exists 동작과
+미디어 업로드/조회, 포스트 생성/수정/삭제, /batch/v1 묶음 요청을 흉내 내고 요청 기록(requests)을 남깁니다.
+이미지 원본을 제공하는 /photos/{name} 경로도 함께 둡니다.
+"""
+import asyncio
+import html
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+
+
+class FakeWordPress:
+    """메모리에 데이터를 두는 가짜 WordPress 사이트"""
+
+    def __init__(self, delay: float = 0.0, batch: bool = True):
+        self.delay = delay  # 생성 요청 응답 지연 (동시 처리 확인용)
+        self.terms: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.media: Dict[int, Dict[str, Any]] = {}
+        self.posts: Dict[int, Dict[str, Any]] = {}
+        self.photos: Dict[str, bytes] = {}
+        self.requests: List[tuple] = []
+        self._next_id = 1
+
+        self.app = web.Application()
+        for taxonomy in ("tags", "categories"):
+            self.app.router.add_get(f"/wp-json/wp/v2/{taxonomy}", self._list_terms)
+            self.app.router.add_post(f"/wp-json/wp/v2/{taxonomy}", self._create_term)
+        self.app.router.add_get("/wp-json/wp/v2/media", self._list_media)
+        self.app.router.add_post("/wp-json/wp/v2/media", self._create_media)
+        self.app.router.add_post("/wp-json/wp/v2/posts", self._posts)
+        self.app.router.add_route("*", "/wp-json/wp/v2/posts/{post_id}", self._posts)
+        if batch:
+            self.app.router.add_post("/wp-json/batch/v1", self._batch)
+        self.app.router.add_get("/photos/{name}", self._photo)
+
+    def add_term(self, taxonomy: str, name: str) -> int:
+        term = {"id": self._new_id(), "name": html.escape(name)}
+        self.terms[taxonomy].append(term)
+        return term["id"]
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id - 1
+
+    def count(self, method: str, path_suffix: str) -> int:
+        return sum(1 for m, path in self.requests if m == method and path.endswith(path_suffix))
+
+    async def _list_terms(self, request: web.Request) -> web.Response:
+        taxonomy = request.path.rsplit("/", 1)[-1]
+        self.requests.append((request.method, request.path))
+        terms = self.terms[taxonomy]
+
+        if "include" in request.query:
+            ids = {int(term_id) for term_id in request.query["include"].split(",")}
+            terms = [term for term in terms if term["id"] in ids]
+        if "search" in request.query:
+            search = request.query["search"].lower()
+            terms = [term for term in terms if search in html.unescape(term["name"]).lower()]
+        terms = sorted(terms, key=lambda term: term["name"])
+
+        per_page = int(request.query.get("per_page", 10))
+        page = int(request.query.get("page", 1))
+        total_pages = max(1, -(-len(terms) // per_page))
+        return web.json_response(
+            terms[(page - 1) * per_page:page * per_page],
+            headers={"X-WP-Total": str(len(terms)), "X-WP-TotalPages": str(total_pages)}
+        )
+
+    async def _create_term(self, request: web.Request) -> web.Response:
+        taxonomy = request.path.rsplit("/", 1)[-1]
+        self.requests.append((request.method, request.path))
+        name = (await request.json())["name"]
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        for term in self.terms[taxonomy]:
+            if html.unescape(term["name"]).lower() == name.lower():
+                return web.json_response(
+                    {"code": "term_exists", "message": "A term with the name provided already exists.",
+                     "data": {"status": 400, "term_id": term["id"]}},
+                    status=400
+                )
+        term_id = self.add_term(taxonomy, name)
+        return web.json_response({"id": term_id, "name": html.escape(name)}, status=201)
+
+    async def _list_media(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path))
+        items = list(self.media.values())
+        if "include" in request.query:
+            ids = {int(media_id) for media_id in request.query["include"].split(",")}
+            items = [item for item in items if item["id"] in ids]
+        return web.json_response([{"id": item["id"], "source_url": item["source_url"]} for item in items])
+
+    async def _create_media(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path))
+        data = await request.read()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        media_id = self._new_id()
+        filename = request.headers["Content-Disposition"].split('filename="', 1)[1].rstrip('"')
+        self.media[media_id] = {
+            "id": media_id,
+            "source_url": f"http://{request.host}/wp-content/uploads/{filename}",
+            "size": len(data),
+            "mime_type": request.content_type,
+            "alt_text": request.query.get("alt_text", ""),
+            "caption": request.query.get("caption", ""),
+        }
+        return web.json_response(self.media[media_id], status=201)
+
+    def _apply_post(self, method: str, path: str, body: Dict[str, Any], host: str) -> Tuple[int, Dict[str, Any]]:
+        post_id = path.rsplit("/", 1)[-1]
+        if post_id == "posts":
+            if method != "POST":
+                return 405, {"code": "rest_no_route"}
+            if not body.get("title"):
+                return 400, {"code": "empty_content", "message": "Content, title, and excerpt are empty."}
+            post = {"id": self._new_id(), **body}
+            post["link"] = f"http://{host}/?p={post['id']}"
+            self.posts[post["id"]] = post
+            return 201, post
+
+        post = self.posts.get(int(post_id))
+        if post is None:
+            return 404, {"code": "rest_post_invalid_id", "message": "Invalid post ID."}
+        if method == "DELETE":
+            del self.posts[post["id"]]
+            return 200, {"deleted": True, "previous": post}
+        post.update(body)
+        return 200, post
+
+    async def _posts(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path))
+        body = await request.json() if request.can_read_body else {}
+        status, data = self._apply_post(request.method, request.path, body or {}, request.host)
+        return web.json_response(data, status=status)
+
+    async def _batch(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path))
+        items = (await request.json())["requests"]
+        if len(items) > 25:
+            return web.json_response({"code": "rest_invalid_param"}, status=400)
+        responses = []
+        for item in items:
+            self.requests.append((f"batch:{item['method']}", item["path"]))
+            status, data = self._apply_post(item["method"], item["path"], item.get("body") or {}, request.host)
+            responses.append({"body": data, "status": status, "headers": {}})
+        return web.json_response({"responses": responses}, status=207)
+
+    async def _photo(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path))
+        data = self.photos.get(request.match_info["name"])
+        if data is None:
+            return web.Response(status=404)
+        return web.Response(body=data, content_type="image/jpeg")
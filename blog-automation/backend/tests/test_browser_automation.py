@@ -0,0 +1,189 @@
+import asyncio
+
+from app.core.config import settings
+from app.services.browser_automation import (
+    NAVER_LOGIN_ERROR_SELECTOR, StepTimer, login_naver, open_page, should_block, wait_for_first
+)
+from tests.fake_playwright import FakeContext
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.result = None
+
+    async def abort(self):
+        self.result = "abort"
+
+    async def continue_(self):
+        self.result = "continue"
+
+
+class FakeLoginPage:
+    """로그인 결과(이동/오류)가 정해진 시간 뒤에 나타나는 가짜 Playwright 페이지"""
+
+    def __init__(self, outcome: str, delay: float = 0.01):
+        self.outcome = outcome
+        self.delay = delay
+        self.url = "about:blank"
+        self.filled = {}
+        self.cancelled = []
+
+    async def goto(self, url, wait_until=None):
+        self.url = url
+
+    async def fill(self, selector, value):
+        self.filled[selector] = value
+
+    async def click(self, selector):
+        pass
+
+    async def _wait(self, name, timeout):
+        try:
+            if self.outcome != name:
+                await asyncio.sleep(timeout / 1000)
+                raise TimeoutError(name)
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(name)
+            raise
+
+    async def wait_for_url(self, predicate, timeout=None):
+        await self._wait("navigated", timeout)
+        self.url = "https://www.naver.com/"
+        assert predicate(self.url)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        assert selector == NAVER_LOGIN_ERROR_SELECTOR
+        await self._wait("error", timeout)
+
+
+class TestWaitForFirst:
+    """여러 대기 조건 중 먼저 충족된 조건 반환 테스트"""
+
+    async def test_returns_first_success_and_cancels_rest(self):
+        """먼저 성공한 조건을 반환하고 나머지 대기는 취소하는지 테스트"""
+        slow_cancelled = []
+
+        async def fast():
+            await asyncio.sleep(0.01)
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                slow_cancelled.append(True)
+                raise
+
+        assert await wait_for_first({"fast": fast(), "slow": slow()}, timeout_ms=1000) == "fast"
+        assert slow_cancelled == [True]
+
+    async def test_failed_conditions_are_skipped(self):
+        """실패한 조건은 건너뛰고, 모두 실패하면 None을 반환하는지 테스트"""
+
+        async def fail():
+            raise TimeoutError()
+
+        async def succeed():
+            await asyncio.sleep(0.01)
+
+        assert await wait_for_first({"fail": fail(), "ok": succeed()}, timeout_ms=1000) == "ok"
+        assert await wait_for_first({"fail": fail()}, timeout_ms=1000) is None
+
+    async def test_timeout(self):
+        """시간 안에 아무 조건도 충족되지 않으면 None을 반환하는지 테스트"""
+        assert await wait_for_first({"never": asyncio.sleep(5)}, timeout_ms=20) is None
+
+
+class TestLoginNaver:
+    """고정 대기 없는 네이버 로그인 테스트"""
+
+    async def test_success_returns_as_soon_as_page_changes(self):
+        """로그인 페이지를 벗어나자마자 성공을 반환하는지 테스트"""
+        page = FakeLoginPage("navigated")
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        assert await login_naver(page, "tester", "pw", timeout_ms=2000) is True
+
+        assert loop.time() - started < 1
+        assert page.filled == {'input[name="id"]': "tester", 'input[name="pw"]': "pw"}
+        assert page.cancelled == ["error"]
+
+    async def test_error_element_fails_fast(self):
+        """오류 메시지가 뜨면 시간 초과를 기다리지 않고 실패하는지 테스트"""
+        page = FakeLoginPage("error")
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        assert await login_naver(page, "tester", "wrong", timeout_ms=2000) is False
+        assert loop.time() - started < 1
+
+
+class TestStepTimer:
+    """단계별 소요 시간 기록 테스트"""
+
+    async def test_records_steps_even_on_error(self):
+        """단계가 예외로 끝나도 소요 시간이 기록되는지 테스트"""
+        timer = StepTimer("naver_publish", blog_id="tester")
+
+        async with timer.step("title"):
+            await asyncio.sleep(0.01)
+        try:
+            async with timer.step("submit"):
+                raise TimeoutError()
+        except TimeoutError:
+            pass
+
+        assert list(timer.steps) == ["title", "submit"]
+        assert timer.steps["title"] >= 10
+        assert timer.total_ms >= timer.steps["title"]
+        timer.log()
+
+
+class TestResourceBlocking:
+    """용도별 리소스 차단 규칙 테스트"""
+
+    def test_editor_profile(self):
+        """에디터 페이지는 네이버 스크립트/스타일시트만 받고 이미지·외부·트래커 요청은 막는지 테스트"""
+        assert not should_block("https://blog.naver.com/tester/postwrite", "document", "editor")
+        assert not should_block("https://editor-static.pstatic.net/se/editor.js", "script", "editor")
+        assert not should_block("https://editor-static.pstatic.net/se/editor.css", "stylesheet", "editor")
+        assert should_block("https://blogpfthumb-phinf.pstatic.net/profile.png", "image", "editor")
+        assert should_block("https://www.googletagmanager.com/gtm.js", "script", "editor")
+        assert should_block("https://lcs.naver.com/m", "xhr", "editor")
+        assert not should_block("data:image/png;base64,AAAA", "image", "editor")
+
+    def test_login_pages_keep_stylesheets(self):
+        """로그인을 거치는 용도는 스타일시트를 받아 숨겨진 오류 요소가 그대로 숨겨지는지 테스트"""
+        for profile in ("login", "stats"):
+            assert not should_block("https://nid.naver.com/login/css/global.css", "stylesheet", profile)
+            assert should_block("https://ssl.pstatic.net/static/nid/login/bg.png", "image", profile)
+        assert not should_block("https://blog.naver.com/BlogStatsView.naver", "document", "stats")
+
+    async def test_open_page_installs_route(self):
+        """open_page가 컨텍스트에 차단 규칙을 설치하고, 설정으로 끌 수 있는지 테스트"""
+        context = FakeContext()
+        await open_page(context, "editor")
+
+        (pattern, handler), = context.routes
+        blocked = FakeRoute("https://ad.doubleclick.net/ad.js", "script")
+        allowed = FakeRoute("https://blog.naver.com/PostList.naver", "document")
+        await handler(blocked)
+        await handler(allowed)
+        assert pattern == "**/*"
+        assert (blocked.result, allowed.result) == ("abort", "continue")
+
+        settings.browser_block_resources = False
+        try:
+            context = FakeContext()
+            await open_page(context, "editor")
+            assert context.routes == []
+        finally:
+            settings.browser_block_resources = True
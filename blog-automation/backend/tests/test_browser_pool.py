@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+
+class TestBrowserPool:
+    """Playwright 브라우저 풀 테스트 (가짜 Playwright)"""
+
+    async def test_reuses_browser_across_sessions(self, browser_pool, fake_playwright):
+        """여러 세션이 브라우저 하나를 쓰고 컨텍스트는 세션마다 닫는지 테스트"""
+        for _ in range(3):
+            async with browser_pool.session("naver:tester") as session:
+                assert session.page is not None
+
+        assert len(fake_playwright.browsers) == 1
+        assert all(context.closed for context in fake_playwright.browsers[0].contexts)
+
+    async def test_recycles_after_max_uses(self, browser_pool, fake_playwright):
+        """사용 횟수가 차면 새 브라우저를 띄우고 이전 브라우저는 세션이 끝난 뒤 닫는지 테스트"""
+        browser_pool.max_uses = 2
+
+        async with browser_pool.session("naver:a"):
+            async with browser_pool.session("naver:b"):
+                async with browser_pool.session("naver:c"):
+                    assert len(fake_playwright.browsers) == 2
+                    assert fake_playwright.browsers[0].connected is True
+
+        assert fake_playwright.browsers[0].connected is False
+        assert browser_pool.get_stats()["recycled"] == 1
+
+    async def test_replaces_disconnected_browser(self, browser_pool, fake_playwright):
+        """연결이 끊긴 브라우저는 다음 세션에서 새로 띄우는지 테스트"""
+        async with browser_pool.session("naver:tester"):
+            pass
+        fake_playwright.browsers[0].connected = False
+        async with browser_pool.session("naver:tester"):
+            pass
+
+        assert len(fake_playwright.browsers) == 2
+        assert browser_pool.get_stats()["unhealthy"] == 1
+
+    async def test_login_state_is_encrypted_and_restored(self, browser_pool, tmp_path):
+        """저장한 로그인 상태가 암호화되어 있고 다음 세션 컨텍스트에 복원되는지 테스트"""
+        state = {"cookies": [{"name": "NID_AUT", "value": "secret-cookie"}], "origins": []}
+
+        async with browser_pool.session("naver:tester") as session:
+            assert session.restored is False
+            session.context.storage = state
+            await session.save_state()
+
+        stored = next(tmp_path.glob("*.state")).read_text()
+        assert "secret-cookie" not in stored
+        assert json.loads(browser_pool.cipher.decrypt(stored)) == state
+
+        async with browser_pool.session("naver:tester") as session:
+            assert session.restored is True
+            assert session.context.storage == state
+            await session.clear_state()
+
+        assert list(tmp_path.glob("*.state")) == []
+
+    async def test_failed_relaunch_releases_once(self, browser_pool, fake_playwright):
+        """컨텍스트 생성 실패 후 새 브라우저도 못 띄우면 이전 브라우저를 한 번만 반납하는지 테스트"""
+        async with browser_pool.session("naver:tester"):
+            pass
+        old, old_handle = fake_playwright.browsers[0], browser_pool._current
+        old.fail_contexts = True
+        fake_playwright.fail_launch = True
+
+        with pytest.raises(RuntimeError):
+            async with browser_pool.session("naver:tester"):
+                pass
+
+        assert (old_handle.active, old.close_calls) == (0, 1)
+        fake_playwright.fail_launch = False
+        async with browser_pool.session("naver:tester"):
+            pass
+        assert browser_pool._current.active == 0
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import threading
+
+from app.core import executor
+from app.core.executor import OffloadPool, offload, shutdown_offload_pool
+
+
+def fail():
+    raise ValueError("boom")
+
+
+class TestOffloadPool:
+    """CPU 작업 오프로드 풀 테스트"""
+
+    async def test_thread_path_and_stats(self):
+        """스레드 풀에서 실행하고 완료/실패 지표를 기록하는지 테스트"""
+        pool = OffloadPool(thread_workers=2, process_workers=1, max_queue=4)
+        try:
+            assert await pool.run(threading.get_ident) != threading.get_ident()
+            try:
+                await pool.run(fail)
+            except ValueError:
+                pass
+
+            stats = pool.stats()["thread"]
+            assert (stats["completed"], stats["failed"], stats["in_flight"]) == (1, 1, 0)
+        finally:
+            pool.shutdown()
+
+    async def test_process_path_only_when_enabled(self):
+        """프로세스 풀은 허용된 경우에만 쓰고, 아니면 스레드 풀에서 실행하는지 테스트"""
+        pool = OffloadPool(thread_workers=2, process_workers=1, max_queue=4)
+        try:
+            assert await pool.run(os.getpid, kind="process") == os.getpid()
+            assert pool.stats()["process"]["completed"] == 0
+
+            pool.processes_enabled = True
+            assert await pool.run(os.getpid, kind="process") != os.getpid()
+            assert pool.stats()["process"]["completed"] == 1
+        finally:
+            pool.shutdown()
+
+    async def test_queue_bound_makes_callers_wait(self):
+        """대기열 상한을 넘는 호출은 제출되지 않고 기다리는지 테스트"""
+        pool = OffloadPool(thread_workers=4, process_workers=1, max_queue=2)
+        release = threading.Event()
+        try:
+            calls = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(5)]
+            await asyncio.sleep(0.05)
+
+            stats = pool.stats()["thread"]
+            assert (stats["in_flight"], stats["waiting"]) == (2, 3)
+
+            release.set()
+            assert await asyncio.gather(*calls) == [True] * 5
+            stats = pool.stats()["thread"]
+            assert (stats["max_in_flight"], stats["waiting"], stats["completed"]) == (2, 0, 5)
+        finally:
+            release.set()
+            pool.shutdown()
+
+    async def test_shutdown_offload_pool(self, monkeypatch):
+        """앱 종료 시 실행기를 정리하고, 이후 호출에서는 새로 만드는지 테스트"""
+        pool = OffloadPool(thread_workers=1, process_workers=1, max_queue=2)
+        monkeypatch.setattr(executor, "offload_pool", pool)
+
+        assert await offload(sum, [1, 2]) == 3
+        thread_executor = pool._executors["thread"]
+
+        shutdown_offload_pool()
+
+        assert pool._executors == {}
+        assert thread_executor._shutdown
+        assert await offload(sum, [3, 4]) == 7
+        pool.shutdown()
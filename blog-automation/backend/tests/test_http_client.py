@@ -0,0 +1,55 @@
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.core.http_client import ConnectionMetrics, HTTPClientRegistry
+
+
+class TestConnectionMetrics:
+    """연결 재사용 지표 테스트"""
+
+    def test_reuse_ratio(self):
+        """새 연결/재사용 연결 비율 계산 테스트"""
+        metrics = ConnectionMetrics()
+        metrics.record("api.unsplash.com", "new_connections")
+        for _ in range(3):
+            metrics.record("api.unsplash.com", "reused_connections")
+
+        snapshot = metrics.snapshot()
+        assert snapshot["api.unsplash.com"]["reuse_ratio"] == 0.75
+
+
+class TestHTTPClientRegistry:
+    """공유 HTTP 클라이언트 레지스트리 테스트"""
+
+    async def test_session_is_shared_per_loop(self):
+        """같은 이벤트 루프에서는 같은 세션을 반환하는지 테스트"""
+        registry = HTTPClientRegistry()
+        try:
+            assert registry.session() is registry.session()
+            assert registry.httpx_client() is registry.httpx_client()
+        finally:
+            await registry.close()
+
+        assert registry.session().closed is False
+        await registry.close()
+
+    async def test_connections_are_reused(self):
+        """연속 요청이 keep-alive 연결을 재사용하는지 테스트"""
+        async def handler(request):
+            return web.json_response({"ok": True})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        registry = HTTPClientRegistry()
+
+        async with TestServer(app) as server:
+            session = registry.session()
+            for _ in range(5):
+                async with session.get(server.make_url("/")) as response:
+                    assert (await response.json())["ok"] is True
+            await registry.close()
+
+        stats = registry.stats()[server.host]
+        assert stats["requests"] == 5
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 4
@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+from app.services.image_cache import ImageSearchCache, make_cache_key
+
+
+def make_fetch(calls, images=None, delay=0.0):
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return images if images is not None else [{"id": f"img{len(calls)}"}]
+    return fetch
+
+
+class TestImageSearchCache:
+    """이미지 검색 결과 캐시 테스트"""
+
+    def test_cache_key_is_normalized(self):
+        """대소문자/공백이 다른 쿼리가 같은 키가 되는지 테스트"""
+        assert make_cache_key("svc", "  Artificial   Intelligence ", 2, "landscape") == \
+            make_cache_key("svc", "artificial intelligence", 2, "landscape")
+        assert make_cache_key("svc", "ai", 2, "landscape") != make_cache_key("svc", "ai", 3, "landscape")
+
+    async def test_second_lookup_hits_cache(self):
+        """같은 쿼리 두 번째 호출은 API를 호출하지 않는지 테스트"""
+        cache = ImageSearchCache()
+        calls = []
+
+        first = await cache.get_or_fetch("svc", "Technology", 2, "landscape", make_fetch(calls))
+        second = await cache.get_or_fetch("svc", "technology", 2, "landscape", make_fetch(calls))
+
+        assert first == second == [{"id": "img1"}]
+        assert len(calls) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        """동시에 들어온 같은 쿼리가 API 호출 하나를 공유하는지 테스트"""
+        cache = ImageSearchCache()
+        calls = []
+
+        results = await asyncio.gather(*[
+            cache.get_or_fetch("svc", "cloud", 2, "landscape", make_fetch(calls, delay=0.05))
+            for _ in range(5)
+        ])
+
+        assert len(calls) == 1
+        assert all(result == results[0] for result in results)
+
+    async def test_stale_entry_served_while_revalidating(self):
+        """TTL이 지난 결과를 반환하면서 백그라운드에서 갱신하는지 테스트"""
+        cache = ImageSearchCache(ttl_seconds=60, stale_seconds=600)
+        calls = []
+        await cache.get_or_fetch("svc", "data", 2, "landscape", make_fetch(calls))
+
+        key = make_cache_key("svc", "data", 2, "landscape")
+        cache._memory[key]["stored_at"] = time.time() - 120
+
+        stale = await cache.get_or_fetch("svc", "data", 2, "landscape", make_fetch(calls))
+        assert stale == [{"id": "img1"}]
+
+        await asyncio.sleep(0.01)
+        fresh = await cache.get_or_fetch("svc", "data", 2, "landscape", make_fetch(calls))
+        assert fresh == [{"id": "img2"}]
+        assert cache.get_stats()["refreshes"] == 1
+
+    async def test_empty_result_not_cached(self):
+        """빈 결과는 캐시하지 않는지 테스트"""
+        cache = ImageSearchCache()
+        calls = []
+
+        await cache.get_or_fetch("svc", "nothing", 2, "landscape", make_fetch(calls, images=[]))
+        await cache.get_or_fetch("svc", "nothing", 2, "landscape", make_fetch(calls, images=[]))
+
+        assert len(calls) == 2
+
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """디스크 캐시가 새 인스턴스에서도 읽히는지 테스트"""
+        calls = []
+        await ImageSearchCache(disk_dir=str(tmp_path)).get_or_fetch(
+            "svc", "mobile", 2, "landscape", make_fetch(calls)
+        )
+
+        restarted = ImageSearchCache(disk_dir=str(tmp_path))
+        images = await restarted.get_or_fetch("svc", "mobile", 2, "landscape", make_fetch(calls))
+
+        assert images == [{"id": "img1"}]
+        assert len(calls) == 1
+
+    async def test_disk_io_runs_off_event_loop(self, tmp_path, monkeypatch):
+        """디스크 캐시 읽기/쓰기를 이벤트 루프 스레드 밖에서 실행하는지 테스트"""
+        import threading
+
+        loop_thread = threading.get_ident()
+        io_threads = []
+        read_file, write_file = ImageSearchCache._read_file, ImageSearchCache._write_file
+
+        def tracked_read(path):
+            io_threads.append(threading.get_ident())
+            return read_file(path)
+
+        def tracked_write(path, entry):
+            io_threads.append(threading.get_ident())
+            write_file(path, entry)
+
+        monkeypatch.setattr(ImageSearchCache, "_read_file", staticmethod(tracked_read))
+        monkeypatch.setattr(ImageSearchCache, "_write_file", staticmethod(tracked_write))
+
+        await ImageSearchCache(disk_dir=str(tmp_path)).get_or_fetch(
+            "svc", "laptop", 2, "landscape", make_fetch([])
+        )
+
+        assert len(io_threads) == 2
+        assert loop_thread not in io_threads
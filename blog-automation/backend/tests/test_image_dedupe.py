@@ -0,0 +1,67 @@
+import io
+import random
+
+import pytest
+
+from app.services.image_dedupe import BKTree, PerceptualImageIndex, dhash, hamming_distance
+
+
+class TestBKTree:
+    """해밍 거리 BK-트리 테스트"""
+
+    def test_search_matches_brute_force(self):
+        """BK-트리 검색 결과가 전수 비교와 같은지 테스트"""
+        rng = random.Random(7)
+        hashes = [rng.getrandbits(64) for _ in range(500)]
+        tree = BKTree()
+        for index, value in enumerate(hashes):
+            tree.add(value, index)
+
+        query = hashes[42] ^ 0b1011  # 3비트 다른 해시
+        expected = {index for index, value in enumerate(hashes) if hamming_distance(query, value) <= 6}
+
+        assert {index for _, index in tree.search(query, 6)} == expected
+        assert 42 in expected
+
+
+class TestPerceptualImageIndex:
+    """지각 해시 색인 테스트"""
+
+    def make_index(self, hashes):
+        index = PerceptualImageIndex(max_distance=6)
+        index._hashes.update(hashes)
+        return index
+
+    async def test_skips_recently_used_near_duplicates(self):
+        """최근 포스트에 쓴 이미지와 거의 같은 이미지를 건너뛰는지 테스트"""
+        index = self.make_index({"used": 0xF0F0F0F0F0F0F0F0, "near": 0xF0F0F0F0F0F0F0F3, "other": 0x0123456789ABCDEF})
+        await index.record_used([{"id": "used"}])
+
+        kept = await index.filter_images([{"id": "near"}, {"id": "other"}])
+
+        assert [image["id"] for image in kept] == ["other"]
+        assert await index.is_recently_used({"id": "near"})
+
+    async def test_dedupes_within_batch_and_reference(self):
+        """같은 목록 안이나 대표 이미지와 겹치는 이미지를 빼는지 테스트"""
+        index = self.make_index({"featured": 0xAAAA, "copy": 0xAAAB, "a": 0xFFFF0000FFFF0000, "a2": 0xFFFF0000FFFF0001})
+
+        kept = await index.filter_images(
+            [{"id": "copy"}, {"id": "a"}, {"id": "a2"}, {"id": "unhashable"}],
+            reference=[{"id": "featured"}]
+        )
+
+        assert [image["id"] for image in kept] == ["a", "unhashable"]
+
+    def test_dhash_is_stable_under_resize(self):
+        """크기만 다른 같은 이미지의 dHash가 가까운지 테스트"""
+        Image = pytest.importorskip("PIL.Image")
+
+        def encode(size):
+            image = Image.new("L", (64, 64))
+            image.putdata([(x * 4 + y) % 256 for y in range(64) for x in range(64)])
+            buffer = io.BytesIO()
+            image.resize(size).save(buffer, "PNG")
+            return buffer.getvalue()
+
+        assert hamming_distance(dhash(encode((64, 64))), dhash(encode((200, 200)))) <= 4
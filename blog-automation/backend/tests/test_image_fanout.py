@@ -0,0 +1,144 @@
+import asyncio
+import time
+
+from app.services.image_fanout import fan_out_searches, hedged_search
+
+
+def make_search(image_ids, delay=0.0, calls=None):
+    async def search():
+        if calls is not None:
+            calls.append(image_ids)
+        await asyncio.sleep(delay)
+        return [{"id": image_id} for image_id in image_ids]
+    return search
+
+
+class TestFanOutSearches:
+    """이미지 검색 병렬 실행 테스트"""
+
+    async def test_runs_concurrently(self):
+        """검색이 순차가 아니라 동시에 실행되는지 테스트"""
+        searches = [make_search([f"img{i}"], delay=0.1) for i in range(3)]
+
+        started = time.perf_counter()
+        results = await fan_out_searches(searches, concurrency=3)
+        elapsed = time.perf_counter() - started
+
+        assert results == [[{"id": "img0"}], [{"id": "img1"}], [{"id": "img2"}]]
+        assert elapsed < 0.25
+
+    async def test_deduplicates_across_searches(self):
+        """먼저 도착한 결과와 겹치는 이미지를 제외하는지 테스트"""
+        searches = [
+            make_search(["a", "b"], delay=0.05),
+            make_search(["b", "c"], delay=0.0),
+        ]
+
+        results = await fan_out_searches(searches)
+
+        assert [img["id"] for img in results[1]] == ["b", "c"]
+        assert [img["id"] for img in results[0]] == ["a"]
+
+    async def test_cancels_when_limit_reached(self):
+        """동시 실행 상한을 지키고, 고유 이미지가 충분히 모이면 남은 검색을 취소하는지 테스트"""
+        started_ids, cancelled_ids = [], []
+        in_flight = {"now": 0, "max": 0}
+
+        def tracked(image_ids, delay):
+            async def search():
+                started_ids.append(image_ids[0])
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    cancelled_ids.append(image_ids[0])
+                    raise
+                finally:
+                    in_flight["now"] -= 1
+                return [{"id": image_id} for image_id in image_ids]
+            return search
+
+        searches = [
+            tracked(["a", "b"], 0.0),
+            tracked(["c", "d"], 0.02),
+            tracked(["e", "f"], 5.0),
+            tracked(["g", "h"], 5.0),
+        ]
+
+        started = time.perf_counter()
+        results = await fan_out_searches(searches, limit=4, concurrency=2)
+
+        assert time.perf_counter() - started < 1.0
+        assert [[img["id"] for img in images] for images in results] == [["a", "b"], ["c", "d"], [], []]
+        # 동시에 실행된 검색은 상한(2)을 넘지 않음
+        assert in_flight == {"now": 0, "max": 2}
+        # 앞선 검색이 끝나 자리가 날 때마다 다음 검색이 시작되고,
+        # 한도에 도달하면 아직 진행 중인 검색은 모두 취소됨
+        assert started_ids == ["a", "c", "e", "g"]
+        assert sorted(cancelled_ids) == ["e", "g"]
+
+    async def test_failed_search_is_skipped(self):
+        """실패한 검색이 있어도 나머지 결과를 반환하는지 테스트"""
+        async def failing():
+            raise RuntimeError("rate limited")
+
+        results = await fan_out_searches([failing, make_search(["a"])])
+
+        assert results == [[], [{"id": "a"}]]
+
+
+class TestHedgedSearch:
+    """헤지 방식 대체 검색 테스트"""
+
+    async def test_fast_primary_skips_fallbacks(self):
+        """1순위 검색이 빨리 끝나면 대체 검색을 보내지 않는지 테스트"""
+        calls = []
+        result = await hedged_search(
+            make_search(["main"], calls=calls),
+            [make_search(["fallback"], calls=calls)],
+            hedge_delay=0.2,
+            deadline=1.0
+        )
+
+        assert result == (0, [{"id": "main"}])
+        assert calls == [["main"]]
+
+    async def test_slow_primary_loses_to_fallback(self):
+        """1순위 검색이 늦으면 먼저 끝난 대체 검색 결과를 쓰는지 테스트"""
+        started = time.perf_counter()
+        result = await hedged_search(
+            make_search(["main"], delay=5.0),
+            [make_search([], delay=0.0), make_search(["nature"], delay=0.05)],
+            hedge_delay=0.05,
+            deadline=1.0
+        )
+
+        assert result == (2, [{"id": "nature"}])
+        assert time.perf_counter() - started < 0.5
+
+    async def test_empty_primary_hedges_immediately(self):
+        """1순위 결과가 비어 있으면 지연 없이 대체 검색을 보내는지 테스트"""
+        started = time.perf_counter()
+        result = await hedged_search(
+            make_search([]),
+            [make_search(["abstract"])],
+            hedge_delay=1.0,
+            deadline=2.0
+        )
+
+        assert result == (1, [{"id": "abstract"}])
+        assert time.perf_counter() - started < 0.5
+
+    async def test_deadline_bounds_latency(self):
+        """모든 검색이 늦으면 deadline에 None을 반환하는지 테스트"""
+        started = time.perf_counter()
+        result = await hedged_search(
+            make_search(["main"], delay=5.0),
+            [make_search(["fallback"], delay=5.0)],
+            hedge_delay=0.05,
+            deadline=0.2
+        )
+
+        assert result is None
+        assert time.perf_counter() - started < 0.5
@@ -0,0 +1,87 @@
+from app.services.image_insertion import (
+    ImageInsertionPolicy, find_boundaries, insert_images, plan_slots
+)
+
+
+def make_images(count):
+    return [{
+        "id": f"img{i}",
+        "url": f"https://example.com/{i}.jpg",
+        "alt_text": f"이미지 {i}",
+        "attribution": {"photographer": "작가", "source": "Unsplash"},
+        "width": 800,
+        "height": 600
+    } for i in range(count)]
+
+
+def paragraph(index, length=300):
+    return f"단락{index} " + "가" * length
+
+
+class TestImageInsertion:
+    """본문 이미지 삽입 엔진 테스트"""
+
+    def test_inserts_planned_count_without_blank_lines(self):
+        """헤딩 앞처럼 빈 줄이 없는 경계에도 이미지를 넣는지 테스트"""
+        content = "\n".join(
+            f"## 섹션 {i}\n{paragraph(i, 500)}" for i in range(6)
+        )
+
+        result = insert_images(content, make_images(6), ImageInsertionPolicy(spacing=500))
+
+        # 헤딩 앞 경계 5곳 모두 사용 (본문 맨 끝 제외)
+        assert result.count == 5
+        assert content.count("단락") == result.content.count("단락")
+        assert "\n\n![이미지 0](https://example.com/0.jpg)\n*사진: 작가 (Unsplash)*\n\n## 섹션" in result.content
+
+    def test_skips_lists_code_and_document_end(self):
+        """리스트 중간, 코드 블록 안, 본문 맨 끝은 경계가 아닌지 테스트"""
+        lines = [
+            "첫 단락",           # 0: 경계 (다음이 빈 줄)
+            "",
+            "- 항목 1",           # 2: 리스트 중간이라 경계 아님
+            "",
+            "- 항목 2",           # 4: 리스트 끝 - 경계
+            "",
+            "```",
+            "코드",
+            "",
+            "```",               # 9: 코드 블록 끝 - 경계
+            "",
+            "마지막 단락",        # 11: 본문 끝이라 경계 아님
+        ]
+
+        positions, offsets = find_boundaries(lines)
+
+        assert positions == [0, 4, 9]
+        assert offsets == sorted(offsets)
+
+    def test_respects_spacing_and_max_images(self):
+        """이미지 간격과 최대 개수 정책을 지키는지 테스트"""
+        offsets = [100, 450, 600, 900, 1300, 1500, 2100]
+
+        assert plan_slots(offsets, 2400, 3, 500) == [2, 4, 6]
+        assert plan_slots(offsets, 2400, 3, 1000) == [4]
+
+        content = "\n\n".join(paragraph(i) for i in range(10))
+        result = insert_images(content, make_images(10), ImageInsertionPolicy(spacing=300, max_images=2))
+        assert result.count == 2
+
+    def test_skips_featured_image(self):
+        """대표 이미지와 같은 이미지는 본문에 넣지 않는지 테스트"""
+        images = make_images(3)
+        content = "\n\n".join(paragraph(i, 600) for i in range(4))
+
+        result = insert_images(content, images, featured=images[0])
+
+        assert [img["id"] for img in result.images] == ["img1", "img2"]
+        assert "0.jpg" not in result.content
+
+    def test_html_output(self):
+        """HTML figure 블록으로 출력하는지 테스트"""
+        content = "\n\n".join(paragraph(i, 600) for i in range(3))
+
+        result = insert_images(content, make_images(1), ImageInsertionPolicy(output="html"))
+
+        assert '<figure><img src="https://example.com/0.jpg" alt="이미지 0" width="800" height="600" loading="lazy">' in result.content
+        assert "<figcaption>사진: 작가 (Unsplash)</figcaption></figure>" in result.content
@@ -0,0 +1,159 @@
+import time
+
+from app.services.image_cache import ImageSearchCache
+from app.services.image_providers import (
+    CircuitBreaker, ImageProvider, ImageProviderChain, ImageProviderError,
+    LocalCacheProvider, PicsumProvider
+)
+from app.services.unsplash_quota import QuotaExhaustedError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProvider(ImageProvider):
+    def __init__(self, name, images=None, error=None, cacheable=False):
+        self.name = name
+        self.images = images or []
+        self.error = error
+        self.cacheable = cacheable
+        self.calls = 0
+
+    async def search(self, query, count, orientation="landscape", priority="extra"):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.images[:count]
+
+
+def make_chain(providers, clock, cache=None):
+    breakers = {
+        provider.name: CircuitBreaker(provider.name, failure_threshold=2, recovery_timeout=30, clock=clock)
+        for provider in providers
+    }
+    return ImageProviderChain(providers, cache=cache, breakers=breakers)
+
+
+class TestCircuitBreaker:
+    """서킷 브레이커 상태 전이 테스트"""
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패가 기준에 닿으면 차단하는지 테스트"""
+        breaker = CircuitBreaker("unsplash", failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_open_allows_single_probe(self):
+        """복구 대기 시간이 지나면 시험 호출 한 건만 허용하는지 테스트"""
+        clock = FakeClock()
+        breaker = CircuitBreaker("unsplash", failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 31
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        """시험 호출이 실패하면 다시 차단하는지 테스트"""
+        clock = FakeClock()
+        breaker = CircuitBreaker("unsplash", failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 31
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.is_open()
+
+
+class TestImageProviderChain:
+    """이미지 공급자 체인 테스트"""
+
+    async def test_fails_over_to_next_provider(self):
+        """1순위 공급자가 실패하면 다음 공급자 결과를 쓰는지 테스트"""
+        unsplash = FakeProvider("unsplash", error=ImageProviderError("HTTP 503"))
+        chain = make_chain([unsplash, PicsumProvider()], FakeClock())
+
+        images = await chain.search("cloud", count=2)
+
+        assert len(images) == 2
+        assert images[0]["attribution"]["source"] == "Lorem Picsum"
+
+    async def test_open_breaker_skips_provider(self):
+        """차단된 공급자는 호출하지 않고 바로 넘어가는지 테스트"""
+        unsplash = FakeProvider("unsplash", error=ImageProviderError("timeout"))
+        chain = make_chain([unsplash, PicsumProvider()], FakeClock())
+
+        await chain.search("a")
+        await chain.search("b")
+        assert unsplash.calls == 2
+
+        started = time.perf_counter()
+        for _ in range(100):
+            await chain.search("c")
+        elapsed = time.perf_counter() - started
+
+        assert unsplash.calls == 2
+        assert chain.breakers["unsplash"].stats["short_circuits"] == 100
+        assert elapsed < 0.5
+
+    async def test_probe_recovers_provider(self):
+        """복구 대기 시간 후 시험 호출이 성공하면 다시 사용하는지 테스트"""
+        clock = FakeClock()
+        unsplash = FakeProvider("unsplash", error=ImageProviderError("HTTP 500"))
+        chain = make_chain([unsplash, PicsumProvider()], clock)
+        await chain.search("a")
+        await chain.search("b")
+
+        unsplash.error = None
+        unsplash.images = [{"id": "u1"}]
+        clock.now = 31
+
+        assert await chain.search("c") == [{"id": "u1"}]
+        assert chain.breakers["unsplash"].state == "closed"
+
+    async def test_quota_exhaustion_is_not_a_failure(self):
+        """호출 한도 임박은 공급자 장애로 세지 않는지 테스트"""
+        unsplash = FakeProvider("unsplash", error=QuotaExhaustedError("a"))
+        chain = make_chain([unsplash, PicsumProvider()], FakeClock())
+
+        for query in ["a", "b", "c"]:
+            await chain.search(query)
+
+        assert chain.breakers["unsplash"].state == "closed"
+        assert unsplash.calls == 3
+
+    async def test_local_cache_serves_last_good_result(self):
+        """API 장애 시 기간이 지난 캐시 결과라도 반환하는지 테스트"""
+        cache = ImageSearchCache(ttl_seconds=0, stale_seconds=0)
+        unsplash = FakeProvider("unsplash", images=[{"id": "u1"}], cacheable=True)
+        chain = make_chain([unsplash, LocalCacheProvider(cache), PicsumProvider()], FakeClock(), cache=cache)
+        assert await chain.search("cloud", count=1) == [{"id": "u1"}]
+
+        unsplash.error = ImageProviderError("HTTP 503")
+
+        assert await chain.search("cloud", count=1) == [{"id": "u1"}]
+
+    async def test_placeholder_can_be_skipped(self):
+        """allow_placeholder=False이면 Lorem Picsum으로 채우지 않는지 테스트"""
+        unsplash = FakeProvider("unsplash", images=[])
+        chain = make_chain([unsplash, PicsumProvider()], FakeClock())
+
+        assert await chain.search("cloud", allow_placeholder=False) == []
+        assert len(await chain.search("cloud")) == 3
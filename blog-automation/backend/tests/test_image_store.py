@@ -0,0 +1,110 @@
+import io
+import os
+
+import pytest
+from aiohttp import web
+
+from app.services.image_store import LocalImageStore
+
+
+def make_jpeg(width=1600, height=900):
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (30, 120, 200)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+class TestLocalImageStore:
+    """로컬 리사이즈 이미지 저장소 테스트"""
+
+    def test_variant_path_rejects_invalid_names(self, tmp_path):
+        """잘못된 해시나 변환본 이름으로 파일에 접근할 수 없는지 테스트"""
+        store = LocalImageStore(str(tmp_path))
+
+        assert store.variant_path("../../etc/passwd", "thumb") is None
+        assert store.variant_path("a" * 32, "original") is None
+        assert store.variant_path("a" * 32, "thumb") is None
+
+    async def test_downloads_once_and_resizes(self, tmp_path, monkeypatch):
+        """같은 URL은 한 번만 내려받고 용도별 크기로 저장하는지 테스트"""
+        from PIL import Image
+
+        data = make_jpeg()
+        downloads = []
+
+        async def fake_download(self, url):
+            downloads.append(url)
+            return data
+
+        monkeypatch.setattr(LocalImageStore, "_download", fake_download)
+        store = LocalImageStore(str(tmp_path), public_base_url="http://localhost:8000")
+
+        image = {"id": "abc", "url": "https://images.unsplash.com/photo-1", "thumb_url": "https://x/thumb"}
+        localized = await store.localize_image(image, main_variant="featured")
+        digest = localized["local_digest"]
+
+        assert localized["url"] == f"http://localhost:8000/images/{digest}/featured.jpg"
+        assert localized["source_url"] == image["url"]
+        with Image.open(store.variant_path(digest, "thumb")) as thumb:
+            assert thumb.width == 400
+
+        # 재시작한 저장소도 디스크 색인을 읽어 다시 받지 않음
+        restarted = LocalImageStore(str(tmp_path))
+        assert await restarted.cache_image(image["url"]) == digest
+        assert downloads == [image["url"]]
+
+    async def test_downloads_whole_body_in_chunks(self, serve, tmp_path):
+        """64KB보다 큰 사진도 끝까지 받아 변환하는지 테스트 (실제 HTTP 서버)"""
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.frombytes("RGB", (600, 600), os.urandom(600 * 600 * 3)).save(buffer, "JPEG", quality=95)
+        data = buffer.getvalue()
+        assert len(data) > 64 * 1024
+
+        async def photo(request):
+            response = web.StreamResponse(headers={"Content-Type": "image/jpeg"})
+            await response.prepare(request)
+            for i in range(0, len(data), 16 * 1024):
+                await response.write(data[i:i + 16 * 1024])
+            return response
+
+        app = web.Application()
+        app.router.add_get("/photo.jpg", photo)
+        server = await serve(app)
+        store = LocalImageStore(str(tmp_path))
+
+        assert await store._download(str(server.make_url("/photo.jpg"))) == data
+        digest = await store.cache_image(str(server.make_url("/photo.jpg")))
+
+        with Image.open(store.variant_path(digest, "thumb")) as thumb:
+            assert thumb.width == 400
+
+    async def test_failed_download_keeps_remote_url(self, tmp_path, monkeypatch):
+        """내려받기에 실패하면 원래 이미지 정보를 그대로 쓰는지 테스트"""
+        async def failing_download(self, url):
+            raise ValueError("HTTP 404")
+
+        monkeypatch.setattr(LocalImageStore, "_download", failing_download)
+        store = LocalImageStore(str(tmp_path))
+
+        image = {"id": "abc", "url": "https://picsum.photos/800/600"}
+        assert await store.localize_image(image) == image
+
+    def test_inactive_without_public_base_url(self, monkeypatch):
+        """켜져 있어도 공개 주소가 없거나 localhost면 URL을 바꾸지 않는지 테스트"""
+        from app.core.config import settings
+        from app.services.image_store import image_store_active
+
+        monkeypatch.setattr(settings, "image_store_enabled", True)
+        for base_url, active in [
+            (None, False),
+            ("http://localhost:8000", False),
+            ("http://127.0.0.1:8000", False),
+            ("https://api.example.com", True),
+        ]:
+            monkeypatch.setattr(settings, "image_public_base_url", base_url)
+            assert image_store_active() is active
+
+        monkeypatch.setattr(settings, "image_store_enabled", False)
+        assert image_store_active() is False
@@ -0,0 +1,55 @@
+from app.services.incremental_seo import IncrementalSEOScorer, split_markdown_paragraphs
+from app.services.seo_optimizer import SEOOptimizer
+
+ORIGINAL = """## 파이썬 소개
+
+파이썬은 배우기 쉬운 언어입니다. 파이썬으로 많은 것을 할 수 있어요!
+
+## 설치 방법
+
+공식 사이트에서 설치 파일을 받으세요.
+
+```python
+print("hello")
+
+print("world")
+```
+
+## 마무리
+
+오늘은 파이썬을 알아봤습니다."""
+
+
+class TestIncrementalSEO:
+    """단락 단위 증분 SEO 채점 테스트"""
+    
+    def test_split_keeps_code_fence_together(self):
+        """코드 블록 안의 빈 줄로 단락이 나뉘지 않는지 테스트"""
+        paragraphs = split_markdown_paragraphs(ORIGINAL)
+        
+        assert any(p.startswith("```python") and p.endswith("```") for p in paragraphs)
+    
+    def test_matches_full_analysis_after_edits(self):
+        """증분 결과가 전체 재분석 결과와 같은지 테스트"""
+        keywords = ["파이썬", "설치"]
+        optimizer = SEOOptimizer()
+        scorer = IncrementalSEOScorer(keywords, content_format="markdown")
+        
+        assert scorer.update(ORIGINAL) == optimizer.analyze_markdown(ORIGINAL, keywords)
+        
+        edited = ORIGINAL.replace(
+            "공식 사이트에서 설치 파일을 받으세요.",
+            "공식 사이트에서 설치 파일을 받으세요. 설치는 1분이면 끝나요."
+        ) + "\n\n### 참고\n\n파이썬 문서를 읽어보세요."
+        
+        assert scorer.update(edited) == optimizer.analyze_markdown(edited, keywords)
+        # 바뀐 단락 1개 + 새 단락 2개만 다시 분석
+        assert scorer.last_reanalyzed == 3
+    
+    def test_unchanged_content_is_not_reanalyzed(self):
+        """같은 본문을 다시 채점하면 단락 분석을 건너뛰는지 테스트"""
+        scorer = IncrementalSEOScorer(["파이썬"], content_format="markdown")
+        first = scorer.update(ORIGINAL)
+        
+        assert scorer.update(ORIGINAL) == first
+        assert scorer.last_reanalyzed == 0
@@ -0,0 +1,60 @@
+from app.services.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+class TestKeywordMatcher:
+    """다중 키워드 매칭 엔진 테스트"""
+    
+    def test_count_all_keywords_in_one_pass(self):
+        """여러 키워드를 한 번에 카운트하는지 테스트"""
+        matcher = KeywordMatcher(["python", "fastapi", "api"])
+        counts = matcher.count("Python과 FastAPI로 API 서버를 만듭니다. python 최고")
+        
+        assert counts == {"python": 2, "fastapi": 1, "api": 2}
+    
+    def test_overlapping_keywords(self):
+        """겹치는 키워드도 모두 찾는지 테스트"""
+        matcher = KeywordMatcher(["he", "she", "hers"])
+        matches = matcher.find_all("ushers")
+        
+        assert ("she", 1, 4) in matches
+        assert ("he", 2, 4) in matches
+        assert ("hers", 2, 6) in matches
+    
+    def test_korean_boundaries(self):
+        """어절/조사 경계 매칭 테스트"""
+        text = "인공지능은 미래다. 비인공지능 시스템과 인공지능 기술. AI는 mail 서버와 다르다."
+        
+        plain = KeywordMatcher(["인공지능", "AI"]).count(text)
+        bounded = KeywordMatcher(["인공지능", "AI"], korean_boundaries=True).count(text)
+        
+        assert plain == {"인공지능": 3, "AI": 2}
+        assert bounded == {"인공지능": 2, "AI": 1}
+    
+    def test_case_variant_keywords_share_count(self):
+        """대소문자만 다른 키워드가 같은 카운트를 공유하는지 테스트"""
+        counts = KeywordMatcher(["AI", "ai"]).count("AI and ai")
+        
+        assert counts == {"AI": 2, "ai": 2}
+    
+    def test_matcher_is_cached_per_keyword_set(self):
+        """키워드 집합별 오토마톤 캐시 테스트"""
+        first = get_keyword_matcher(["seo", "blog"])
+        second = get_keyword_matcher(["seo", "blog"])
+        
+        assert first is second
+        assert get_keyword_matcher(["seo", "blog"], korean_boundaries=True) is not first
+    
+    def test_optimizer_keeps_substring_counts_by_default(self):
+        """경계 매칭은 설정으로 켤 때만 키워드 밀도에 반영되는지 테스트"""
+        from app.core.config import settings
+        from app.services.seo_optimizer import SEOOptimizer
+        
+        text = "인공지능은 미래다. 비인공지능 시스템과 인공지능 기술."
+        
+        assert SEOOptimizer()._calculate_keyword_density(text, ["인공지능"])["인공지능"]["count"] == 3
+        
+        settings.seo_korean_keyword_boundaries = True
+        try:
+            assert SEOOptimizer()._calculate_keyword_density(text, ["인공지능"])["인공지능"]["count"] == 2
+        finally:
+            settings.seo_korean_keyword_boundaries = False
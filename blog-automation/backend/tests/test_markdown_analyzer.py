@@ -0,0 +1,83 @@
+from app.services.markdown_analyzer import tokenize, blocks_to_text, looks_like_markdown
+from app.services.seo_optimizer import SEOOptimizer
+
+MARKDOWN = """# 파이썬 가이드
+
+파이썬은 **쉬운** 언어입니다. [공식 문서](https://python.org)를 참고하세요!
+
+## 설치 방법
+
+![](https://example.com/install.png)
+
+- 다운로드하기
+- 설치하기
+
+## 활용 사례
+
+1. 웹 개발
+2. 데이터 분석
+
+### 마무리
+
+파이썬으로 시작해보세요."""
+
+HTML = """<h1>파이썬 가이드</h1>
+<p>파이썬은 <strong>쉬운</strong> 언어입니다. <a href="https://python.org">공식 문서</a>를 참고하세요!</p>
+<h2>설치 방법</h2>
+<p><img src="https://example.com/install.png"></p>
+<ul>
+<li>다운로드하기</li>
+<li>설치하기</li>
+</ul>
+<h2>활용 사례</h2>
+<ol>
+<li>웹 개발</li>
+<li>데이터 분석</li>
+</ol>
+<h3>마무리</h3>
+<p>파이썬으로 시작해보세요.</p>"""
+
+
+class TestMarkdownAnalyzer:
+    """마크다운 SEO 분석 테스트"""
+    
+    def test_tokenize_blocks(self):
+        """헤딩, 단락, 이미지, 리스트 토큰화 테스트"""
+        blocks = tokenize(MARKDOWN)
+        kinds = [block.kind for block in blocks]
+        
+        assert kinds.count("heading") == 4
+        assert kinds.count("list_item") == 4
+        assert kinds.count("image") == 1
+        assert blocks[0].level == 1
+        assert blocks[0].text == "파이썬 가이드"
+        assert "https://python.org" not in blocks_to_text(blocks)
+        assert "공식 문서를 참고하세요" in blocks_to_text(blocks)
+    
+    def test_detect_format(self):
+        """마크다운/HTML 판별 테스트"""
+        assert looks_like_markdown(MARKDOWN)
+        assert not looks_like_markdown(HTML)
+    
+    def test_markdown_metrics_match_html(self):
+        """마크다운 경로와 HTML 경로의 지표가 같은지 테스트"""
+        optimizer = SEOOptimizer()
+        keywords = ["파이썬", "설치"]
+        
+        markdown_result = optimizer.analyze_content(MARKDOWN, keywords, content_format="markdown")
+        html_result = optimizer.analyze_content(HTML, keywords, content_format="html")
+        
+        assert markdown_result == html_result
+        assert markdown_result["heading_analysis"]["h2_count"] == 2
+    
+    async def test_optimize_markdown_adds_alt_text(self):
+        """alt 텍스트 없는 마크다운 이미지 보정 테스트"""
+        result = await SEOOptimizer().optimize_content(MARKDOWN, ["파이썬"], content_format="markdown")
+        
+        assert "![파이썬 관련 이미지](https://example.com/install.png)" in result["optimized_content"]
+
+    def test_alt_text_keyword_with_backslash(self):
+        """역슬래시가 든 키워드도 alt 텍스트에 그대로 들어가는지 테스트"""
+        result = SEOOptimizer().optimize_content_sync(MARKDOWN, ["C\\d 언어"], content_format="markdown")
+
+        assert "![C\\d 언어 관련 이미지](https://example.com/install.png)" in result["optimized_content"]
@@ -0,0 +1,81 @@
+from app.core.config import settings
+from app.services.publishers.naver_editor import SEGMENT_PASTE, SEGMENT_TYPE, build_segments
+from app.services.publishers.naver_publisher import NaverPublisher
+
+
+class FakeKeyboard:
+    def __init__(self, page):
+        self.page = page
+
+    async def type(self, text):
+        self.page.operations.append(("type", text))
+
+    async def press(self, key):
+        self.page.operations.append(("press", key))
+
+
+class FakeEditor:
+    async def click(self):
+        pass
+
+
+class FakePage:
+    """붙여넣기 반영 여부를 정할 수 있는 가짜 Playwright 페이지"""
+
+    def __init__(self, paste_works: bool = True):
+        self.paste_works = paste_works
+        self.operations = []
+        self.keyboard = FakeKeyboard(self)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        if selector == '.se-content':
+            return FakeEditor()
+        raise TimeoutError(selector)
+
+    async def evaluate(self, script, arg=None):
+        self.operations.append(("paste", arg[0]))
+        return 0
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        if not self.paste_works:
+            raise TimeoutError("paste not applied")
+
+
+class TestNaverEditorInput:
+    """네이버 에디터 본문 입력 테스트"""
+
+    def test_build_segments_groups_blocks(self):
+        """연속된 블록은 붙여넣기 하나로 묶고, 지원하지 않는 요소는 타이핑으로 나누는지 테스트"""
+        content = (
+            '<h2 class="x">제목</h2><p style="color:red">본문 <span>강조</span> <a href="https://a.test" onclick="x()">링크</a></p>'
+            '<table><tr><td>표</td></tr></table>'
+            '<ul><li>하나</li><li>둘</li></ul><script>alert(1)</script>'
+        )
+
+        segments = build_segments(content)
+
+        assert [kind for kind, _ in segments] == [SEGMENT_PASTE, SEGMENT_TYPE, SEGMENT_PASTE]
+        assert segments[0][1] == '<h2>제목</h2><p>본문 강조 <a href="https://a.test">링크</a></p>'
+        assert segments[1][1][0].name == 'table'
+        assert segments[2][1] == '<ul><li>하나</li><li>둘</li></ul>'
+
+    async def test_paste_mode_uses_few_operations(self):
+        """붙여넣기 모드는 블록 묶음마다 한 번만 입력하는지 테스트"""
+        settings.naver_editor_input_mode = "paste"
+        content = ''.join(f"<p>단락 {i} 내용입니다.</p>" for i in range(50)) + "<h2>끝</h2>"
+
+        page = FakePage()
+        await NaverPublisher({"username": "tester"})._input_content_to_editor(page, content)
+
+        assert [operation[0] for operation in page.operations] == ["paste"]
+
+    async def test_falls_back_to_typing_when_paste_ignored(self):
+        """에디터가 붙여넣기를 반영하지 않으면 해당 블록을 타이핑하는지 테스트"""
+        settings.naver_editor_input_mode = "paste"
+
+        page = FakePage(paste_works=False)
+        await NaverPublisher({"username": "tester"})._input_content_to_editor(page, "<p>첫 단락</p><ol><li>항목</li></ol>")
+
+        assert page.operations[1:] == [
+            ("type", "첫 단락"), ("press", "Enter"), ("type", "1. 항목"), ("press", "Enter")
+        ]
@@ -0,0 +1,100 @@
+import asyncio
+
+from app.core.config import settings
+from app.services.browser_pool import browser_pools
+from app.services.publishers.naver_http import NaverHttpTransport
+from app.services.publishers.naver_publisher import NaverPublisher
+from tests.fake_naver import VALID_COOKIES, FakeNaverBlog
+
+ACCOUNT_KEY = "naver:tester"
+
+
+class StateContext:
+    """storage_state()만 있는 컨텍스트 (브라우저 로그인 결과 흉내)"""
+
+    def __init__(self, cookies):
+        self.cookies = cookies
+
+    async def storage_state(self):
+        return {
+            "cookies": [{"name": name, "value": value, "domain": ".naver.com"} for name, value in self.cookies.items()],
+            "origins": []
+        }
+
+
+class TestNaverHttpTransport:
+    """브라우저 없는 네이버 글쓰기 테스트 (가짜 네이버 블로그)"""
+
+    async def test_publish_with_stored_cookies(self, serve, browser_pool):
+        """저장된 로그인 쿠키로 글을 쓰고 문서 모델/태그/공개 설정을 보내는지 테스트"""
+        naver = FakeNaverBlog()
+        server = await serve(naver.app)
+        await browser_pool.save_state(ACCOUNT_KEY, StateContext(VALID_COOKIES))
+
+        async def login():
+            raise AssertionError("로그인하면 안 됩니다")
+
+        transport = NaverHttpTransport("tester", ACCOUNT_KEY, browser_pool, login, base_url=str(server.make_url("")))
+        result = await transport.publish(
+            "제목", "<h2>소제목</h2><p>본문</p><ul><li>항목</li></ul>", ["AI", "자동화"], "private"
+        )
+
+        post = naver.posts[result["post_id"]]
+        components = post["documentModel"]["document"]["components"]
+        assert result["url"] == f"https://blog.naver.com/tester/{result['post_id']}"
+        assert [component["@ctype"] for component in components] == ["documentTitle", "sectionTitle", "text"]
+        assert len(components[2]["value"]) == 2
+        assert post["populationParams"] == {"configuration": {"openType": 0}, "tags": "AI,자동화"}
+
+    async def test_expired_cookies_trigger_single_login(self, serve, browser_pool):
+        """쿠키가 만료되면 한 번 로그인해 새 쿠키로 다시 요청하는지 테스트"""
+        naver = FakeNaverBlog()
+        server = await serve(naver.app)
+        await browser_pool.save_state(ACCOUNT_KEY, StateContext({"NID_AUT": "expired", "NID_SES": "expired"}))
+        logins = []
+
+        async def login():
+            logins.append(1)
+            await browser_pool.save_state(ACCOUNT_KEY, StateContext(VALID_COOKIES))
+            return True
+
+        transport = NaverHttpTransport("tester", ACCOUNT_KEY, browser_pool, login, base_url=str(server.make_url("")))
+        result = await transport.publish("제목", "<p>본문</p>")
+        deleted = await transport.delete(result["post_id"])
+
+        assert len(logins) == 1
+        assert deleted == {"success": True}
+        assert naver.posts == {}
+        assert len(naver.requests) == 3
+
+    async def test_publisher_falls_back_to_browser(self, serve, browser_pool, monkeypatch):
+        """HTTP 요청이 거부되면 브라우저 경로로 대체하는지 테스트"""
+        naver = FakeNaverBlog(reject=True)
+        server = await serve(naver.app)
+        await browser_pool.save_state(ACCOUNT_KEY, StateContext(VALID_COOKIES))
+        monkeypatch.setitem(browser_pools, asyncio.get_running_loop(), browser_pool)
+        monkeypatch.setattr(settings, "naver_blog_base_url", str(server.make_url("")))
+
+        publisher = NaverPublisher({"username": "tester", "password": "pw", "transport": "http"})
+        result = await publisher.publish("제목", "<p>본문</p>")
+
+        # 가짜 Playwright 페이지는 브라우저 조작을 지원하지 않으므로 실패로 끝나지만 브라우저는 사용됨
+        assert result["success"] is False
+        assert len(naver.requests) == 1
+        assert browser_pool.get_stats()["sessions"] == 1
+
+    async def test_no_browser_retry_after_write_may_have_happened(self, serve, browser_pool, monkeypatch):
+        """요청이 전달된 뒤 실패하면 중복 글을 막기 위해 브라우저로 다시 발행하지 않는지 테스트"""
+        naver = FakeNaverBlog(fail_after_write=True)
+        server = await serve(naver.app)
+        await browser_pool.save_state(ACCOUNT_KEY, StateContext(VALID_COOKIES))
+        monkeypatch.setitem(browser_pools, asyncio.get_running_loop(), browser_pool)
+        monkeypatch.setattr(settings, "naver_blog_base_url", str(server.make_url("")))
+
+        publisher = NaverPublisher({"username": "tester", "password": "pw", "transport": "http"})
+        result = await publisher.publish("제목", "<p>본문</p>")
+
+        assert result["success"] is False
+        assert "HTTP 500" in result["error"]
+        assert len(naver.posts) == 1
+        assert browser_pool.get_stats()["sessions"] == 0
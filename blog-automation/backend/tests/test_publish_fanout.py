@@ -0,0 +1,90 @@
+import asyncio
+from collections import defaultdict
+
+from app.models.blog_account import BlogPlatform
+from app.services.publish_fanout import fan_out_publish
+from app.services.publishers.naver_editor import document_model_json
+
+
+class FakePublisherFactory:
+    """플랫폼별 동시 실행 수와 받은 발행 인자를 기록하는 가짜 Publisher 팩토리"""
+
+    def __init__(self, fail_users=()):
+        self.fail_users = set(fail_users)
+        self.active = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.calls = []
+
+    def __call__(self, platform, credentials):
+        factory = self
+
+        class Publisher:
+            async def publish(self, **payload):
+                factory.calls.append(payload)
+                factory.active[platform] += 1
+                factory.peak[platform] = max(factory.peak[platform], factory.active[platform])
+                try:
+                    await asyncio.sleep(0.02)
+                    if credentials["username"] in factory.fail_users:
+                        raise RuntimeError("login failed")
+                    return {"success": True, "post_id": credentials["username"], "url": "https://blog.test/1"}
+                finally:
+                    factory.active[platform] -= 1
+
+        return Publisher()
+
+
+def make_targets(platform, count, prefix):
+    return [
+        {"publication_id": f"{prefix}-{i}", "platform": platform, "credentials": {"username": f"{prefix}{i}"}}
+        for i in range(count)
+    ]
+
+
+class TestFanOutPublish:
+    """여러 계정 동시 발행 테스트"""
+
+    async def test_platform_concurrency_caps(self):
+        """플랫폼별 동시 발행 수 상한을 지키면서 플랫폼끼리는 함께 진행하는지 테스트"""
+        factory = FakePublisherFactory()
+        targets = make_targets(BlogPlatform.NAVER, 3, "naver") + make_targets(BlogPlatform.WORDPRESS, 6, "wp")
+        payload = {"title": "제목", "content": "<p>본문</p>"}
+
+        results = await fan_out_publish(
+            targets,
+            payload,
+            concurrency={BlogPlatform.NAVER: 1, BlogPlatform.WORDPRESS: 3},
+            publisher_factory=factory
+        )
+
+        assert all(result["success"] for result in results)
+        assert factory.peak[BlogPlatform.NAVER] == 1
+        assert factory.peak[BlogPlatform.WORDPRESS] == 3
+        assert all(call == payload for call in factory.calls)
+
+    async def test_failure_is_isolated_and_reported_per_target(self):
+        """한 계정이 실패해도 나머지는 발행되고, 끝나는 대로 항목별 결과가 반영되는지 테스트"""
+        factory = FakePublisherFactory(fail_users={"wp1"})
+        targets = make_targets(BlogPlatform.WORDPRESS, 3, "wp")
+        recorded = {}
+
+        async def on_result(target, result):
+            recorded[target["publication_id"]] = result["success"]
+            if target["publication_id"] == "wp2":
+                raise RuntimeError("DB unavailable")
+
+        results = await fan_out_publish(targets, {"title": "제목"}, on_result=on_result, publisher_factory=factory)
+
+        assert [result["success"] for result in results] == [True, False, True]
+        assert results[1]["error"] == "login failed"
+        assert recorded == {"wp-0": True, "wp-1": False, "wp-2": True}
+
+    def test_naver_document_model_rendered_once(self):
+        """같은 글을 여러 네이버 계정에 보낼 때 문서 모델을 한 번만 만드는지 테스트"""
+        document_model_json.cache_clear()
+
+        first = document_model_json("제목", "<p>본문</p>")
+        second = document_model_json("제목", "<p>본문</p>")
+
+        assert first is second
+        assert document_model_json.cache_info().hits == 1
@@ -0,0 +1,36 @@
+from app.services.query_translator import QueryTranslator, get_query_translator, translate_query
+
+
+class TestQueryTranslator:
+    """이미지 검색어 변환기 테스트"""
+
+    def test_translates_every_term_in_one_pass(self):
+        """매칭된 용어를 모두 바꾸고 붙은 조사는 제거하는지 테스트"""
+        assert translate_query("인공지능의 미래") == "artificial intelligence future"
+        assert translate_query("부동산 투자 전략") == "real estate investment strategy"
+
+    def test_longest_term_wins(self):
+        """긴 용어가 짧은 용어보다 먼저 매칭되는지 테스트"""
+        translator = QueryTranslator({"데이터": "data", "빅데이터": "big data"})
+
+        assert translator.translate("빅데이터 활용") == "big data"
+
+    def test_respects_word_boundaries(self):
+        """어절 안에 포함된 용어는 바꾸지 않는지 테스트"""
+        assert translate_query("MAIL server") == "MAIL server"
+        assert translate_query("AI 기술 2024") == "artificial intelligence technology 2024"
+
+    def test_untranslated_query_is_unchanged(self):
+        """사전에 없는 검색어는 그대로 반환하는지 테스트"""
+        assert translate_query("Python tips") == "Python tips"
+        assert translate_query("알수없는단어") == "알수없는단어"
+
+    def test_results_are_memoized(self):
+        """같은 검색어는 다시 계산하지 않는지 테스트"""
+        translator = get_query_translator()
+        translate_query("클라우드 보안")
+        hits = translator.translate.cache_info().hits
+
+        translate_query("클라우드 보안")
+
+        assert translator.translate.cache_info().hits == hits + 1
@@ -0,0 +1,108 @@
+from app.services import seo_batch
+from app.services.seo_batch import run_batch_scoring, write_changed_scores
+from app.services.seo_optimizer import SEOOptimizer
+
+
+class FakeQuery:
+    def __init__(self, client, operation=None, values=None):
+        self.client = client
+        self.operation = operation
+        self.values = values
+        self.bounds = None
+        self.ids = None
+
+    def select(self, columns):
+        self.operation = "select"
+        return self
+
+    def order(self, column):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def update(self, values):
+        return FakeQuery(self.client, "update", values)
+
+    def in_(self, column, ids):
+        self.ids = list(ids)
+        return self
+
+    def execute(self):
+        if self.operation == "update":
+            self.client.updates.append((self.values, self.ids))
+            return type("Result", (), {"data": []})()
+        start, end = self.bounds
+        return type("Result", (), {"data": self.client.rows[start:end + 1]})()
+
+
+class FakeSupabase:
+    """blog_posts 테이블만 흉내 내는 가짜 Supabase 클라이언트"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.updates = []
+
+    def table(self, name):
+        assert name == 'blog_posts'
+        return FakeQuery(self)
+
+
+def make_post(post_id, content, seo_score=None, readability_score=None):
+    return {
+        "id": post_id,
+        "title": "인공지능",
+        "content": content,
+        "tags": ["인공지능"],
+        "seo_score": seo_score,
+        "readability_score": readability_score,
+    }
+
+
+class TestSEOBatch:
+    """배치 SEO 점수 계산 테스트"""
+
+    def test_write_changed_scores_groups_by_score_pair(self):
+        """같은 점수 조합은 UPDATE ... IN 한 번으로 묶는지 테스트"""
+        client = FakeSupabase([])
+
+        batches = write_changed_scores(client, [(1, 80, 70), (2, 60, 50), (3, 80, 70)])
+
+        assert batches == 2
+        assert sorted(client.updates, key=lambda update: update[1]) == [
+            ({"seo_score": 80, "readability_score": 70}, [1, 3]),
+            ({"seo_score": 60, "readability_score": 50}, [2]),
+        ]
+
+    def test_only_changed_scores_are_written(self):
+        """점수가 그대로인 포스트는 저장하지 않는지 테스트 (현재 프로세스 실행)"""
+        content = "<h2>인공지능</h2><p>인공지능 기술은 빠르게 발전하고 있습니다.</p>"
+        current = SEOOptimizer().analyze_content(content, ["인공지능"])
+        rows = [
+            make_post(1, content, current["seo_score"], current["readability_score"]),
+            make_post(2, content),
+            make_post(3, content, current["seo_score"], current["readability_score"]),
+        ]
+        client = FakeSupabase(rows)
+
+        stats = run_batch_scoring(client, page_size=2, workers=1)
+
+        assert (stats["scanned"], stats["changed"], stats["update_batches"]) == (3, 1, 1)
+        assert client.updates == [
+            ({"seo_score": current["seo_score"], "readability_score": current["readability_score"]}, [2])
+        ]
+
+    def test_daemon_process_scores_without_pool(self, monkeypatch):
+        """데몬 프로세스(Celery prefork 워커)에서는 프로세스 풀 없이 채점하는지 테스트"""
+        monkeypatch.setattr(seo_batch, "_in_daemon_process", lambda: True)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("daemonic processes are not allowed to have children")
+
+        monkeypatch.setattr(seo_batch, "ProcessPoolExecutor", no_pool)
+
+        stats = run_batch_scoring(FakeSupabase([make_post(1, "<p>본문</p>")]), workers=4, dry_run=True)
+
+        assert stats["workers"] == 1
+        assert stats["scanned"] == 1
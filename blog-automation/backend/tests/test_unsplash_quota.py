@@ -0,0 +1,47 @@
+from app.services.unsplash_quota import (
+    PRIORITY_EXTRA, PRIORITY_FEATURED, UnsplashQuotaLedger
+)
+
+
+class TestUnsplashQuotaLedger:
+    """Unsplash 호출 한도 장부 테스트 (로컬 장부)"""
+
+    async def test_unknown_quota_allows_calls(self):
+        """헤더를 받기 전에는 모든 검색을 허용하는지 테스트"""
+        ledger = UnsplashQuotaLedger(reserve=5)
+
+        assert await ledger.acquire(PRIORITY_EXTRA)
+        assert await ledger.remaining() is None
+
+    async def test_extra_denied_within_reserve(self):
+        """남은 호출이 예약분 이하이면 대표 이미지 검색만 허용하는지 테스트"""
+        ledger = UnsplashQuotaLedger(reserve=5)
+        await ledger.record({"X-Ratelimit-Remaining": "5", "X-Ratelimit-Limit": "50"})
+
+        assert not await ledger.acquire(PRIORITY_EXTRA)
+        assert await ledger.acquire(PRIORITY_FEATURED)
+        assert await ledger.remaining() == 4
+
+    async def test_acquire_reserves_before_response(self):
+        """응답 전에 예약한 호출이 장부에서 차감되는지 테스트"""
+        ledger = UnsplashQuotaLedger(reserve=0)
+        await ledger.record({"X-Ratelimit-Remaining": "2"})
+
+        assert await ledger.acquire(PRIORITY_EXTRA)
+        assert await ledger.acquire(PRIORITY_EXTRA)
+        assert not await ledger.acquire(PRIORITY_FEATURED)
+
+    async def test_rate_limited_response_blocks_calls(self):
+        """429 응답 후에는 모든 검색을 거절하는지 테스트"""
+        ledger = UnsplashQuotaLedger(reserve=5)
+        await ledger.record({}, status=429)
+
+        assert not await ledger.acquire(PRIORITY_FEATURED)
+        assert ledger.get_stats()["rate_limited"] == 1
+
+    async def test_window_expiry_resets_ledger(self):
+        """한도 초기화 주기가 지나면 장부를 비우는지 테스트"""
+        ledger = UnsplashQuotaLedger(reserve=5, window_seconds=0)
+        await ledger.record({"X-Ratelimit-Remaining": "0"})
+
+        assert await ledger.acquire(PRIORITY_EXTRA)
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from app.services.image_providers import CircuitBreaker, ImageProvider, ImageProviderChain
+from app.services.unsplash_service import UnsplashImageService
+
+
+class SlowProvider(ImageProvider):
+    name = "slow"
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.queries = []
+
+    async def search(self, query, count, orientation="landscape", priority="extra"):
+        self.queries.append(query)
+        await asyncio.sleep(self.delay)
+        return [{"id": f"{query}_{i}"} for i in range(count)]
+
+
+def make_service(provider):
+    service = UnsplashImageService.__new__(UnsplashImageService)
+    service.providers = ImageProviderChain([provider], breakers={provider.name: CircuitBreaker(provider.name)})
+    return service
+
+
+class TestImagePrefetch:
+    """콘텐츠 생성과 동시에 시작하는 이미지 미리 검색 테스트"""
+
+    async def test_prefetch_overlaps_generation(self):
+        """키워드 검색이 콘텐츠 생성 시간 동안 끝나 있는지 테스트"""
+        provider = SlowProvider(delay=0.1)
+        service = make_service(provider)
+
+        started = time.perf_counter()
+        prefetch = service.prefetch_keyword_images(["cloud", "security"])
+        await asyncio.sleep(0.15)  # 콘텐츠 생성 대기
+        title_images, (featured, keyword_images) = await asyncio.gather(
+            service.get_title_images("Cloud security guide"),
+            prefetch
+        )
+        elapsed = time.perf_counter() - started
+
+        assert featured["id"] == "cloud_0"
+        assert len(keyword_images) == 4
+        assert [img["id"] for img in title_images] == ["Cloud security guide_0", "Cloud security guide_1"]
+        # 이미지 단계 전체가 아니라 제목 검색 한 번만 생성 시간 뒤에 더해짐
+        assert elapsed < 0.15 + 0.1 + 0.08
+
+    async def test_content_images_shape(self):
+        """기존 get_content_images 결과 형식이 유지되는지 테스트"""
+        service = make_service(SlowProvider(delay=0))
+
+        result = await service.get_content_images(["cloud"], "")
+
+        assert result == {"title_based": [], "keyword_based": [{"id": "cloud_0"}, {"id": "cloud_1"}]}
@@ -0,0 +1,49 @@
+import pytest
+
+
+class TestWordPressBatchPublish:
+    """WordPress /batch/v1 묶음 발행 테스트 (가짜 WordPress 서버)"""
+
+    async def test_creates_are_grouped_into_batches(self, wordpress, wordpress_publisher):
+        """30개 포스트를 25개 단위 배치 2번으로 보내고 태그는 이름당 한 번만 만드는지 테스트"""
+        operations = [
+            {"ref": f"pub-{i}", "title": f"제목 {i}", "content": f"본문 {i}", "keywords": ["AI", f"주제{i % 3}"]}
+            for i in range(30)
+        ]
+
+        results = await wordpress_publisher.publish_batch(operations)
+
+        assert [result["ref"] for result in results] == [op["ref"] for op in operations]
+        assert all(result["success"] for result in results)
+        assert wordpress.count("POST", "/batch/v1") == 2
+        assert wordpress.count("POST", "/wp/v2/posts") == 0
+        assert wordpress.count("POST", "/tags") == 4
+        assert wordpress.posts[int(results[0]["post_id"])]["title"] == "제목 0"
+        assert len(wordpress.posts[int(results[4]["post_id"])]["tags"]) == 2
+
+    async def test_per_item_results(self, wordpress, wordpress_publisher):
+        """생성/수정/삭제가 섞인 배치에서 항목별 성공/실패가 각 ref에 대응되는지 테스트"""
+        created = await wordpress_publisher.publish(title="기존 글", content="본문")
+        results = await wordpress_publisher.publish_batch([
+            {"ref": "new", "title": "새 글", "content": "본문"},
+            {"ref": "untitled", "title": "", "content": "본문"},
+            {"ref": "edit", "action": "update", "post_id": created["post_id"], "title": "고친 글"},
+            {"ref": "missing", "action": "delete", "post_id": "9999"},
+        ])
+
+        by_ref = {result["ref"]: result for result in results}
+        assert by_ref["new"]["success"] is True
+        assert by_ref["untitled"]["success"] is False
+        assert by_ref["edit"]["post_id"] == created["post_id"]
+        assert wordpress.posts[int(created["post_id"])]["title"] == "고친 글"
+        assert by_ref["missing"]["error"].startswith("HTTP 404")
+
+    @pytest.mark.parametrize("wordpress", [{"batch": False}], indirect=True)
+    async def test_falls_back_without_batch_api(self, wordpress, wordpress_publisher):
+        """배치 API가 없는 사이트는 항목별 요청으로 보내는지 테스트"""
+        results = await wordpress_publisher.publish_batch([
+            {"ref": i, "title": f"제목 {i}", "content": "본문"} for i in range(3)
+        ])
+
+        assert all(result["success"] for result in results)
+        assert wordpress.count("POST", "/wp/v2/posts") == 3
@@ -0,0 +1,106 @@
+import time
+
+import aiohttp
+
+from app.services.publishers.wordpress_media import (
+    WordPressMediaUploader,
+    find_content_images,
+    rewrite_image_urls,
+)
+
+AUTH = aiohttp.BasicAuth("admin", "secret")
+
+
+class TestContentImages:
+    """본문 이미지 URL 추출/교체 테스트"""
+
+    def test_find_content_images(self):
+        """마크다운/HTML 이미지를 순서대로 중복 없이 찾는지 테스트"""
+        content = (
+            "![첫 사진](https://a.test/1.jpg)\n\n"
+            '<img src="https://a.test/2.jpg?w=800&amp;q=80" alt="두 번째">\n\n'
+            "![다시](https://a.test/1.jpg)"
+        )
+
+        images = find_content_images(content)
+
+        assert [image["url"] for image in images] == ["https://a.test/1.jpg", "https://a.test/2.jpg?w=800&q=80"]
+        assert images[1]["alt_text"] == "두 번째"
+
+    def test_rewrite_image_urls(self):
+        """접두어가 같은 URL과 HTML 이스케이프된 URL도 정확히 바꾸는지 테스트"""
+        content = '![a](https://a.test/1.jpg?w=1) ![b](https://a.test/1.jpg) <img src="https://a.test/2.jpg?w=1&amp;q=2">'
+
+        rewritten = rewrite_image_urls(content, {
+            "https://a.test/1.jpg": "https://wp.test/1.jpg",
+            "https://a.test/1.jpg?w=1": "https://wp.test/1-small.jpg",
+            "https://a.test/2.jpg?w=1&q=2": "https://wp.test/2.jpg",
+        })
+
+        assert rewritten == '![a](https://wp.test/1-small.jpg) ![b](https://wp.test/1.jpg) <img src="https://wp.test/2.jpg">'
+
+
+class TestWordPressMediaUpload:
+    """WordPress 미디어 업로드 테스트 (가짜 WordPress 서버)"""
+
+    async def test_publish_uploads_images_and_sets_featured(self, wordpress, fake_wordpress_server, wordpress_publisher):
+        """이미지를 올려 본문 URL을 바꾸고 대표 이미지를 지정하며, 같은 사진은 한 번만 올리는지 테스트"""
+        site_url = fake_wordpress_server
+        wordpress.photos = {"cover": b"cover-bytes", "one": b"one-bytes", "copy": b"one-bytes"}
+        content = f"본문\n\n![첫 사진]({site_url}/photos/one)\n\n문단\n\n![같은 사진]({site_url}/photos/copy)"
+
+        result = await wordpress_publisher.publish(
+            "제목", content, keywords=["AI"],
+            featured_image={"url": f"{site_url}/photos/cover", "alt_text": "대표",
+                            "attribution": {"photographer": "Kim", "source": "Unsplash"}}
+        )
+
+        assert result["success"] is True
+        post = wordpress.posts[int(result["post_id"])]
+        assert wordpress.count("POST", "/media") == 2
+        assert wordpress.media[post["featured_media"]]["caption"] == "사진: Kim (Unsplash)"
+        assert "/photos/" not in post["content"]
+        assert post["content"].count("/wp-content/uploads/") == 2
+
+    async def test_reuses_uploaded_media_across_publishes(self, wordpress, fake_wordpress_server, tmp_path):
+        """이미 올린 사진은 재시작 후에도 다시 올리지 않는지 테스트"""
+        wordpress.photos = {"one": b"one-bytes"}
+        api_url = f"{fake_wordpress_server}/wp-json/wp/v2"
+        images = [{"url": f"{fake_wordpress_server}/photos/one"}]
+
+        first = await WordPressMediaUploader(disk_dir=str(tmp_path)).upload_images(api_url, AUTH, images)
+        second = await WordPressMediaUploader(disk_dir=str(tmp_path)).upload_images(api_url, AUTH, images)
+
+        assert first == second
+        assert wordpress.count("POST", "/media") == 1
+
+    async def test_stale_media_revalidated_with_include(self, wordpress, fake_wordpress_server, tmp_path):
+        """TTL이 지난 항목은 include 조회로 확인하고, 삭제된 미디어는 다시 올리는지 테스트"""
+        wordpress.photos = {"one": b"one-bytes", "two": b"two-bytes"}
+        uploader = WordPressMediaUploader(ttl_seconds=0, disk_dir=str(tmp_path))
+        api_url = f"{fake_wordpress_server}/wp-json/wp/v2"
+        images = [{"url": f"{fake_wordpress_server}/photos/one"}, {"url": f"{fake_wordpress_server}/photos/two"}]
+
+        first = await uploader.upload_images(api_url, AUTH, images)
+        del wordpress.media[first[images[1]["url"]]["id"]]
+        second = await uploader.upload_images(api_url, AUTH, images)
+
+        assert second[images[0]["url"]] == first[images[0]["url"]]
+        assert second[images[1]["url"]] != first[images[1]["url"]]
+        assert wordpress.count("GET", "/media") == 1
+        assert wordpress.count("POST", "/media") == 3
+
+    async def test_uploads_run_concurrently(self, wordpress, fake_wordpress_server, tmp_path):
+        """여러 이미지 업로드가 동시에 진행되는지 테스트"""
+        wordpress.delay = 0.2
+        wordpress.photos = {f"p{i}": f"bytes-{i}".encode() for i in range(4)}
+        uploader = WordPressMediaUploader(disk_dir=str(tmp_path), concurrency=4)
+        api_url = f"{fake_wordpress_server}/wp-json/wp/v2"
+        images = [{"url": f"{fake_wordpress_server}/photos/p{i}"} for i in range(4)]
+
+        started = time.perf_counter()
+        media = await uploader.upload_images(api_url, AUTH, images)
+        elapsed = time.perf_counter() - started
+
+        assert len(media) == 4
+        assert elapsed < 0.6
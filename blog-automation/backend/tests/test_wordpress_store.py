@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+from app.services.publishers.wordpress_store import WordPressSiteStore
+
+
+class TestWordPressSiteStore:
+    """WordPress 사이트별 저장소 디스크 백엔드 테스트"""
+
+    async def test_disk_io_runs_off_loop_and_keeps_latest(self, tmp_path, monkeypatch):
+        """파일 입출력을 루프 밖에서 하고, 동시에 저장해도 마지막 내용이 남는지 테스트"""
+        store = WordPressSiteStore("wp_terms", disk_dir=str(tmp_path))
+        threads = []
+        write_file = store._write_file
+
+        def recording_write(*args):
+            threads.append(threading.get_ident())
+            return write_file(*args)
+
+        monkeypatch.setattr(store, "_write_file", recording_write)
+
+        await asyncio.gather(*[
+            store.store("site:tags", {f"태그{i}": {"id": i}}) for i in range(10)
+        ])
+        await store.forget("site:tags", ["태그0"])
+
+        assert threading.get_ident() not in threads
+        assert list(tmp_path.glob("*.tmp")) == []
+
+        restarted = WordPressSiteStore("wp_terms", disk_dir=str(tmp_path))
+        entries = await restarted.load("site:tags")
+        assert sorted(entries) == [f"태그{i}" for i in range(1, 10)]
+        assert store.errors == 0
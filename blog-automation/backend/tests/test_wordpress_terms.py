@@ -0,0 +1,69 @@
+import time
+
+import aiohttp
+
+from app.services.publishers.wordpress_terms import WordPressTermCache, normalize_term
+
+AUTH = aiohttp.BasicAuth("admin", "secret")
+
+
+class TestWordPressTermCache:
+    """WordPress 태그/카테고리 캐시 테스트 (가짜 WordPress 서버)"""
+
+    def test_normalize_term(self):
+        """대소문자, 공백, HTML 엔티티 차이를 무시하는지 테스트"""
+        assert normalize_term("  R&amp;D   Tips ") == normalize_term("r&d tips")
+
+    async def test_resolves_existing_and_creates_missing(self, wordpress, fake_wordpress_server, tmp_path):
+        """기존 태그는 정확히 같은 이름만 쓰고 없는 태그는 만드는지 테스트"""
+        ai_id = wordpress.add_term("tags", "AI")
+        wordpress.add_term("tags", "AI 윤리")
+        cache = WordPressTermCache(disk_dir=str(tmp_path))
+        api_url = f"{fake_wordpress_server}/wp-json/wp/v2"
+
+        tag_ids = await cache.resolve(api_url, "tags", ["AI", "클라우드", "ai", "보안"], AUTH)
+
+        assert tag_ids[0] == ai_id
+        assert len(tag_ids) == 3
+        assert wordpress.count("POST", "/tags") == 2
+
+    async def test_cached_terms_skip_requests(self, wordpress, fake_wordpress_server, tmp_path):
+        """캐시된 태그는 요청 없이 ID를 반환하고 재시작 후에도 유지되는지 테스트"""
+        api_url = f"{fake_wordpress_server}/wp-json/wp/v2"
+
+        first = await WordPressTermCache(disk_dir=str(tmp_path)).resolve(api_url, "tags", ["파이썬", "자동화"], AUTH)
+        request_count = len(wordpress.requests)
+
+        second = await WordPressTermCache(disk_dir=str(tmp_path)).resolve(api_url, "tags", ["자동화", "파이썬"], AUTH)
+
+        assert second == list(reversed(first))
+        assert len(wordpress.requests) == request_count
+
+    async def test_stale_terms_revalidated_with_include(self, wordpress, fake_wordpress_server, tmp_path):
+        """TTL이 지난 ID는 include 조회 한 번으로 확인하고, 삭제된 태그는 다시 만드는지 테스트"""
+        cache = WordPressTermCache(ttl_seconds=0, disk_dir=str(tmp_path))
+        api_url = f"{fake_wordpress_server}/wp-json/wp/v2"
+
+        kept_id, deleted_id = await cache.resolve(api_url, "tags", ["유지", "삭제"], AUTH)
+        wordpress.terms["tags"] = [term for term in wordpress.terms["tags"] if term["id"] != deleted_id]
+        wordpress.requests.clear()
+
+        tag_ids = await cache.resolve(api_url, "tags", ["유지", "삭제"], AUTH)
+
+        assert tag_ids[0] == kept_id
+        assert tag_ids[1] != deleted_id
+        assert wordpress.count("GET", "/tags") == 2  # include 확인 1회 + 삭제된 태그 검색 1회
+        assert wordpress.count("POST", "/tags") == 1
+
+    async def test_missing_terms_resolved_concurrently(self, wordpress, fake_wordpress_server, tmp_path):
+        """캐시에 없는 태그 10개를 순차가 아니라 동시에 처리하는지 테스트"""
+        wordpress.delay = 0.05
+        cache = WordPressTermCache(disk_dir=str(tmp_path), concurrency=10)
+        api_url = f"{fake_wordpress_server}/wp-json/wp/v2"
+
+        started = time.perf_counter()
+        tag_ids = await cache.resolve(api_url, "tags", [f"태그{i}" for i in range(10)], AUTH)
+        elapsed = time.perf_counter() - started
+
+        assert len(set(tag_ids)) == 10
+        assert elapsed < 0.05 * 10 / 2